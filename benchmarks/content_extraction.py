@@ -0,0 +1,103 @@
+"""
+Benchmark main-content extraction against a saved corpus.
+
+Every ``<name>.html`` in the corpus directory that has a gold text in
+``gold/<name>.txt`` is extracted with ``main_content_text``. The script
+reports token-level precision, recall and F1 against the gold text and
+the throughput in pages per second, parsing included.
+
+    python benchmarks/content_extraction.py
+    python benchmarks/content_extraction.py --parser html.parser --min-f1 0.9
+
+The exit status is 1 when the mean F1 falls below ``--min-f1``.
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+
+from bs4 import BeautifulSoup
+
+from nodetool.nodes.lib.network.html_content import main_content_text
+from nodetool.nodes.lib.network.html_parsing import ParserBackend, tree_builder
+
+DEFAULT_CORPUS = os.path.join(
+    os.path.dirname(__file__), os.pardir, "tests", "data", "html"
+)
+
+
+def token_scores(extracted: str, gold: str) -> tuple[float, float, float]:
+    """
+    Return precision, recall and F1 of the extracted tokens against the gold
+    tokens, compared as multisets of lowercased words.
+    """
+    predicted = Counter(extracted.lower().split())
+    expected = Counter(gold.lower().split())
+    overlap = sum((predicted & expected).values())
+    if not overlap:
+        return 0.0, 0.0, 0.0
+    precision = overlap / sum(predicted.values())
+    recall = overlap / sum(expected.values())
+    return precision, recall, 2 * precision * recall / (precision + recall)
+
+
+def load_corpus(corpus_dir: str) -> list[tuple[str, str, str]]:
+    pages = []
+    for name in sorted(os.listdir(corpus_dir)):
+        stem, ext = os.path.splitext(name)
+        gold_path = os.path.join(corpus_dir, "gold", stem + ".txt")
+        if ext != ".html" or not os.path.exists(gold_path):
+            continue
+        with open(os.path.join(corpus_dir, name), encoding="utf-8") as f:
+            html = f.read()
+        with open(gold_path, encoding="utf-8") as f:
+            gold = f.read()
+        pages.append((stem, html, gold))
+    return pages
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    parser.add_argument(
+        "--parser",
+        default=ParserBackend.AUTO.value,
+        choices=[backend.value for backend in ParserBackend],
+    )
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--min-f1", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    pages = load_corpus(args.corpus)
+    if not pages:
+        print(f"No pages with gold text in {args.corpus}", file=sys.stderr)
+        return 1
+    backend = tree_builder(args.parser)
+
+    print(f"{'page':<24} {'precision':>9} {'recall':>9} {'f1':>9}")
+    f1_scores = []
+    for name, html, gold in pages:
+        text = main_content_text(BeautifulSoup(html, backend))
+        precision, recall, f1 = token_scores(text, gold)
+        f1_scores.append(f1)
+        print(f"{name:<24} {precision:>9.3f} {recall:>9.3f} {f1:>9.3f}")
+    mean_f1 = sum(f1_scores) / len(f1_scores)
+
+    # Parse every time: the document cache would otherwise hide parse cost.
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        for _, html, _ in pages:
+            main_content_text(BeautifulSoup(html, backend))
+    elapsed = time.perf_counter() - start
+    pages_per_second = args.repeat * len(pages) / elapsed
+
+    print(f"\nparser: {backend}")
+    print(f"mean f1: {mean_f1:.3f}")
+    print(f"pages/sec: {pages_per_second:.1f}")
+    return 0 if mean_f1 >= args.min_f1 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
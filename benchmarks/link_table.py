@@ -0,0 +1,83 @@
+"""
+Benchmark the memory held by a LinkTable against plain Python lists.
+
+Synthetic links are added one by one, once to a LinkTable and once to a
+list per column, the layout LinkTable used before it was backed by numpy.
+The script reports the memory retained after building, the peak memory
+during the build and the untraced build time of both.
+
+    python benchmarks/link_table.py
+    python benchmarks/link_table.py --links 1000000
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from nodetool.nodes.lib.network.html_parsing import (
+    LINK_COLUMNS,
+    LinkTable,
+    resolve_link,
+)
+
+BASE_URL = "https://example.com/section/"
+
+
+def links(count: int):
+    for i in range(count):
+        yield f"/articles/{i}/comments?page={i % 7}", f"Article number {i}", ""
+
+
+def build_lists(count: int) -> list[list[str]]:
+    columns: list[list[str]] = [[] for _ in LINK_COLUMNS]
+    for href, text, rel in links(count):
+        url, host, path, link_type = resolve_link(href, BASE_URL)
+        for column, value in zip(
+            columns, (href, text, link_type, url, host, path, rel)
+        ):
+            column.append(value)
+    return columns
+
+
+def build_table(count: int) -> LinkTable:
+    table = LinkTable(BASE_URL)
+    for href, text, rel in links(count):
+        table.append(href, text, rel)
+    return table
+
+
+def measure(build: Callable[[int], Any], count: int) -> tuple[int, int, float]:
+    # Timed without tracing, which slows allocation down several times.
+    resolve_link.cache_clear()
+    start = time.perf_counter()
+    build(count)
+    elapsed = time.perf_counter() - start
+
+    resolve_link.cache_clear()
+    tracemalloc.start()
+    result = build(count)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return retained, peak, elapsed
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--links", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    print(f"{'layout':<12} {'retained MB':>12} {'peak MB':>12} {'seconds':>9}")
+    for name, build in (("lists", build_lists), ("LinkTable", build_table)):
+        retained, peak, elapsed = measure(build, args.links)
+        print(
+            f"{name:<12} {retained / 2**20:>12.1f} {peak / 2**20:>12.1f}"
+            f" {elapsed:>9.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
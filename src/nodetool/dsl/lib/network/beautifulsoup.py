@@ -3,6 +3,8 @@ import typing
 from typing import Any
 import nodetool.metadata.types as types
 from nodetool.dsl.graph import GraphNode
+import nodetool.nodes.lib.network.extraction_cache
+import nodetool.nodes.lib.network.html_parsing
 
 
 class BaseUrl(GraphNode):
@@ -24,6 +26,91 @@ class BaseUrl(GraphNode):
 
 
 
+class BatchExtractContent(GraphNode):
+    """
+    Extract the main content from many HTML documents in one call.
+    scrape, web scraping, content extraction, batch
+
+    Returns one text per document, in input order.
+
+    Use cases:
+    - Clean a crawl shard for indexing
+    - Prepare many articles for summarization
+    """
+
+    html: list[str] | GraphNode | tuple[GraphNode, str] = Field(default=[], description='The raw HTML documents.')
+    parser: nodetool.nodes.lib.network.html_parsing.ParserBackend = Field(default=nodetool.nodes.lib.network.html_parsing.ParserBackend.AUTO, description='HTML parser backend. \'auto\' uses the fastest installed backend (selectolax, then lxml) and falls back to html.parser.')
+    use_process_pool: bool | GraphNode | tuple[GraphNode, str] = Field(default=True, description='Parse the documents in worker processes on several cores. Small batches are always parsed inline.')
+
+    @classmethod
+    def get_node_type(cls): return "lib.network.beautifulsoup.BatchExtractContent"
+
+
+
+class BatchExtractLinks(GraphNode):
+    """
+    Extract links from many HTML documents in one call.
+    extract, links, urls, batch, crawl
+
+    Documents are spread across worker processes. All links are returned
+    in a single table whose "document" column holds the index of the
+    document each link came from.
+
+    Use cases:
+    - Build a link graph for a whole crawl
+    - Find broken or external links across a site
+    - Collect URLs to crawl next
+    """
+
+    html: list[str] | GraphNode | tuple[GraphNode, str] = Field(default=[], description='The HTML documents to extract links from.')
+    base_urls: list[str] | GraphNode | tuple[GraphNode, str] = Field(default=[], description='The base URL of each document, aligned with html. Leave empty to treat all links as relative.')
+    parser: nodetool.nodes.lib.network.html_parsing.ParserBackend = Field(default=nodetool.nodes.lib.network.html_parsing.ParserBackend.AUTO, description='HTML parser backend. \'auto\' uses the fastest installed backend (selectolax, then lxml) and falls back to html.parser.')
+    streaming: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Scan the HTML with an incremental tokenizer instead of building a document tree. Faster and lighter on very large pages.')
+    use_process_pool: bool | GraphNode | tuple[GraphNode, str] = Field(default=True, description='Parse the documents in worker processes on several cores. Small batches are always parsed inline.')
+
+    @classmethod
+    def get_node_type(cls): return "lib.network.beautifulsoup.BatchExtractLinks"
+
+
+
+class BatchExtractMetadata(GraphNode):
+    """
+    Extract metadata from many HTML documents in one call.
+    extract, metadata, seo, batch
+
+    Use cases:
+    - Audit titles and descriptions across a site
+    - Gather page information for a crawl
+    """
+
+    html: list[str] | GraphNode | tuple[GraphNode, str] = Field(default=[], description='The HTML documents to extract metadata from.')
+    parser: nodetool.nodes.lib.network.html_parsing.ParserBackend = Field(default=nodetool.nodes.lib.network.html_parsing.ParserBackend.AUTO, description='HTML parser backend. \'auto\' uses the fastest installed backend (selectolax, then lxml) and falls back to html.parser.')
+    use_process_pool: bool | GraphNode | tuple[GraphNode, str] = Field(default=True, description='Parse the documents in worker processes on several cores. Small batches are always parsed inline.')
+
+    @classmethod
+    def get_node_type(cls): return "lib.network.beautifulsoup.BatchExtractMetadata"
+
+
+
+class BatchHTMLToText(GraphNode):
+    """
+    Converts many HTML documents to plain text in one call.
+    html, text, convert, batch
+
+    Use cases:
+    - Cleaning crawled pages for text analysis
+    - Preparing HTML data for natural language processing in bulk
+    """
+
+    texts: list[str] | GraphNode | tuple[GraphNode, str] = Field(default=[], description=None)
+    preserve_linebreaks: bool | GraphNode | tuple[GraphNode, str] = Field(default=True, description='Convert block-level elements to newlines')
+    use_process_pool: bool | GraphNode | tuple[GraphNode, str] = Field(default=True, description='Parse the documents in worker processes on several cores. Small batches are always parsed inline.')
+
+    @classmethod
+    def get_node_type(cls): return "lib.network.beautifulsoup.BatchHTMLToText"
+
+
+
 class ExtractAudio(GraphNode):
     """
     Extract audio elements from HTML content.
@@ -37,6 +124,9 @@ class ExtractAudio(GraphNode):
 
     html: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='The HTML content to extract audio from.')
     base_url: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='The base URL of the page, used to resolve relative audio URLs.')
+    parser: nodetool.nodes.lib.network.html_parsing.ParserBackend = Field(default=nodetool.nodes.lib.network.html_parsing.ParserBackend.AUTO, description='HTML parser backend. \'auto\' uses the fastest installed backend (selectolax, then lxml) and falls back to html.parser.')
+    streaming: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Scan the HTML with an incremental tokenizer instead of building a document tree. Faster and lighter on very large pages.')
+    use_process_pool: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Parse large documents in a worker process so the workflow keeps running and pages are parsed on several cores.')
 
     @classmethod
     def get_node_type(cls): return "lib.network.beautifulsoup.ExtractAudio"
@@ -56,6 +146,9 @@ class ExtractImages(GraphNode):
 
     html: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='The HTML content to extract images from.')
     base_url: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='The base URL of the page, used to resolve relative image URLs.')
+    parser: nodetool.nodes.lib.network.html_parsing.ParserBackend = Field(default=nodetool.nodes.lib.network.html_parsing.ParserBackend.AUTO, description='HTML parser backend. \'auto\' uses the fastest installed backend (selectolax, then lxml) and falls back to html.parser.')
+    streaming: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Scan the HTML with an incremental tokenizer instead of building a document tree. Faster and lighter on very large pages.')
+    use_process_pool: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Parse large documents in a worker process so the workflow keeps running and pages are parsed on several cores.')
 
     @classmethod
     def get_node_type(cls): return "lib.network.beautifulsoup.ExtractImages"
@@ -67,6 +160,10 @@ class ExtractLinks(GraphNode):
     Extract links from HTML content.
     extract, links, urls
 
+    Links are resolved against the base URL and classified by host:
+    relative and protocol-relative links to the same host are internal,
+    mailto:, javascript: and other non-HTTP links are "other".
+
     Use cases:
     - Analyze website structure
     - Discover related content
@@ -75,6 +172,9 @@ class ExtractLinks(GraphNode):
 
     html: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='The HTML content to extract links from.')
     base_url: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='The base URL of the page, used to determine internal/external links.')
+    parser: nodetool.nodes.lib.network.html_parsing.ParserBackend = Field(default=nodetool.nodes.lib.network.html_parsing.ParserBackend.AUTO, description='HTML parser backend. \'auto\' uses the fastest installed backend (selectolax, then lxml) and falls back to html.parser.')
+    streaming: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Scan the HTML with an incremental tokenizer instead of building a document tree. Faster and lighter on very large pages.')
+    use_process_pool: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Parse large documents in a worker process so the workflow keeps running and pages are parsed on several cores.')
 
     @classmethod
     def get_node_type(cls): return "lib.network.beautifulsoup.ExtractLinks"
@@ -93,6 +193,8 @@ class ExtractMetadata(GraphNode):
     """
 
     html: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='The HTML content to extract metadata from.')
+    parser: nodetool.nodes.lib.network.html_parsing.ParserBackend = Field(default=nodetool.nodes.lib.network.html_parsing.ParserBackend.AUTO, description='HTML parser backend. \'auto\' uses the fastest installed backend (selectolax, then lxml) and falls back to html.parser.')
+    use_process_pool: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Parse large documents in a worker process so the workflow keeps running and pages are parsed on several cores.')
 
     @classmethod
     def get_node_type(cls): return "lib.network.beautifulsoup.ExtractMetadata"
@@ -112,6 +214,9 @@ class ExtractVideos(GraphNode):
 
     html: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='The HTML content to extract videos from.')
     base_url: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='The base URL of the page, used to resolve relative video URLs.')
+    parser: nodetool.nodes.lib.network.html_parsing.ParserBackend = Field(default=nodetool.nodes.lib.network.html_parsing.ParserBackend.AUTO, description='HTML parser backend. \'auto\' uses the fastest installed backend (selectolax, then lxml) and falls back to html.parser.')
+    streaming: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Scan the HTML with an incremental tokenizer instead of building a document tree. Faster and lighter on very large pages.')
+    use_process_pool: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Parse large documents in a worker process so the workflow keeps running and pages are parsed on several cores.')
 
     @classmethod
     def get_node_type(cls): return "lib.network.beautifulsoup.ExtractVideos"
@@ -131,6 +236,8 @@ class HTMLToText(GraphNode):
 
     text: str | GraphNode | tuple[GraphNode, str] = Field(default='', description=None)
     preserve_linebreaks: bool | GraphNode | tuple[GraphNode, str] = Field(default=True, description='Convert block-level elements to newlines')
+    use_process_pool: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Parse large documents in a worker process so the workflow keeps running and pages are parsed on several cores.')
+    cache_mode: nodetool.nodes.lib.network.extraction_cache.CacheMode = Field(default=nodetool.nodes.lib.network.extraction_cache.CacheMode.NONE, description='Reuse results for identical HTML. \'memory\' keeps them for the life of the process, \'disk\' also across runs.')
 
     @classmethod
     def get_node_type(cls): return "lib.network.beautifulsoup.HTMLToText"
@@ -149,6 +256,9 @@ class WebsiteContentExtractor(GraphNode):
     """
 
     html_content: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='The raw HTML content of the website.')
+    parser: nodetool.nodes.lib.network.html_parsing.ParserBackend = Field(default=nodetool.nodes.lib.network.html_parsing.ParserBackend.AUTO, description='HTML parser backend. \'auto\' uses the fastest installed backend (selectolax, then lxml) and falls back to html.parser.')
+    use_process_pool: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Parse large documents in a worker process so the workflow keeps running and pages are parsed on several cores.')
+    cache_mode: nodetool.nodes.lib.network.extraction_cache.CacheMode = Field(default=nodetool.nodes.lib.network.extraction_cache.CacheMode.NONE, description='Reuse results for identical HTML. \'memory\' keeps them for the life of the process, \'disk\' also across runs.')
 
     @classmethod
     def get_node_type(cls): return "lib.network.beautifulsoup.WebsiteContentExtractor"
@@ -5,6 +5,36 @@ import nodetool.metadata.types as types
 from nodetool.dsl.graph import GraphNode
 
 
+class BatchRequest(GraphNode):
+    """
+    Send many HTTP requests concurrently and stream each result as it completes.
+    http, batch, request, url, concurrent, stream
+
+    Results are emitted in completion order as dicts with the input index,
+    url, status, headers, content, error and retries of each request.
+
+    Use cases:
+    - Fetch thousands of API endpoints in a single node
+    - Crawl a list of pages without one node run per URL
+    - Start downstream processing before the whole batch finishes
+    """
+
+    urls: list[str] | GraphNode | tuple[GraphNode, str] = Field(default=[], description='List of URLs to request.')
+    method: str | GraphNode | tuple[GraphNode, str] = Field(default='GET', description='HTTP method used for the entries in urls.')
+    requests: list[dict] | GraphNode | tuple[GraphNode, str] = Field(default=[], description='Request specs with a url and optional method, headers, data and json keys. Sent after the entries in urls.')
+    max_concurrent_requests: int | GraphNode | tuple[GraphNode, str] = Field(default=10, description='Maximum number of concurrent requests.')
+    max_concurrent_per_host: int | GraphNode | tuple[GraphNode, str] = Field(default=0, description='Maximum number of concurrent requests to a single host (0 for no limit).')
+    max_retries: int | GraphNode | tuple[GraphNode, str] = Field(default=3, description='Maximum number of retries for transient failures such as 429, 502, 503 or connection resets.')
+    retry_backoff: float | GraphNode | tuple[GraphNode, str] = Field(default=0.5, description='Base delay in seconds for exponential backoff between retries.')
+    retry_backoff_max: float | GraphNode | tuple[GraphNode, str] = Field(default=30.0, description='Maximum delay in seconds between retries.')
+    requests_per_second: float | GraphNode | tuple[GraphNode, str] = Field(default=0.0, description='Maximum requests per second to each host, shared by all nodes in this process (0 for no limit). Lowered automatically on 429 or X-RateLimit headers.')
+    rate_limit_burst: int | GraphNode | tuple[GraphNode, str] = Field(default=1, description='Number of requests that may be sent back to back before the per-host rate limit applies.')
+
+    @classmethod
+    def get_node_type(cls): return "lib.network.http.BatchRequest"
+
+
+
 class DeleteRequest(GraphNode):
     """
     Remove a resource from a server using an HTTP DELETE request.
@@ -19,6 +49,12 @@ class DeleteRequest(GraphNode):
 
     url: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='The URL to make the request to.')
     auth: str | None | GraphNode | tuple[GraphNode, str] = Field(default=None, description='Authentication credentials.')
+    use_connection_pool: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Send the request over the shared keep-alive connection pool.')
+    max_retries: int | GraphNode | tuple[GraphNode, str] = Field(default=3, description='Maximum number of retries for transient failures such as 429, 502, 503 or connection resets.')
+    retry_backoff: float | GraphNode | tuple[GraphNode, str] = Field(default=0.5, description='Base delay in seconds for exponential backoff between retries.')
+    retry_backoff_max: float | GraphNode | tuple[GraphNode, str] = Field(default=30.0, description='Maximum delay in seconds between retries.')
+    requests_per_second: float | GraphNode | tuple[GraphNode, str] = Field(default=0.0, description='Maximum requests per second to each host, shared by all nodes in this process (0 for no limit). Lowered automatically on 429 or X-RateLimit headers.')
+    rate_limit_burst: int | GraphNode | tuple[GraphNode, str] = Field(default=1, description='Number of requests that may be sent back to back before the per-host rate limit applies.')
 
     @classmethod
     def get_node_type(cls): return "lib.network.http.DeleteRequest"
@@ -41,6 +77,11 @@ class DownloadFiles(GraphNode):
     output_folder: types.FilePath | GraphNode | tuple[GraphNode, str] = Field(default='downloads', description='Local folder path where files will be saved.')
     auth: str | None | GraphNode | tuple[GraphNode, str] = Field(default=None, description='Authentication credentials.')
     max_concurrent_downloads: int | GraphNode | tuple[GraphNode, str] = Field(default=5, description='Maximum number of concurrent downloads.')
+    max_concurrent_per_host: int | GraphNode | tuple[GraphNode, str] = Field(default=0, description='Maximum number of concurrent downloads from a single host (0 for no limit).')
+    connections_per_file: int | GraphNode | tuple[GraphNode, str] = Field(default=1, description='Number of parallel range requests per file when the server supports them. Interrupted downloads resume from the partial .part file.')
+    max_retries: int | GraphNode | tuple[GraphNode, str] = Field(default=3, description='Maximum number of retries for transient failures such as 429, 502, 503 or connection resets.')
+    retry_backoff: float | GraphNode | tuple[GraphNode, str] = Field(default=0.5, description='Base delay in seconds for exponential backoff between retries.')
+    retry_backoff_max: float | GraphNode | tuple[GraphNode, str] = Field(default=30.0, description='Maximum delay in seconds between retries.')
 
     @classmethod
     def get_node_type(cls): return "lib.network.http.DownloadFiles"
@@ -60,12 +101,47 @@ class FetchPage(GraphNode):
 
     url: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='The URL to fetch the page from.')
     wait_time: int | GraphNode | tuple[GraphNode, str] = Field(default=10, description='Maximum time to wait for page load (in seconds).')
+    max_browsers: int | GraphNode | tuple[GraphNode, str] = Field(default=2, description='Maximum number of pooled browser instances shared by page fetches in this workflow run.')
+    pages_per_browser: int | GraphNode | tuple[GraphNode, str] = Field(default=50, description='Number of pages a pooled browser renders before it is restarted.')
 
     @classmethod
     def get_node_type(cls): return "lib.network.http.FetchPage"
 
 
 
+import nodetool.nodes.lib.network.http
+
+class FetchPages(GraphNode):
+    """
+    Render many web pages with pooled headless browsers and stream the HTML of each as it finishes.
+    selenium, fetch, webpage, batch, scraping, stream
+
+    Results are emitted in completion order as dicts with the input index,
+    url, html, success and error_message of each page.
+
+    Use cases:
+    - Scrape JavaScript-rendered pages in bulk
+    - Skip images, fonts, media and trackers to render pages faster
+    - Wait for a specific element instead of a fixed page load
+    """
+
+    WaitFor: typing.ClassVar[type] = nodetool.nodes.lib.network.http.FetchPages.WaitFor
+    urls: list[str] | GraphNode | tuple[GraphNode, str] = Field(default=[], description='The URLs of the pages to fetch.')
+    wait_for: nodetool.nodes.lib.network.http.FetchPages.WaitFor = Field(default=nodetool.nodes.lib.network.http.FetchPages.WaitFor.LOAD, description='When a page counts as rendered: on load, at DOM ready, once the network is idle, or when the CSS selector matches.')
+    selector: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='CSS selector to wait for when wait_for is \'selector\'.')
+    wait_time: int | GraphNode | tuple[GraphNode, str] = Field(default=10, description='Maximum time to wait for each page (in seconds).')
+    block_images: bool | GraphNode | tuple[GraphNode, str] = Field(default=True, description='Do not load images.')
+    block_fonts: bool | GraphNode | tuple[GraphNode, str] = Field(default=True, description='Do not load web fonts.')
+    block_media: bool | GraphNode | tuple[GraphNode, str] = Field(default=True, description='Do not load audio and video.')
+    block_trackers: bool | GraphNode | tuple[GraphNode, str] = Field(default=True, description='Do not load common analytics and advertising scripts.')
+    max_browsers: int | GraphNode | tuple[GraphNode, str] = Field(default=4, description='Maximum number of pooled browser instances rendering pages at once.')
+    pages_per_browser: int | GraphNode | tuple[GraphNode, str] = Field(default=50, description='Number of pages a pooled browser renders before it is restarted.')
+
+    @classmethod
+    def get_node_type(cls): return "lib.network.http.FetchPages"
+
+
+
 class FilterValidURLs(GraphNode):
     """
     Filter a list of URLs by checking their validity using HEAD requests.
@@ -79,8 +155,15 @@ class FilterValidURLs(GraphNode):
 
     url: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='The URL to make the request to.')
     auth: str | None | GraphNode | tuple[GraphNode, str] = Field(default=None, description='Authentication credentials.')
+    use_connection_pool: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Send the request over the shared keep-alive connection pool.')
+    max_retries: int | GraphNode | tuple[GraphNode, str] = Field(default=3, description='Maximum number of retries for transient failures such as 429, 502, 503 or connection resets.')
+    retry_backoff: float | GraphNode | tuple[GraphNode, str] = Field(default=0.5, description='Base delay in seconds for exponential backoff between retries.')
+    retry_backoff_max: float | GraphNode | tuple[GraphNode, str] = Field(default=30.0, description='Maximum delay in seconds between retries.')
+    requests_per_second: float | GraphNode | tuple[GraphNode, str] = Field(default=0.0, description='Maximum requests per second to each host, shared by all nodes in this process (0 for no limit). Lowered automatically on 429 or X-RateLimit headers.')
+    rate_limit_burst: int | GraphNode | tuple[GraphNode, str] = Field(default=1, description='Number of requests that may be sent back to back before the per-host rate limit applies.')
     urls: list[str] | GraphNode | tuple[GraphNode, str] = Field(default=[], description='List of URLs to validate.')
     max_concurrent_requests: int | GraphNode | tuple[GraphNode, str] = Field(default=10, description='Maximum number of concurrent HEAD requests.')
+    max_concurrent_per_host: int | GraphNode | tuple[GraphNode, str] = Field(default=0, description='Maximum number of concurrent HEAD requests to a single host (0 for no limit).')
 
     @classmethod
     def get_node_type(cls): return "lib.network.http.FilterValidURLs"
@@ -101,6 +184,13 @@ class GetRequest(GraphNode):
 
     url: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='The URL to make the request to.')
     auth: str | None | GraphNode | tuple[GraphNode, str] = Field(default=None, description='Authentication credentials.')
+    use_connection_pool: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Send the request over the shared keep-alive connection pool.')
+    max_retries: int | GraphNode | tuple[GraphNode, str] = Field(default=3, description='Maximum number of retries for transient failures such as 429, 502, 503 or connection resets.')
+    retry_backoff: float | GraphNode | tuple[GraphNode, str] = Field(default=0.5, description='Base delay in seconds for exponential backoff between retries.')
+    retry_backoff_max: float | GraphNode | tuple[GraphNode, str] = Field(default=30.0, description='Maximum delay in seconds between retries.')
+    requests_per_second: float | GraphNode | tuple[GraphNode, str] = Field(default=0.0, description='Maximum requests per second to each host, shared by all nodes in this process (0 for no limit). Lowered automatically on 429 or X-RateLimit headers.')
+    rate_limit_burst: int | GraphNode | tuple[GraphNode, str] = Field(default=1, description='Number of requests that may be sent back to back before the per-host rate limit applies.')
+    use_cache: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Cache responses on disk and revalidate them with ETag/Last-Modified instead of downloading unchanged content again.')
 
     @classmethod
     def get_node_type(cls): return "lib.network.http.GetRequest"
@@ -121,6 +211,14 @@ class GetRequestBinary(GraphNode):
 
     url: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='The URL to make the request to.')
     auth: str | None | GraphNode | tuple[GraphNode, str] = Field(default=None, description='Authentication credentials.')
+    use_connection_pool: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Send the request over the shared keep-alive connection pool.')
+    max_retries: int | GraphNode | tuple[GraphNode, str] = Field(default=3, description='Maximum number of retries for transient failures such as 429, 502, 503 or connection resets.')
+    retry_backoff: float | GraphNode | tuple[GraphNode, str] = Field(default=0.5, description='Base delay in seconds for exponential backoff between retries.')
+    retry_backoff_max: float | GraphNode | tuple[GraphNode, str] = Field(default=30.0, description='Maximum delay in seconds between retries.')
+    requests_per_second: float | GraphNode | tuple[GraphNode, str] = Field(default=0.0, description='Maximum requests per second to each host, shared by all nodes in this process (0 for no limit). Lowered automatically on 429 or X-RateLimit headers.')
+    rate_limit_burst: int | GraphNode | tuple[GraphNode, str] = Field(default=1, description='Number of requests that may be sent back to back before the per-host rate limit applies.')
+    use_cache: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Cache responses on disk and revalidate them with ETag/Last-Modified instead of downloading unchanged content again.')
+    connections: int | GraphNode | tuple[GraphNode, str] = Field(default=1, description='Number of parallel range requests to split the download into when the server supports them.')
 
     @classmethod
     def get_node_type(cls): return "lib.network.http.GetRequestBinary"
@@ -141,6 +239,13 @@ class GetRequestDocument(GraphNode):
 
     url: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='The URL to make the request to.')
     auth: str | None | GraphNode | tuple[GraphNode, str] = Field(default=None, description='Authentication credentials.')
+    use_connection_pool: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Send the request over the shared keep-alive connection pool.')
+    max_retries: int | GraphNode | tuple[GraphNode, str] = Field(default=3, description='Maximum number of retries for transient failures such as 429, 502, 503 or connection resets.')
+    retry_backoff: float | GraphNode | tuple[GraphNode, str] = Field(default=0.5, description='Base delay in seconds for exponential backoff between retries.')
+    retry_backoff_max: float | GraphNode | tuple[GraphNode, str] = Field(default=30.0, description='Maximum delay in seconds between retries.')
+    requests_per_second: float | GraphNode | tuple[GraphNode, str] = Field(default=0.0, description='Maximum requests per second to each host, shared by all nodes in this process (0 for no limit). Lowered automatically on 429 or X-RateLimit headers.')
+    rate_limit_burst: int | GraphNode | tuple[GraphNode, str] = Field(default=1, description='Number of requests that may be sent back to back before the per-host rate limit applies.')
+    use_cache: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Cache responses on disk and revalidate them with ETag/Last-Modified instead of downloading unchanged content again.')
 
     @classmethod
     def get_node_type(cls): return "lib.network.http.GetRequestDocument"
@@ -160,6 +265,12 @@ class HeadRequest(GraphNode):
 
     url: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='The URL to make the request to.')
     auth: str | None | GraphNode | tuple[GraphNode, str] = Field(default=None, description='Authentication credentials.')
+    use_connection_pool: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Send the request over the shared keep-alive connection pool.')
+    max_retries: int | GraphNode | tuple[GraphNode, str] = Field(default=3, description='Maximum number of retries for transient failures such as 429, 502, 503 or connection resets.')
+    retry_backoff: float | GraphNode | tuple[GraphNode, str] = Field(default=0.5, description='Base delay in seconds for exponential backoff between retries.')
+    retry_backoff_max: float | GraphNode | tuple[GraphNode, str] = Field(default=30.0, description='Maximum delay in seconds between retries.')
+    requests_per_second: float | GraphNode | tuple[GraphNode, str] = Field(default=0.0, description='Maximum requests per second to each host, shared by all nodes in this process (0 for no limit). Lowered automatically on 429 or X-RateLimit headers.')
+    rate_limit_burst: int | GraphNode | tuple[GraphNode, str] = Field(default=1, description='Number of requests that may be sent back to back before the per-host rate limit applies.')
 
     @classmethod
     def get_node_type(cls): return "lib.network.http.HeadRequest"
@@ -180,6 +291,12 @@ class ImageDownloader(GraphNode):
     images: list[str] | GraphNode | tuple[GraphNode, str] = Field(default=[], description='List of image URLs to download.')
     base_url: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='Base URL to prepend to relative image URLs.')
     max_concurrent_downloads: int | GraphNode | tuple[GraphNode, str] = Field(default=10, description='Maximum number of concurrent image downloads.')
+    max_concurrent_per_host: int | GraphNode | tuple[GraphNode, str] = Field(default=0, description='Maximum number of concurrent downloads from a single host (0 for no limit).')
+    max_retries: int | GraphNode | tuple[GraphNode, str] = Field(default=3, description='Maximum number of retries for transient failures such as 429, 502, 503 or connection resets.')
+    retry_backoff: float | GraphNode | tuple[GraphNode, str] = Field(default=0.5, description='Base delay in seconds for exponential backoff between retries.')
+    retry_backoff_max: float | GraphNode | tuple[GraphNode, str] = Field(default=30.0, description='Maximum delay in seconds between retries.')
+    requests_per_second: float | GraphNode | tuple[GraphNode, str] = Field(default=0.0, description='Maximum requests per second to each host, shared by all nodes in this process (0 for no limit). Lowered automatically on 429 or X-RateLimit headers.')
+    rate_limit_burst: int | GraphNode | tuple[GraphNode, str] = Field(default=1, description='Number of requests that may be sent back to back before the per-host rate limit applies.')
 
     @classmethod
     def get_node_type(cls): return "lib.network.http.ImageDownloader"
@@ -199,6 +316,13 @@ class JSONGetRequest(GraphNode):
 
     url: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='The URL to make the request to.')
     auth: str | None | GraphNode | tuple[GraphNode, str] = Field(default=None, description='Authentication credentials.')
+    use_connection_pool: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Send the request over the shared keep-alive connection pool.')
+    max_retries: int | GraphNode | tuple[GraphNode, str] = Field(default=3, description='Maximum number of retries for transient failures such as 429, 502, 503 or connection resets.')
+    retry_backoff: float | GraphNode | tuple[GraphNode, str] = Field(default=0.5, description='Base delay in seconds for exponential backoff between retries.')
+    retry_backoff_max: float | GraphNode | tuple[GraphNode, str] = Field(default=30.0, description='Maximum delay in seconds between retries.')
+    requests_per_second: float | GraphNode | tuple[GraphNode, str] = Field(default=0.0, description='Maximum requests per second to each host, shared by all nodes in this process (0 for no limit). Lowered automatically on 429 or X-RateLimit headers.')
+    rate_limit_burst: int | GraphNode | tuple[GraphNode, str] = Field(default=1, description='Number of requests that may be sent back to back before the per-host rate limit applies.')
+    use_cache: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Cache responses on disk and revalidate them with ETag/Last-Modified instead of downloading unchanged content again.')
 
     @classmethod
     def get_node_type(cls): return "lib.network.http.JSONGetRequest"
@@ -218,6 +342,12 @@ class JSONPatchRequest(GraphNode):
 
     url: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='The URL to make the request to.')
     auth: str | None | GraphNode | tuple[GraphNode, str] = Field(default=None, description='Authentication credentials.')
+    use_connection_pool: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Send the request over the shared keep-alive connection pool.')
+    max_retries: int | GraphNode | tuple[GraphNode, str] = Field(default=3, description='Maximum number of retries for transient failures such as 429, 502, 503 or connection resets.')
+    retry_backoff: float | GraphNode | tuple[GraphNode, str] = Field(default=0.5, description='Base delay in seconds for exponential backoff between retries.')
+    retry_backoff_max: float | GraphNode | tuple[GraphNode, str] = Field(default=30.0, description='Maximum delay in seconds between retries.')
+    requests_per_second: float | GraphNode | tuple[GraphNode, str] = Field(default=0.0, description='Maximum requests per second to each host, shared by all nodes in this process (0 for no limit). Lowered automatically on 429 or X-RateLimit headers.')
+    rate_limit_burst: int | GraphNode | tuple[GraphNode, str] = Field(default=1, description='Number of requests that may be sent back to back before the per-host rate limit applies.')
     data: dict | GraphNode | tuple[GraphNode, str] = Field(default={}, description='The JSON data to send in the PATCH request.')
 
     @classmethod
@@ -238,6 +368,12 @@ class JSONPostRequest(GraphNode):
 
     url: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='The URL to make the request to.')
     auth: str | None | GraphNode | tuple[GraphNode, str] = Field(default=None, description='Authentication credentials.')
+    use_connection_pool: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Send the request over the shared keep-alive connection pool.')
+    max_retries: int | GraphNode | tuple[GraphNode, str] = Field(default=3, description='Maximum number of retries for transient failures such as 429, 502, 503 or connection resets.')
+    retry_backoff: float | GraphNode | tuple[GraphNode, str] = Field(default=0.5, description='Base delay in seconds for exponential backoff between retries.')
+    retry_backoff_max: float | GraphNode | tuple[GraphNode, str] = Field(default=30.0, description='Maximum delay in seconds between retries.')
+    requests_per_second: float | GraphNode | tuple[GraphNode, str] = Field(default=0.0, description='Maximum requests per second to each host, shared by all nodes in this process (0 for no limit). Lowered automatically on 429 or X-RateLimit headers.')
+    rate_limit_burst: int | GraphNode | tuple[GraphNode, str] = Field(default=1, description='Number of requests that may be sent back to back before the per-host rate limit applies.')
     data: dict | GraphNode | tuple[GraphNode, str] = Field(default={}, description='The JSON data to send in the POST request.')
 
     @classmethod
@@ -258,6 +394,12 @@ class JSONPutRequest(GraphNode):
 
     url: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='The URL to make the request to.')
     auth: str | None | GraphNode | tuple[GraphNode, str] = Field(default=None, description='Authentication credentials.')
+    use_connection_pool: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Send the request over the shared keep-alive connection pool.')
+    max_retries: int | GraphNode | tuple[GraphNode, str] = Field(default=3, description='Maximum number of retries for transient failures such as 429, 502, 503 or connection resets.')
+    retry_backoff: float | GraphNode | tuple[GraphNode, str] = Field(default=0.5, description='Base delay in seconds for exponential backoff between retries.')
+    retry_backoff_max: float | GraphNode | tuple[GraphNode, str] = Field(default=30.0, description='Maximum delay in seconds between retries.')
+    requests_per_second: float | GraphNode | tuple[GraphNode, str] = Field(default=0.0, description='Maximum requests per second to each host, shared by all nodes in this process (0 for no limit). Lowered automatically on 429 or X-RateLimit headers.')
+    rate_limit_burst: int | GraphNode | tuple[GraphNode, str] = Field(default=1, description='Number of requests that may be sent back to back before the per-host rate limit applies.')
     data: dict | GraphNode | tuple[GraphNode, str] = Field(default={}, description='The JSON data to send in the PUT request.')
 
     @classmethod
@@ -279,6 +421,12 @@ class PostRequest(GraphNode):
 
     url: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='The URL to make the request to.')
     auth: str | None | GraphNode | tuple[GraphNode, str] = Field(default=None, description='Authentication credentials.')
+    use_connection_pool: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Send the request over the shared keep-alive connection pool.')
+    max_retries: int | GraphNode | tuple[GraphNode, str] = Field(default=3, description='Maximum number of retries for transient failures such as 429, 502, 503 or connection resets.')
+    retry_backoff: float | GraphNode | tuple[GraphNode, str] = Field(default=0.5, description='Base delay in seconds for exponential backoff between retries.')
+    retry_backoff_max: float | GraphNode | tuple[GraphNode, str] = Field(default=30.0, description='Maximum delay in seconds between retries.')
+    requests_per_second: float | GraphNode | tuple[GraphNode, str] = Field(default=0.0, description='Maximum requests per second to each host, shared by all nodes in this process (0 for no limit). Lowered automatically on 429 or X-RateLimit headers.')
+    rate_limit_burst: int | GraphNode | tuple[GraphNode, str] = Field(default=1, description='Number of requests that may be sent back to back before the per-host rate limit applies.')
     data: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='The data to send in the POST request.')
 
     @classmethod
@@ -300,6 +448,12 @@ class PostRequestBinary(GraphNode):
 
     url: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='The URL to make the request to.')
     auth: str | None | GraphNode | tuple[GraphNode, str] = Field(default=None, description='Authentication credentials.')
+    use_connection_pool: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Send the request over the shared keep-alive connection pool.')
+    max_retries: int | GraphNode | tuple[GraphNode, str] = Field(default=3, description='Maximum number of retries for transient failures such as 429, 502, 503 or connection resets.')
+    retry_backoff: float | GraphNode | tuple[GraphNode, str] = Field(default=0.5, description='Base delay in seconds for exponential backoff between retries.')
+    retry_backoff_max: float | GraphNode | tuple[GraphNode, str] = Field(default=30.0, description='Maximum delay in seconds between retries.')
+    requests_per_second: float | GraphNode | tuple[GraphNode, str] = Field(default=0.0, description='Maximum requests per second to each host, shared by all nodes in this process (0 for no limit). Lowered automatically on 429 or X-RateLimit headers.')
+    rate_limit_burst: int | GraphNode | tuple[GraphNode, str] = Field(default=1, description='Number of requests that may be sent back to back before the per-host rate limit applies.')
     data: str | bytes | GraphNode | tuple[GraphNode, str] = Field(default='', description='The data to send in the POST request. Can be string or binary.')
 
     @classmethod
@@ -321,9 +475,36 @@ class PutRequest(GraphNode):
 
     url: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='The URL to make the request to.')
     auth: str | None | GraphNode | tuple[GraphNode, str] = Field(default=None, description='Authentication credentials.')
+    use_connection_pool: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Send the request over the shared keep-alive connection pool.')
+    max_retries: int | GraphNode | tuple[GraphNode, str] = Field(default=3, description='Maximum number of retries for transient failures such as 429, 502, 503 or connection resets.')
+    retry_backoff: float | GraphNode | tuple[GraphNode, str] = Field(default=0.5, description='Base delay in seconds for exponential backoff between retries.')
+    retry_backoff_max: float | GraphNode | tuple[GraphNode, str] = Field(default=30.0, description='Maximum delay in seconds between retries.')
+    requests_per_second: float | GraphNode | tuple[GraphNode, str] = Field(default=0.0, description='Maximum requests per second to each host, shared by all nodes in this process (0 for no limit). Lowered automatically on 429 or X-RateLimit headers.')
+    rate_limit_burst: int | GraphNode | tuple[GraphNode, str] = Field(default=1, description='Number of requests that may be sent back to back before the per-host rate limit applies.')
     data: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='The data to send in the PUT request.')
 
     @classmethod
     def get_node_type(cls): return "lib.network.http.PutRequest"
 
 
+
+class StreamPageLinks(GraphNode):
+    """
+    Stream the links, images, videos and audio of a web page while it downloads.
+    links, images, media, scraping, stream, crawl
+
+    The page is scanned with an incremental tokenizer as chunks arrive, so
+    no document tree is built and memory use stays flat on very large pages.
+
+    Use cases:
+    - Crawl huge pages without holding them in memory
+    - Start following links before the page has finished downloading
+    - Collect media URLs from long listing or archive pages
+    """
+
+    url: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='The URL of the page to scan.')
+
+    @classmethod
+    def get_node_type(cls): return "lib.network.http.StreamPageLinks"
+
+
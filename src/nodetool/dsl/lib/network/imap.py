@@ -3,6 +3,7 @@ import typing
 from typing import Any
 import nodetool.metadata.types as types
 from nodetool.dsl.graph import GraphNode
+import nodetool.nodes.lib.network.imap
 
 
 class ConfigureIMAP(GraphNode):
@@ -62,13 +63,46 @@ class IMAPSearch(GraphNode):
     - Search for emails based on specific criteria
     - Retrieve emails from a specific sender
     - Filter emails by subject, sender, or date
+    - List subjects of a large mailbox without downloading attachments
     """
 
     connection: types.IMAPConnection | GraphNode | tuple[GraphNode, str] = Field(default=types.IMAPConnection(type='imap_connection', host='', port=993, username='', password='', use_ssl=True), description='IMAP connection details')
     search_criteria: types.EmailSearchCriteria | GraphNode | tuple[GraphNode, str] = Field(default=types.EmailSearchCriteria(type='email_search_criteria', from_address=None, to_address=None, subject=None, body=None, cc=None, bcc=None, date_condition=None, flags=[], keywords=[], folder=None, text=None), description='Search criteria')
     max_results: int | GraphNode | tuple[GraphNode, str] = Field(default=50, description='Maximum number of emails to return')
+    body_mode: nodetool.nodes.lib.network.imap.BodyMode = Field(default=nodetool.nodes.lib.network.imap.BodyMode.FULL, description='What to download: whole messages, only headers and the text part, or only headers')
+    max_body_bytes: int | GraphNode | tuple[GraphNode, str] = Field(default=0, description='With body_mode \'text\', fetch at most this many bytes of each body (0 for no limit)')
+    only_new: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Only return emails that arrived since the last run with the same criteria')
+    use_cache: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Keep fetched emails in a local cache and only download messages not fetched before')
 
     @classmethod
     def get_node_type(cls): return "lib.network.imap.IMAPSearch"
 
 
+
+class IMAPWatch(GraphNode):
+    """
+    Streams new emails as they arrive, using IMAP IDLE.
+    email, imap, watch, idle, stream
+
+    The server pushes a notification when mail arrives, so new messages
+    are emitted within seconds and without re-running the search. Only
+    messages that arrive after the node starts and match the criteria
+    are emitted.
+
+    Use cases:
+    - React to incoming email in a workflow
+    - Summarize or forward messages as they arrive
+    - Wait for a message from a given sender
+    """
+
+    connection: types.IMAPConnection | GraphNode | tuple[GraphNode, str] = Field(default=types.IMAPConnection(type='imap_connection', host='', port=993, username='', password='', use_ssl=True), description='IMAP connection details')
+    search_criteria: types.EmailSearchCriteria | GraphNode | tuple[GraphNode, str] = Field(default=types.EmailSearchCriteria(type='email_search_criteria', from_address=None, to_address=None, subject=None, body=None, cc=None, bcc=None, date_condition=None, flags=[], keywords=[], folder=None, text=None), description='Search criteria')
+    body_mode: nodetool.nodes.lib.network.imap.BodyMode = Field(default=nodetool.nodes.lib.network.imap.BodyMode.FULL, description='What to download: whole messages, only headers and the text part, or only headers')
+    max_body_bytes: int | GraphNode | tuple[GraphNode, str] = Field(default=0, description='With body_mode \'text\', fetch at most this many bytes of each body (0 for no limit)')
+    max_emails: int | GraphNode | tuple[GraphNode, str] = Field(default=0, description='Stop after emitting this many emails (0 to keep watching)')
+    idle_timeout: float | GraphNode | tuple[GraphNode, str] = Field(default=1500.0, description='Seconds to stay in IDLE before renewing it; servers may drop clients idle for 30 minutes')
+
+    @classmethod
+    def get_node_type(cls): return "lib.network.imap.IMAPWatch"
+
+
@@ -17,6 +17,7 @@ class ExtractFeedMetadata(GraphNode):
     """
 
     url: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='URL of the RSS feed')
+    use_cache: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Remember the feed\'s ETag/Last-Modified and reuse the stored metadata when the server answers 304 Not Modified.')
 
     @classmethod
     def get_node_type(cls): return "lib.network.rss.ExtractFeedMetadata"
@@ -35,12 +36,41 @@ class FetchRSSFeed(GraphNode):
     """
 
     url: str | GraphNode | tuple[GraphNode, str] = Field(default='', description='URL of the RSS feed to fetch')
+    use_cache: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Remember the feed\'s ETag/Last-Modified and reuse the stored entries when the server answers 304 Not Modified.')
+    only_new: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Only return entries not returned by an earlier run. Also enables the conditional request of use_cache.')
 
     @classmethod
     def get_node_type(cls): return "lib.network.rss.FetchRSSFeed"
 
 
 
+class FetchRSSFeeds(GraphNode):
+    """
+    Fetches many RSS feeds concurrently and streams each one as soon as it is parsed.
+    rss, feed, network, batch, aggregate, stream
+
+    Results are emitted in completion order as dicts with the input index,
+    url, title, entries, changed, success and error_message of each feed.
+    A feed that fails or times out is reported and does not stop the others.
+
+    Use cases:
+    - Monitor thousands of news feeds
+    - Aggregate posts from many blogs
+    - Poll feeds for new entries on a schedule
+    """
+
+    urls: list[str] | GraphNode | tuple[GraphNode, str] = Field(default=[], description='URLs of the RSS feeds to fetch')
+    max_concurrent_requests: int | GraphNode | tuple[GraphNode, str] = Field(default=50, description='Maximum number of feeds fetched at once.')
+    max_concurrent_per_host: int | GraphNode | tuple[GraphNode, str] = Field(default=4, description='Maximum number of feeds fetched at once from a single host (0 for no limit).')
+    timeout: float | GraphNode | tuple[GraphNode, str] = Field(default=15.0, description='Maximum time to fetch and parse each feed (in seconds).')
+    use_cache: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Remember each feed\'s ETag/Last-Modified and reuse the stored entries when the server answers 304 Not Modified.')
+    only_new: bool | GraphNode | tuple[GraphNode, str] = Field(default=False, description='Only return entries not returned by an earlier run. Also enables the conditional request of use_cache.')
+
+    @classmethod
+    def get_node_type(cls): return "lib.network.rss.FetchRSSFeeds"
+
+
+
 class RSSEntryFields(GraphNode):
     """
     Extracts fields from an RSS entry.
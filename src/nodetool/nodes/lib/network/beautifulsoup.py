@@ -1,5 +1,3 @@
-import re
-from urllib.parse import urljoin
 from pydantic import Field
 from nodetool.metadata.types import (
     AudioRef,
@@ -15,8 +13,21 @@ from pydantic import Field
 from nodetool.metadata.types import ColumnDef, DataframeRef, ImageRef
 from nodetool.workflows.base_node import BaseNode
 from nodetool.workflows.processing_context import ProcessingContext
-from bs4 import BeautifulSoup
 from nodetool.common.convert_html import convert_html_to_text
+from nodetool.nodes.lib.network.html_executor import (
+    extract_html,
+    extract_html_many,
+    map_cpu_bound,
+    run_cpu_bound,
+)
+from nodetool.nodes.lib.network.extraction_cache import CacheMode, memoize
+from nodetool.nodes.lib.network.html_content import main_content_text
+from nodetool.nodes.lib.network.html_parsing import (
+    LINK_COLUMNS,
+    ParserBackend,
+    parse_html,
+    resolve_parser,
+)
 
 
 class BaseUrl(BaseNode):
@@ -55,6 +66,10 @@ class ExtractLinks(BaseNode):
     Extract links from HTML content.
     extract, links, urls
 
+    Links are resolved against the base URL and classified by host:
+    relative and protocol-relative links to the same host are internal,
+    mailto:, javascript: and other non-HTTP links are "other".
+
     Use cases:
     - Analyze website structure
     - Discover related content
@@ -69,28 +84,34 @@ class ExtractLinks(BaseNode):
         default="",
         description="The base URL of the page, used to determine internal/external links.",
     )
+    parser: ParserBackend = Field(
+        default=ParserBackend.AUTO,
+        description="HTML parser backend. 'auto' uses the fastest installed backend (selectolax, then lxml) and falls back to html.parser.",
+    )
+    streaming: bool = Field(
+        default=False,
+        description="Scan the HTML with an incremental tokenizer instead of building a document tree. Faster and lighter on very large pages.",
+    )
+    use_process_pool: bool = Field(
+        default=False,
+        description="Parse large documents in a worker process so the workflow keeps running and pages are parsed on several cores.",
+    )
 
     async def process(self, context: ProcessingContext) -> DataframeRef:
-        soup = BeautifulSoup(self.html, "html.parser")
-
-        links = []
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            text = a.text.strip()
-            link_type = (
-                "internal"
-                if href.startswith(self.base_url) or href.startswith("/")
-                else "external"
-            )
-            links.append({"href": href, "text": text, "type": link_type})
+        table = await extract_html(
+            "links",
+            self.html,
+            self.base_url,
+            self.parser,
+            self.streaming,
+            self.use_process_pool,
+        )
 
         return DataframeRef(
             columns=[
-                ColumnDef(name="href", data_type="string"),
-                ColumnDef(name="text", data_type="string"),
-                ColumnDef(name="type", data_type="string"),
+                ColumnDef(name=column, data_type="string") for column in LINK_COLUMNS
             ],
-            data=[[l["href"], l["text"], l["type"]] for l in links],
+            data=table.rows(),
         )
 
 
@@ -109,6 +130,14 @@ class ExtractMetadata(BaseNode):
         default="",
         description="The HTML content to extract metadata from.",
     )
+    parser: ParserBackend = Field(
+        default=ParserBackend.AUTO,
+        description="HTML parser backend. 'auto' uses the fastest installed backend (selectolax, then lxml) and falls back to html.parser.",
+    )
+    use_process_pool: bool = Field(
+        default=False,
+        description="Parse large documents in a worker process so the workflow keeps running and pages are parsed on several cores.",
+    )
 
     @classmethod
     def return_type(cls):
@@ -117,21 +146,9 @@ class ExtractMetadata(BaseNode):
         }
 
     async def process(self, context: ProcessingContext):
-        soup = BeautifulSoup(self.html, "html.parser")
-
-        return {
-            "title": soup.title.string if soup.title else None,
-            "description": (
-                soup.find("meta", attrs={"name": "description"})["content"]  # type: ignore
-                if soup.find("meta", attrs={"name": "description"})
-                else None
-            ),
-            "keywords": (
-                soup.find("meta", attrs={"name": "keywords"})["content"]  # type: ignore
-                if soup.find("meta", attrs={"name": "keywords"})
-                else None
-            ),
-        }
+        return await extract_html(
+            "metadata", self.html, parser=self.parser, offload=self.use_process_pool
+        )
 
 
 class ExtractImages(BaseNode):
@@ -153,22 +170,33 @@ class ExtractImages(BaseNode):
         default="",
         description="The base URL of the page, used to resolve relative image URLs.",
     )
+    parser: ParserBackend = Field(
+        default=ParserBackend.AUTO,
+        description="HTML parser backend. 'auto' uses the fastest installed backend (selectolax, then lxml) and falls back to html.parser.",
+    )
+    streaming: bool = Field(
+        default=False,
+        description="Scan the HTML with an incremental tokenizer instead of building a document tree. Faster and lighter on very large pages.",
+    )
+    use_process_pool: bool = Field(
+        default=False,
+        description="Parse large documents in a worker process so the workflow keeps running and pages are parsed on several cores.",
+    )
 
     @classmethod
     def return_type(cls):
         return list[ImageRef]
 
     async def process(self, context: ProcessingContext) -> list[ImageRef]:
-        soup = BeautifulSoup(self.html, "html.parser")
-
-        images = []
-        for img in soup.find_all("img"):
-            src = img.get("src")
-            if src:
-                full_url = urljoin(self.base_url, src)
-                images.append(ImageRef(uri=full_url))
-
-        return images
+        urls = await extract_html(
+            "images",
+            self.html,
+            self.base_url,
+            self.parser,
+            self.streaming,
+            self.use_process_pool,
+        )
+        return [ImageRef(uri=url) for url in urls]
 
 
 class ExtractVideos(BaseNode):
@@ -190,22 +218,29 @@ class ExtractVideos(BaseNode):
         default="",
         description="The base URL of the page, used to resolve relative video URLs.",
     )
+    parser: ParserBackend = Field(
+        default=ParserBackend.AUTO,
+        description="HTML parser backend. 'auto' uses the fastest installed backend (selectolax, then lxml) and falls back to html.parser.",
+    )
+    streaming: bool = Field(
+        default=False,
+        description="Scan the HTML with an incremental tokenizer instead of building a document tree. Faster and lighter on very large pages.",
+    )
+    use_process_pool: bool = Field(
+        default=False,
+        description="Parse large documents in a worker process so the workflow keeps running and pages are parsed on several cores.",
+    )
 
     async def process(self, context: ProcessingContext) -> list[VideoRef]:
-        soup = BeautifulSoup(self.html, "html.parser")
-
-        videos = []
-        for video in soup.find_all(["video", "iframe"]):
-            if video.name == "video":
-                src = video.get("src") or (video.source and video.source.get("src"))
-            else:  # iframe
-                src = video.get("src")
-
-            if src:
-                full_url = urljoin(self.base_url, src)
-                videos.append(VideoRef(uri=full_url))
-
-        return videos
+        urls = await extract_html(
+            "videos",
+            self.html,
+            self.base_url,
+            self.parser,
+            self.streaming,
+            self.use_process_pool,
+        )
+        return [VideoRef(uri=url) for url in urls]
 
 
 class ExtractAudio(BaseNode):
@@ -227,60 +262,33 @@ class ExtractAudio(BaseNode):
         default="",
         description="The base URL of the page, used to resolve relative audio URLs.",
     )
+    parser: ParserBackend = Field(
+        default=ParserBackend.AUTO,
+        description="HTML parser backend. 'auto' uses the fastest installed backend (selectolax, then lxml) and falls back to html.parser.",
+    )
+    streaming: bool = Field(
+        default=False,
+        description="Scan the HTML with an incremental tokenizer instead of building a document tree. Faster and lighter on very large pages.",
+    )
+    use_process_pool: bool = Field(
+        default=False,
+        description="Parse large documents in a worker process so the workflow keeps running and pages are parsed on several cores.",
+    )
 
     async def process(self, context: ProcessingContext) -> list[AudioRef]:
-        soup = BeautifulSoup(self.html, "html.parser")
-
-        audio_elements = []
-        for audio in soup.find_all(["audio", "source"]):
-            src = audio.get("src")
-            if src:
-                full_url = urljoin(self.base_url, src)
-                audio_elements.append(AudioRef(uri=full_url))
-
-        return audio_elements
-
-
-def extract_content(html_content: str) -> str:
-    soup = BeautifulSoup(html_content, "html.parser")
-
-    def clean_text(text: str) -> str:
-        # Remove extra whitespace and newlines
-        text = re.sub(r"\s+", " ", text).strip()
-        return text
-
-    # Remove script and style elements
-    for script in soup(["script", "style"]):
-        script.decompose()
-
-    # Try to find the main content
-    main_content = None
-    potential_content_tags = [
-        "article",
-        "main",
-        'div[id*="content"]',
-        'div[class*="content"]',
-    ]
-
-    for tag in potential_content_tags:
-        content = soup.select_one(tag)
-        if content:
-            main_content = content
-            break
-
-    # If we couldn't find a clear main content, use the body
-    if not main_content:
-        main_content = soup.body
+        urls = await extract_html(
+            "audio",
+            self.html,
+            self.base_url,
+            self.parser,
+            self.streaming,
+            self.use_process_pool,
+        )
+        return [AudioRef(uri=url) for url in urls]
 
-    # Extract the text from the main content
-    if main_content:
-        # Remove common non-content elements
-        for elem in main_content(["nav", "sidebar", "footer", "header"]):
-            elem.decompose()
 
-        return clean_text(main_content.get_text())
-    else:
-        return "No main content found"
+def extract_content(html_content: str, parser: str = ParserBackend.AUTO) -> str:
+    return main_content_text(parse_html(html_content, parser))
 
 
 class WebsiteContentExtractor(BaseNode):
@@ -298,9 +306,33 @@ class WebsiteContentExtractor(BaseNode):
         default="",
         description="The raw HTML content of the website.",
     )
+    parser: ParserBackend = Field(
+        default=ParserBackend.AUTO,
+        description="HTML parser backend. 'auto' uses the fastest installed backend (selectolax, then lxml) and falls back to html.parser.",
+    )
+    use_process_pool: bool = Field(
+        default=False,
+        description="Parse large documents in a worker process so the workflow keeps running and pages are parsed on several cores.",
+    )
+    cache_mode: CacheMode = Field(
+        default=CacheMode.NONE,
+        description="Reuse results for identical HTML. 'memory' keeps them for the life of the process, 'disk' also across runs.",
+    )
 
     async def process(self, context: ProcessingContext) -> str:
-        return extract_content(self.html_content)
+        parser = resolve_parser(self.parser)
+        return await memoize(
+            self.cache_mode,
+            "content",
+            self.html_content,
+            (parser,),
+            lambda: extract_html(
+                "content",
+                self.html_content,
+                parser=parser,
+                offload=self.use_process_pool,
+            ),
+        )
 
 
 class HTMLToText(BaseNode):
@@ -320,10 +352,180 @@ class HTMLToText(BaseNode):
         default=True,
         description="Convert block-level elements to newlines",
     )
+    use_process_pool: bool = Field(
+        default=False,
+        description="Parse large documents in a worker process so the workflow keeps running and pages are parsed on several cores.",
+    )
+    cache_mode: CacheMode = Field(
+        default=CacheMode.NONE,
+        description="Reuse results for identical HTML. 'memory' keeps them for the life of the process, 'disk' also across runs.",
+    )
 
     @classmethod
     def get_title(cls):
         return "Convert HTML to Text"
 
     async def process(self, context: ProcessingContext) -> str:
-        return convert_html_to_text(self.text, self.preserve_linebreaks)
+        return await memoize(
+            self.cache_mode,
+            "text",
+            self.text,
+            (self.preserve_linebreaks,),
+            lambda: run_cpu_bound(
+                convert_html_to_text,
+                self.text,
+                self.preserve_linebreaks,
+                size=len(self.text),
+                offload=self.use_process_pool,
+            ),
+        )
+
+
+class BatchExtractLinks(BaseNode):
+    """
+    Extract links from many HTML documents in one call.
+    extract, links, urls, batch, crawl
+
+    Documents are spread across worker processes. All links are returned
+    in a single table whose "document" column holds the index of the
+    document each link came from.
+
+    Use cases:
+    - Build a link graph for a whole crawl
+    - Find broken or external links across a site
+    - Collect URLs to crawl next
+    """
+
+    html: list[str] = Field(
+        default=[],
+        description="The HTML documents to extract links from.",
+    )
+    base_urls: list[str] = Field(
+        default=[],
+        description="The base URL of each document, aligned with html. Leave empty to treat all links as relative.",
+    )
+    parser: ParserBackend = Field(
+        default=ParserBackend.AUTO,
+        description="HTML parser backend. 'auto' uses the fastest installed backend (selectolax, then lxml) and falls back to html.parser.",
+    )
+    streaming: bool = Field(
+        default=False,
+        description="Scan the HTML with an incremental tokenizer instead of building a document tree. Faster and lighter on very large pages.",
+    )
+    use_process_pool: bool = Field(
+        default=True,
+        description="Parse the documents in worker processes on several cores. Small batches are always parsed inline.",
+    )
+
+    async def process(self, context: ProcessingContext) -> DataframeRef:
+        tables = await extract_html_many(
+            "links",
+            self.html,
+            self.base_urls,
+            self.parser,
+            self.streaming,
+            self.use_process_pool,
+        )
+        return DataframeRef(
+            columns=[ColumnDef(name="document", data_type="int")]
+            + [ColumnDef(name=column, data_type="string") for column in LINK_COLUMNS],
+            data=[
+                [index, *row]
+                for index, table in enumerate(tables)
+                for row in table.rows()
+            ],
+        )
+
+
+class BatchExtractMetadata(BaseNode):
+    """
+    Extract metadata from many HTML documents in one call.
+    extract, metadata, seo, batch
+
+    Use cases:
+    - Audit titles and descriptions across a site
+    - Gather page information for a crawl
+    """
+
+    html: list[str] = Field(
+        default=[],
+        description="The HTML documents to extract metadata from.",
+    )
+    parser: ParserBackend = Field(
+        default=ParserBackend.AUTO,
+        description="HTML parser backend. 'auto' uses the fastest installed backend (selectolax, then lxml) and falls back to html.parser.",
+    )
+    use_process_pool: bool = Field(
+        default=True,
+        description="Parse the documents in worker processes on several cores. Small batches are always parsed inline.",
+    )
+
+    async def process(self, context: ProcessingContext) -> list[dict]:
+        return await extract_html_many(
+            "metadata", self.html, parser=self.parser, offload=self.use_process_pool
+        )
+
+
+class BatchExtractContent(BaseNode):
+    """
+    Extract the main content from many HTML documents in one call.
+    scrape, web scraping, content extraction, batch
+
+    Returns one text per document, in input order.
+
+    Use cases:
+    - Clean a crawl shard for indexing
+    - Prepare many articles for summarization
+    """
+
+    html: list[str] = Field(
+        default=[],
+        description="The raw HTML documents.",
+    )
+    parser: ParserBackend = Field(
+        default=ParserBackend.AUTO,
+        description="HTML parser backend. 'auto' uses the fastest installed backend (selectolax, then lxml) and falls back to html.parser.",
+    )
+    use_process_pool: bool = Field(
+        default=True,
+        description="Parse the documents in worker processes on several cores. Small batches are always parsed inline.",
+    )
+
+    async def process(self, context: ProcessingContext) -> list[str]:
+        return await extract_html_many(
+            "content", self.html, parser=self.parser, offload=self.use_process_pool
+        )
+
+
+class BatchHTMLToText(BaseNode):
+    """
+    Converts many HTML documents to plain text in one call.
+    html, text, convert, batch
+
+    Use cases:
+    - Cleaning crawled pages for text analysis
+    - Preparing HTML data for natural language processing in bulk
+    """
+
+    texts: list[str] = Field(title="HTML", default=[])
+    preserve_linebreaks: bool = Field(
+        title="Preserve Line Breaks",
+        default=True,
+        description="Convert block-level elements to newlines",
+    )
+    use_process_pool: bool = Field(
+        default=True,
+        description="Parse the documents in worker processes on several cores. Small batches are always parsed inline.",
+    )
+
+    @classmethod
+    def get_title(cls):
+        return "Convert HTML to Text (Batch)"
+
+    async def process(self, context: ProcessingContext) -> list[str]:
+        return await map_cpu_bound(
+            convert_html_to_text,
+            [(text, self.preserve_linebreaks) for text in self.texts],
+            [len(text) for text in self.texts],
+            self.use_process_pool,
+        )
@@ -0,0 +1,304 @@
+import asyncio
+import atexit
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Iterable
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+log = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_MAX_PAGES = 50
+POLL_INTERVAL = 0.1
+NETWORK_IDLE_TIME = 0.5
+
+# URL patterns for Network.setBlockedURLs, grouped by what they block.
+BLOCK_PATTERNS: dict[str, tuple[str, ...]] = {
+    "images": tuple(
+        f"*.{ext}*"
+        for ext in ("png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico", "bmp")
+    ),
+    "fonts": tuple(f"*.{ext}*" for ext in ("woff", "woff2", "ttf", "otf", "eot")),
+    "media": tuple(
+        f"*.{ext}*" for ext in ("mp4", "webm", "ogg", "mp3", "wav", "m4a", "mov")
+    ),
+    "trackers": tuple(
+        f"*{domain}*"
+        for domain in (
+            "google-analytics.com",
+            "googletagmanager.com",
+            "doubleclick.net",
+            "googlesyndication.com",
+            "adservice.google.com",
+            "connect.facebook.net",
+            "hotjar.com",
+            "segment.io",
+            "mixpanel.com",
+            "scorecardresearch.com",
+            "quantserve.com",
+            "criteo.com",
+            "taboola.com",
+            "outbrain.com",
+        )
+    ),
+}
+
+WAIT_STRATEGIES = ("load", "dom_ready", "network_idle", "selector")
+
+
+def create_chrome_driver() -> WebDriver:
+    """
+    Start a headless Chrome instance.
+
+    Navigation returns at DOMContentLoaded; ``render_page`` then waits
+    for whatever the caller's wait strategy requires.
+    """
+    options = Options()
+    options.add_argument("--headless")
+    options.page_load_strategy = "eager"
+    return webdriver.Chrome(options=options)
+
+
+@dataclass
+class PooledDriver:
+    driver: WebDriver
+    pages: int = 0
+
+
+class DriverPool:
+    """
+    Pool of warm browser instances leased out one fetch at a time.
+
+    At most ``size`` browsers run at once; further leases wait for one to
+    be returned. Returned browsers are reset (cookies, cache and site
+    storage cleared, navigated to about:blank) and reused, and replaced
+    after ``max_pages`` fetches to bound memory growth. All blocking driver
+    calls run in worker threads.
+    """
+
+    def __init__(
+        self,
+        size: int = DEFAULT_POOL_SIZE,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        factory: Callable[[], WebDriver] = create_chrome_driver,
+    ):
+        self.size = max(1, size)
+        self.max_pages = max(1, max_pages)
+        self.factory = factory
+        self._idle: list[PooledDriver] = []
+        self._running = 0
+        self._changed = asyncio.Condition()
+
+    async def _acquire(self) -> PooledDriver:
+        async with self._changed:
+            while not self._idle and self._running >= self.size:
+                await self._changed.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._running += 1
+        try:
+            return PooledDriver(await asyncio.to_thread(self.factory))
+        except BaseException:
+            async with self._changed:
+                self._running -= 1
+                self._changed.notify()
+            raise
+
+    async def _release(self, pooled: PooledDriver, reuse: bool = True) -> None:
+        pooled.pages += 1
+        keep = reuse and pooled.pages < self.max_pages and self._running <= self.size
+        if keep:
+            try:
+                await asyncio.to_thread(_reset_driver, pooled.driver)
+            except Exception as e:
+                log.debug("Discarding browser that failed to reset: %s", e)
+                keep = False
+        if not keep:
+            await asyncio.to_thread(_quit_driver, pooled.driver)
+        async with self._changed:
+            if keep:
+                self._idle.append(pooled)
+            else:
+                self._running -= 1
+            self._changed.notify()
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[WebDriver]:
+        """
+        Borrow a browser for the duration of the ``async with`` block.
+
+        A browser whose block raised or was cancelled is quit instead of
+        reused, since a worker thread may still be driving it.
+        """
+        pooled = await self._acquire()
+        reuse = False
+        try:
+            yield pooled.driver
+            reuse = True
+        finally:
+            await asyncio.shield(self._release(pooled, reuse))
+
+    def close_idle(self) -> None:
+        """
+        Quit all idle browsers. Leased browsers are quit when returned.
+        """
+        idle, self._idle = self._idle, []
+        self._running -= len(idle)
+        for pooled in idle:
+            _quit_driver(pooled.driver)
+
+
+def _reset_driver(driver: WebDriver) -> None:
+    # delete_all_cookies only reaches the current document's origin, so
+    # third-party cookies, the cache and site storage are cleared over CDP.
+    origin = driver.execute_script(
+        "try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}"
+        " return location.origin;"
+    )
+    driver.delete_all_cookies()
+    driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+    if isinstance(origin, str) and origin.startswith("http"):
+        driver.execute_cdp_cmd(
+            "Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"}
+        )
+    driver.get("about:blank")
+    try:
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+    except Exception:
+        pass
+
+
+def _quit_driver(driver: WebDriver) -> None:
+    try:
+        driver.quit()
+    except Exception as e:
+        log.debug("Error quitting browser: %s", e)
+
+
+def block_patterns(
+    images: bool = False,
+    fonts: bool = False,
+    media: bool = False,
+    trackers: bool = False,
+) -> list[str]:
+    """
+    Return the blocked URL patterns for the selected resource groups.
+    """
+    selected = {"images": images, "fonts": fonts, "media": media, "trackers": trackers}
+    return [
+        pattern
+        for group, enabled in selected.items()
+        if enabled
+        for pattern in BLOCK_PATTERNS[group]
+    ]
+
+
+def _wait_network_idle(driver: WebDriver, timeout: float) -> None:
+    # Selenium has no view of in-flight requests, so treat the page as idle
+    # once it has loaded and its resource timing list stops growing.
+    deadline = time.monotonic() + timeout
+    last_count = None
+    stable_since = time.monotonic()
+    while time.monotonic() < deadline:
+        count = driver.execute_script(
+            "return document.readyState === 'complete'"
+            " ? performance.getEntriesByType('resource').length : -1"
+        )
+        now = time.monotonic()
+        if count != last_count:
+            last_count = count
+            stable_since = now
+        elif count >= 0 and now - stable_since >= NETWORK_IDLE_TIME:
+            return
+        time.sleep(POLL_INTERVAL)
+    raise TimeoutException(f"Network did not become idle within {timeout}s")
+
+
+def wait_for_page(
+    driver: WebDriver, wait_for: str, timeout: float, selector: str = ""
+) -> None:
+    """
+    Block until the current page satisfies ``wait_for``, one of
+    WAIT_STRATEGIES.
+    """
+    wait = WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL)
+    if wait_for == "load":
+        wait.until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+    elif wait_for == "dom_ready":
+        wait.until(
+            lambda d: d.execute_script("return document.readyState")
+            in ("interactive", "complete")
+        )
+    elif wait_for == "network_idle":
+        _wait_network_idle(driver, timeout)
+    elif wait_for == "selector":
+        if not selector:
+            raise ValueError("A CSS selector is required for the selector wait")
+        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
+    else:
+        raise ValueError(f"Unknown wait strategy: {wait_for}")
+
+
+def render_page(
+    driver: WebDriver,
+    url: str,
+    wait_for: str = "load",
+    timeout: float = 10,
+    selector: str = "",
+    blocked: Iterable[str] = (),
+) -> str:
+    """
+    Navigate to ``url``, wait for it and return the rendered HTML.
+    """
+    blocked = list(blocked)
+    if blocked:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked})
+    driver.get(url)
+    wait_for_page(driver, wait_for, timeout, selector)
+    return driver.page_source
+
+
+_pools: dict[tuple[asyncio.AbstractEventLoop, int, int], DriverPool] = {}
+
+
+def get_driver_pool(
+    size: int = DEFAULT_POOL_SIZE, max_pages: int = DEFAULT_MAX_PAGES
+) -> DriverPool:
+    """
+    Return the browser pool of the running event loop with the given size
+    and recycling limit. Nodes asking for different settings get separate
+    pools, so one node never resizes the pool another one is using.
+    """
+    loop = asyncio.get_running_loop()
+    for key in [key for key in _pools if key[0].is_closed()]:
+        _pools.pop(key).close_idle()
+    key = (loop, max(1, size), max(1, max_pages))
+    pool = _pools.get(key)
+    if pool is None:
+        pool = _pools[key] = DriverPool(size, max_pages)
+    return pool
+
+
+def close_driver_pools() -> None:
+    """
+    Quit every idle pooled browser.
+    """
+    for pool in _pools.values():
+        pool.close_idle()
+    _pools.clear()
+
+
+atexit.register(close_driver_pools)
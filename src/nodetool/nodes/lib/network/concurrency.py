@@ -0,0 +1,121 @@
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, TypeVar
+from urllib.parse import urlparse
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def url_host(url: str) -> str:
+    """
+    Return the lower-cased host (including port) of a URL.
+    """
+    return urlparse(url).netloc.lower()
+
+
+class WorkPool:
+    """
+    Sliding-window scheduler for async work.
+
+    Keeps up to ``max_concurrency`` calls in flight and starts the next item
+    as soon as any call finishes, so one slow item never holds back the rest.
+    ``max_per_host`` optionally caps how many in-flight calls may share the
+    same host, as computed by ``key``.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        max_per_host: int = 0,
+        key: Callable[[Any], str] = url_host,
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_per_host = max(0, max_per_host)
+        self.key = key
+
+    async def map(
+        self,
+        func: Callable[[T], Awaitable[R]],
+        items: Iterable[T],
+    ) -> AsyncIterator[tuple[int, R]]:
+        """
+        Apply ``func`` to every item and yield ``(index, result)`` pairs in
+        completion order. An exception raised by ``func`` cancels the
+        remaining work and is re-raised to the caller.
+        """
+        # Items are queued per host so a saturated host can be skipped
+        # without scanning every pending item behind it.
+        queues: dict[str, list[tuple[int, T]]] = {}
+        total = 0
+        for index, item in enumerate(items):
+            host = self.key(item) if self.max_per_host else ""
+            queues.setdefault(host, []).append((index, item))
+            total += 1
+        for queue in queues.values():
+            queue.reverse()
+
+        if total == 0:
+            return
+
+        active: dict[str, int] = {}
+        changed = asyncio.Condition()
+        results: asyncio.Queue[tuple[int, Any, BaseException | None]] = asyncio.Queue()
+
+        def take() -> tuple[str, int, T] | None:
+            for host, queue in queues.items():
+                if self.max_per_host and active.get(host, 0) >= self.max_per_host:
+                    continue
+                index, item = queue.pop()
+                if not queue:
+                    del queues[host]
+                active[host] = active.get(host, 0) + 1
+                return host, index, item
+            return None
+
+        async def worker():
+            while True:
+                async with changed:
+                    job = take()
+                    while job is None and queues:
+                        await changed.wait()
+                        job = take()
+                if job is None:
+                    return
+                host, index, item = job
+                try:
+                    results.put_nowait((index, await func(item), None))
+                except Exception as e:
+                    results.put_nowait((index, None, e))
+                finally:
+                    async with changed:
+                        active[host] -= 1
+                        changed.notify_all()
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(self.max_concurrency, total))
+        ]
+        try:
+            for _ in range(total):
+                index, result, error = await results.get()
+                if error is not None:
+                    raise error
+                yield index, result
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def run(
+        self,
+        func: Callable[[T], Awaitable[R]],
+        items: Iterable[T],
+    ) -> list[R]:
+        """
+        Apply ``func`` to every item and return the results in input order.
+        """
+        items = list(items)
+        results: list[Any] = [None] * len(items)
+        async for index, result in self.map(func, items):
+            results[index] = result
+        return results
@@ -0,0 +1,290 @@
+import asyncio
+import json
+import os
+import secrets
+import time
+from dataclasses import dataclass
+from typing import Mapping
+from urllib.parse import unquote, urlparse
+
+import aiohttp
+
+from nodetool.nodes.lib.network.concurrency import WorkPool
+
+CHUNK_SIZE = 64 * 1024
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+def filename_from_response(url: str, headers: Mapping[str, str]) -> str:
+    """
+    Pick a local filename from the Content-Disposition header, falling back
+    to the last path segment of the URL.
+    """
+    filename = headers.get("Content-Disposition")
+    if filename and "filename=" in filename:
+        filename = filename.split("filename=")[-1].split(";")[0].strip("\"' ")
+    else:
+        filename = unquote(urlparse(url).path.split("/")[-1])
+    # Never let a server-supplied name escape the output folder.
+    filename = os.path.basename(filename)
+    return filename or "unnamed_file"
+
+
+async def stream_to_file(
+    response: aiohttp.ClientResponse,
+    filepath: str,
+    chunk_size: int = CHUNK_SIZE,
+    buffer_size: int = WRITE_BUFFER_SIZE,
+) -> int:
+    """
+    Stream a response body to ``filepath`` and return the number of bytes
+    written.
+
+    Chunks are collected into a buffer of at most ``buffer_size`` bytes that
+    is flushed from a worker thread, so memory stays bounded and the event
+    loop never blocks on disk I/O. The body is written to a temporary file
+    next to ``filepath`` and renamed into place only once it is complete.
+    """
+    directory, basename = os.path.split(filepath)
+    tmp_path = os.path.join(directory, f".{basename}.{secrets.token_hex(4)}.tmp")
+    f = await asyncio.to_thread(open, tmp_path, "xb")
+    written = 0
+    try:
+        buffer = bytearray()
+        async for chunk in response.content.iter_chunked(chunk_size):
+            buffer += chunk
+            if len(buffer) >= buffer_size:
+                await asyncio.to_thread(f.write, buffer)
+                written += len(buffer)
+                buffer.clear()
+        if buffer:
+            await asyncio.to_thread(f.write, buffer)
+            written += len(buffer)
+        await asyncio.to_thread(f.close)
+        await asyncio.to_thread(os.replace, tmp_path, filepath)
+    except BaseException:
+        f.close()
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return written
+
+
+PART_SUFFIX = ".part"
+MANIFEST_SUFFIX = ".part.json"
+MIN_PART_SIZE = 1024 * 1024
+MANIFEST_SAVE_INTERVAL = 1.0
+
+
+class RangeNotSatisfied(Exception):
+    """
+    Raised when a server ignores a range request, e.g. because the resource
+    changed since the download started.
+    """
+
+
+@dataclass
+class RangeProbe:
+    """
+    What a HEAD request told us about a resource that supports byte ranges.
+    """
+
+    size: int
+    headers: Mapping[str, str]
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+async def probe_ranges(
+    session: aiohttp.ClientSession, url: str, **kwargs
+) -> RangeProbe | None:
+    """
+    Send a HEAD request and return a RangeProbe if the server advertises
+    ``Accept-Ranges: bytes`` and a Content-Length, otherwise None.
+    """
+    async with session.head(url, allow_redirects=True, **kwargs) as response:
+        if response.status != 200:
+            return None
+        headers = response.headers
+        if "bytes" not in headers.get("Accept-Ranges", "").lower():
+            return None
+        try:
+            size = int(headers.get("Content-Length", ""))
+        except ValueError:
+            return None
+        return RangeProbe(
+            size=size,
+            headers=headers,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
+
+
+def split_ranges(
+    size: int, parts: int, min_part_size: int = MIN_PART_SIZE
+) -> list[tuple[int, int]]:
+    """
+    Split ``size`` bytes into at most ``parts`` inclusive byte ranges of at
+    least ``min_part_size`` bytes each. An empty resource has no ranges.
+    """
+    if size <= 0:
+        return []
+    parts = max(1, min(parts, size // max(1, min_part_size)))
+    step = -(-size // parts)
+    return [(start, min(start + step, size) - 1) for start in range(0, size, step)]
+
+
+def _load_manifest(manifest_path: str, part_path: str) -> dict | None:
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not os.path.exists(part_path):
+        return None
+    return manifest
+
+
+def _save_manifest(manifest_path: str, manifest: dict) -> None:
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, manifest_path)
+
+
+def _preallocate(part_path: str, size: int) -> None:
+    with open(part_path, "wb") as f:
+        f.truncate(size)
+        if hasattr(os, "posix_fallocate") and size > 0:
+            try:
+                os.posix_fallocate(f.fileno(), 0, size)
+            except OSError:
+                # Sparse files are fine on filesystems without fallocate.
+                pass
+
+
+def discard_partial(filepath: str) -> None:
+    """
+    Remove the .part file and manifest left by an unfinished download_ranges.
+    """
+    for path in (filepath + PART_SUFFIX, filepath + MANIFEST_SUFFIX):
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+async def download_ranges(
+    session: aiohttp.ClientSession,
+    url: str,
+    filepath: str,
+    probe: RangeProbe,
+    parts: int = 4,
+    min_part_size: int = MIN_PART_SIZE,
+    chunk_size: int = CHUNK_SIZE,
+    buffer_size: int = WRITE_BUFFER_SIZE,
+    **kwargs,
+) -> int:
+    """
+    Download ``url`` to ``filepath`` using up to ``parts`` concurrent range
+    requests and return the file size.
+
+    Ranges are written at their offsets into a preallocated
+    ``<filepath>.part`` file. Progress is recorded in a
+    ``<filepath>.part.json`` manifest, so calling this again after an
+    interruption only fetches the missing bytes. The manifest is discarded
+    when the remote size, ETag or Last-Modified no longer match.
+    """
+    part_path = filepath + PART_SUFFIX
+    manifest_path = filepath + MANIFEST_SUFFIX
+
+    manifest = await asyncio.to_thread(_load_manifest, manifest_path, part_path)
+    if manifest is None or (
+        manifest.get("url"),
+        manifest.get("size"),
+        manifest.get("etag"),
+        manifest.get("last_modified"),
+    ) != (url, probe.size, probe.etag, probe.last_modified):
+        manifest = {
+            "url": url,
+            "size": probe.size,
+            "etag": probe.etag,
+            "last_modified": probe.last_modified,
+            "ranges": [
+                [start, end, 0]
+                for start, end in split_ranges(probe.size, parts, min_part_size)
+            ],
+        }
+        await asyncio.to_thread(_preallocate, part_path, probe.size)
+        await asyncio.to_thread(_save_manifest, manifest_path, manifest)
+
+    headers = dict(kwargs.pop("headers", None) or {})
+    validator = probe.etag or probe.last_modified
+    if validator:
+        headers["If-Range"] = validator
+
+    save_lock = asyncio.Lock()
+    last_saved = time.monotonic()
+
+    async def save(force: bool = False):
+        nonlocal last_saved
+        async with save_lock:
+            if force or time.monotonic() - last_saved >= MANIFEST_SAVE_INTERVAL:
+                await asyncio.to_thread(_save_manifest, manifest_path, manifest)
+                last_saved = time.monotonic()
+
+    fd = await asyncio.to_thread(os.open, part_path, os.O_RDWR)
+    writes: set[asyncio.Future] = set()
+
+    async def write_at(data: bytearray, offset: int):
+        # Shielded so a cancelled range never leaves a thread writing to a
+        # file descriptor that has already been closed.
+        future = asyncio.get_running_loop().run_in_executor(
+            None, os.pwrite, fd, data, offset
+        )
+        writes.add(future)
+        future.add_done_callback(writes.discard)
+        await asyncio.shield(future)
+
+    async def fetch_range(byte_range: list[int]):
+        start, end, done = byte_range
+        if start + done > end:
+            return
+        range_headers = {**headers, "Range": f"bytes={start + done}-{end}"}
+        async with session.get(url, headers=range_headers, **kwargs) as response:
+            if response.status != 206:
+                raise RangeNotSatisfied(
+                    f"Expected 206 for range request to {url}, got {response.status}"
+                )
+            buffer = bytearray()
+            async for chunk in response.content.iter_chunked(chunk_size):
+                buffer += chunk
+                if len(buffer) >= buffer_size:
+                    await write_at(buffer, start + byte_range[2])
+                    byte_range[2] += len(buffer)
+                    buffer.clear()
+                    await save()
+            if buffer:
+                await write_at(buffer, start + byte_range[2])
+                byte_range[2] += len(buffer)
+        if start + byte_range[2] <= end:
+            raise aiohttp.ClientPayloadError(
+                f"Range {start}-{end} of {url} ended early"
+            )
+
+    pool = WorkPool(max_concurrency=len(manifest["ranges"]))
+    try:
+        await pool.run(fetch_range, manifest["ranges"])
+    except BaseException:
+        await asyncio.gather(*writes, return_exceptions=True)
+        await asyncio.to_thread(os.close, fd)
+        await asyncio.shield(save(force=True))
+        raise
+
+    await asyncio.to_thread(os.fsync, fd)
+    await asyncio.to_thread(os.close, fd)
+    await asyncio.to_thread(os.replace, part_path, filepath)
+    await asyncio.to_thread(os.unlink, manifest_path)
+    return probe.size
@@ -0,0 +1,187 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+from nodetool.nodes.lib.network.sqlite_store import SQLiteStore, StoreSlot
+
+T = TypeVar("T")
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "nodetool", "extraction_cache.sqlite3"
+)
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+# Part of every key. Bump it when extraction output changes so results
+# stored on disk by older versions are not reused.
+CACHE_VERSION = 1
+
+
+class CacheMode(str, Enum):
+    NONE = "none"
+    MEMORY = "memory"
+    DISK = "disk"
+
+
+def memo_key(kind: str, html: str, options: tuple[Hashable, ...] = ()) -> str:
+    """
+    Return the cache key for extracting ``kind`` from ``html`` with
+    ``options``. The document is hashed with BLAKE2b, which is faster than
+    SHA-256 on large inputs.
+    """
+    digest = hashlib.blake2b(
+        html.encode("utf-8", "surrogatepass"), digest_size=16
+    ).hexdigest()
+    return f"{CACHE_VERSION}:{kind}:{digest}:{options!r}"
+
+
+class ExtractionCache(SQLiteStore):
+    """
+    Two-tier cache of extraction results keyed by ``memo_key``.
+
+    The memory tier is an LRU of at most ``max_entries`` results. The disk
+    tier is a SQLite file bounded by ``max_bytes`` of JSON-encoded results,
+    evicting the least recently used first.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS results (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            last_access REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS results_last_access
+            ON results (last_access);
+        """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        path: str = DEFAULT_CACHE_PATH,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        super().__init__(path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: str, default: Any = None) -> Any:
+        """
+        Return a result from the disk tier, or ``default``.
+        """
+        with self._lock:
+            db = self._connect()
+            row = db.execute(
+                "SELECT value FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return default
+            db.execute(
+                "UPDATE results SET last_access = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            db.commit()
+        return json.loads(row[0])
+
+    def store(self, key: str, value: Any) -> None:
+        """
+        Write a JSON-serializable result to the disk tier.
+        """
+        encoded = json.dumps(value)
+        size = len(encoded)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            db = self._connect()
+            db.execute(
+                "INSERT OR REPLACE INTO results (key, value, size, last_access)"
+                " VALUES (?, ?, ?, ?)",
+                (key, encoded, size, time.time()),
+            )
+            self._evict(db, "results", self.max_bytes)
+            db.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            db = self._connect()
+            db.execute("DELETE FROM results")
+            db.commit()
+
+
+_cache = StoreSlot(ExtractionCache)
+_MISSING = object()
+
+
+def get_extraction_cache() -> ExtractionCache:
+    """
+    Return the process-wide extraction cache.
+    """
+    return _cache.get()
+
+
+def configure_extraction_cache(
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+    path: str = DEFAULT_CACHE_PATH,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> ExtractionCache:
+    """
+    Replace the process-wide extraction cache.
+    """
+    return _cache.configure(max_entries, path, max_bytes)
+
+
+async def memoize(
+    mode: CacheMode,
+    kind: str,
+    html: str,
+    options: tuple[Hashable, ...],
+    compute: Callable[[], Awaitable[T]],
+) -> T:
+    """
+    Return the cached result of extracting ``kind`` from ``html`` with
+    ``options``, or await ``compute()`` and cache what it returns.
+
+    With ``CacheMode.MEMORY`` only the in-process LRU is used; with
+    ``CacheMode.DISK`` results also survive restarts. Unchanged pages thus
+    skip parsing entirely on recrawls and workflow re-runs.
+    """
+    if mode == CacheMode.NONE:
+        return await compute()
+    cache = get_extraction_cache()
+    key = memo_key(kind, html, options)
+    result = cache.get(key, _MISSING)
+    if result is not _MISSING:
+        return result
+    if mode == CacheMode.DISK:
+        result = await asyncio.to_thread(cache.lookup, key, _MISSING)
+        if result is not _MISSING:
+            cache.put(key, result)
+            return result
+    result = await compute()
+    cache.put(key, result)
+    if mode == CacheMode.DISK:
+        await asyncio.to_thread(cache.store, key, result)
+    return result
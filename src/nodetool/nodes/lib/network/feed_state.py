@@ -0,0 +1,271 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Mapping
+
+import feedparser
+from feedparser.http import ACCEPT_HEADER
+from multidict import CIMultiDict
+
+from nodetool.nodes.lib.network.sessions import pooled_request
+from nodetool.nodes.lib.network.sqlite_store import SQLiteStore, StoreSlot
+
+DEFAULT_STATE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "nodetool", "feed_state.sqlite3"
+)
+DEFAULT_MAX_SEEN = 5000
+# Keys per lookup query, below SQLite's limit on bound parameters.
+LOOKUP_CHUNK = 500
+# Sent like feedparser does when it fetches a URL itself, since some
+# servers refuse or vary on unknown clients.
+FEED_HEADERS = {"User-Agent": feedparser.USER_AGENT, "Accept": ACCEPT_HEADER}
+
+
+@dataclass
+class FeedState:
+    """
+    What is remembered about a feed between polls: the validators of the
+    last response and the entries and metadata parsed from it. ``error``
+    describes an HTTP error the feed was fetched with; such states are
+    never stored.
+    """
+
+    url: str
+    etag: str | None = None
+    modified: str | None = None
+    entries: list[dict[str, Any]] = field(default_factory=list)
+    metadata: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+
+def entry_key(entry: dict[str, Any]) -> str:
+    """
+    Identify an entry by its GUID, falling back to its link, then to its
+    title and publication date.
+    """
+    identity = (
+        entry.get("id")
+        or entry.get("link")
+        or f"{entry.get('title', '')}\n{entry.get('published_parsed')}"
+    )
+    return hashlib.sha1(identity.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def _entry_dict(entry: Any) -> dict[str, Any]:
+    published = entry.get("published_parsed")
+    return {
+        "id": entry.get("id", ""),
+        "title": entry.get("title", ""),
+        "link": entry.get("link", ""),
+        "published_parsed": list(published[:6]) if published else None,
+        "summary": entry.get("summary", ""),
+        "author": entry.get("author", ""),
+    }
+
+
+def parse_feed(
+    url: str, data: Any, headers: Mapping[str, str] | None = None
+) -> FeedState:
+    """
+    Parse a feed document fetched with response ``headers`` (or, for
+    non-HTTP sources, let feedparser read ``data`` itself) into a FeedState.
+    """
+    headers = CIMultiDict(headers or {})
+    parsed = feedparser.parse(
+        data, response_headers={k.lower(): v for k, v in headers.items()}
+    )
+    return FeedState(
+        url=url,
+        etag=headers.get("ETag"),
+        modified=headers.get("Last-Modified"),
+        entries=[_entry_dict(entry) for entry in parsed.entries],
+        metadata={
+            "title": parsed.feed.get("title", ""),
+            "description": parsed.feed.get("description", ""),
+            "link": parsed.feed.get("link", ""),
+            "language": parsed.feed.get("language", ""),
+            "updated": parsed.feed.get("updated", ""),
+            "generator": parsed.feed.get("generator", ""),
+            "entry_count": len(parsed.entries),
+        },
+    )
+
+
+class FeedStateStore(SQLiteStore):
+    """
+    SQLite store of per-feed state and of the entries already reported for
+    each feed. At most ``max_seen`` entry keys are kept per feed, dropping
+    those that have not been in the feed for the longest time.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS feeds (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            modified TEXT,
+            entries TEXT NOT NULL,
+            metadata TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS seen (
+            url TEXT NOT NULL,
+            key TEXT NOT NULL,
+            seen_at REAL NOT NULL,
+            PRIMARY KEY (url, key)
+        );
+        """
+
+    def __init__(
+        self, path: str = DEFAULT_STATE_PATH, max_seen: int = DEFAULT_MAX_SEEN
+    ):
+        super().__init__(path)
+        self.max_seen = max_seen
+
+    def load(self, url: str) -> FeedState | None:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT etag, modified, entries, metadata FROM feeds"
+                    " WHERE url = ?",
+                    (url,),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+        etag, modified, entries, metadata = row
+        return FeedState(url, etag, modified, json.loads(entries), json.loads(metadata))
+
+    def save(self, state: FeedState) -> None:
+        with self._lock:
+            db = self._connect()
+            db.execute(
+                "INSERT OR REPLACE INTO feeds (url, etag, modified, entries, metadata)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (
+                    state.url,
+                    state.etag,
+                    state.modified,
+                    json.dumps(state.entries),
+                    json.dumps(state.metadata),
+                ),
+            )
+            db.commit()
+
+    def mark_seen(self, url: str, keys: list[str]) -> list[bool]:
+        """
+        Record ``keys`` as seen for ``url`` and return, for each key, whether
+        it had not been seen before.
+        """
+        known: set[str] = set()
+        with self._lock:
+            db = self._connect()
+            for start in range(0, len(keys), LOOKUP_CHUNK):
+                chunk = keys[start : start + LOOKUP_CHUNK]
+                known.update(
+                    row[0]
+                    for row in db.execute(
+                        "SELECT key FROM seen WHERE url = ?"
+                        f" AND key IN ({','.join('?' * len(chunk))})",
+                        (url, *chunk),
+                    )
+                )
+            now = time.time()
+            db.executemany(
+                "INSERT INTO seen (url, key, seen_at) VALUES (?, ?, ?)"
+                " ON CONFLICT (url, key) DO UPDATE SET seen_at = excluded.seen_at",
+                [(url, key, now) for key in keys],
+            )
+            db.execute(
+                "DELETE FROM seen WHERE url = ? AND key NOT IN"
+                " (SELECT key FROM seen WHERE url = ?"
+                " ORDER BY seen_at DESC, rowid DESC LIMIT ?)",
+                (url, url, self.max_seen),
+            )
+            db.commit()
+        return [key not in known for key in keys]
+
+    def forget(self, url: str) -> None:
+        with self._lock:
+            db = self._connect()
+            db.execute("DELETE FROM feeds WHERE url = ?", (url,))
+            db.execute("DELETE FROM seen WHERE url = ?", (url,))
+            db.commit()
+
+
+_store = StoreSlot(FeedStateStore)
+
+
+def get_feed_state_store() -> FeedStateStore:
+    """
+    Return the process-wide feed state store.
+    """
+    return _store.get()
+
+
+def configure_feed_state_store(
+    path: str = DEFAULT_STATE_PATH, max_seen: int = DEFAULT_MAX_SEEN
+) -> FeedStateStore:
+    """
+    Replace the process-wide feed state store.
+    """
+    return _store.configure(path, max_seen)
+
+
+async def fetch_feed(
+    url: str, store: FeedStateStore | None = None
+) -> tuple[FeedState, bool]:
+    """
+    Fetch and parse a feed over the shared session.
+
+    The request sends feedparser's User-Agent and Accept headers. With a
+    ``store``, it also carries the ETag and Last-Modified of the previous
+    response, and a 304 Not Modified answer returns the stored state
+    without parsing anything. Returns the state and whether the feed
+    changed since the last fetch. Non-HTTP sources such as local files are
+    read by feedparser and always count as changed.
+
+    Like feedparser fetching the URL itself, HTTP errors are not raised:
+    the error page is parsed, usually into an empty feed, and returned
+    unchanged with ``error`` set.
+    """
+    if not url.startswith(("http://", "https://")):
+        return await asyncio.to_thread(parse_feed, url, url), True
+
+    previous = await asyncio.to_thread(store.load, url) if store else None
+    headers = dict(FEED_HEADERS)
+    if previous is not None:
+        if previous.etag:
+            headers["If-None-Match"] = previous.etag
+        if previous.modified:
+            headers["If-Modified-Since"] = previous.modified
+
+    response = await pooled_request("GET", url, raise_for_status=False, headers=headers)
+    if response.status == 304 and previous is not None:
+        return previous, False
+
+    state = await asyncio.to_thread(parse_feed, url, response.content, response.headers)
+    if response.status >= 400:
+        state.etag = state.modified = None
+        state.error = f"HTTP {response.status} fetching {url}"
+        return state, False
+    if store is not None:
+        await asyncio.to_thread(store.save, state)
+    return state, True
+
+
+async def new_entries(
+    store: FeedStateStore, state: FeedState, changed: bool = True
+) -> list[dict[str, Any]]:
+    """
+    Return the entries of ``state`` not reported by an earlier call for the
+    same feed, and remember them as reported.
+    """
+    if not changed or not state.entries:
+        return []
+    keys = [entry_key(entry) for entry in state.entries]
+    fresh = await asyncio.to_thread(store.mark_seen, state.url, keys)
+    return [entry for entry, is_new in zip(state.entries, fresh) if is_new]
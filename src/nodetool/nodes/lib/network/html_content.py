@@ -0,0 +1,317 @@
+import re
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from bs4 import BeautifulSoup, CData, NavigableString, PageElement, Tag
+
+# Subtrees that never hold main content.
+NON_CONTENT_TAGS = frozenset(
+    [
+        "script",
+        "style",
+        "noscript",
+        "template",
+        "nav",
+        "header",
+        "footer",
+        "aside",
+        "form",
+        "button",
+        "select",
+        "iframe",
+        "video",
+        "audio",
+        "object",
+        "embed",
+        "svg",
+        "canvas",
+    ]
+)
+# Blocks whose text is scored and credited to their parent and grandparent.
+PARAGRAPH_TAGS = frozenset(["p", "pre", "td", "blockquote"])
+BLOCK_TAGS = frozenset(
+    [
+        "address",
+        "article",
+        "aside",
+        "blockquote",
+        "dd",
+        "div",
+        "dl",
+        "dt",
+        "figure",
+        "footer",
+        "form",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "header",
+        "li",
+        "main",
+        "nav",
+        "ol",
+        "p",
+        "pre",
+        "section",
+        "table",
+        "td",
+        "th",
+        "tr",
+        "ul",
+    ]
+)
+TAG_SCORES = {
+    "article": 5,
+    "main": 5,
+    "div": 5,
+    "section": 3,
+    "pre": 3,
+    "td": 3,
+    "blockquote": 3,
+    "address": -3,
+    "ol": -3,
+    "ul": -3,
+    "dl": -3,
+    "dd": -3,
+    "dt": -3,
+    "li": -3,
+    "form": -3,
+    "h1": -5,
+    "h2": -5,
+    "h3": -5,
+    "h4": -5,
+    "h5": -5,
+    "h6": -5,
+    "th": -5,
+}
+POSITIVE_NAMES = re.compile(
+    r"article|body|content|entry|main|page|post|text|blog|story", re.I
+)
+NEGATIVE_NAMES = re.compile(
+    r"comment|contact|foot|masthead|meta|promo|related|share|sidebar|"
+    r"sponsor|shopping|tags|widget|\bads?\b",
+    re.I,
+)
+# Subtrees with these class or id names are skipped unless they also look
+# like content.
+UNLIKELY_NAMES = re.compile(
+    r"banner|breadcrumbs|comment|community|disqus|footer|header|menu|"
+    r"related|replies|share|shoutbox|sidebar|social|sponsor|popup|"
+    r"pagination|pager|cookie|gdpr|\bads?\b",
+    re.I,
+)
+MAYBE_NAMES = re.compile(r"and|article|body|column|content|main", re.I)
+
+MIN_PARAGRAPH_LENGTH = 25
+SIBLING_SCORE_RATIO = 0.2
+MIN_SIBLING_SCORE = 10
+# A wrapper scoring nearly as high as the block it contains, such as the
+# story container holding the headline and the story body, replaces it.
+PARENT_SCORE_RATIO = 0.75
+
+
+def _names(tag: Tag) -> str:
+    classes = tag.get("class") or []
+    if not isinstance(classes, str):
+        classes = " ".join(classes)
+    return f"{classes} {tag.get('id') or ''}"
+
+
+def class_weight(tag: Tag) -> int:
+    """
+    Return +25 for class or id names that suggest content, -25 for names
+    that suggest boilerplate, or their sum when both match.
+    """
+    names = _names(tag)
+    weight = 0
+    if POSITIVE_NAMES.search(names):
+        weight += 25
+    if NEGATIVE_NAMES.search(names):
+        weight -= 25
+    return weight
+
+
+def is_boilerplate(tag: Tag) -> bool:
+    """
+    Tell whether the subtree of ``tag`` is left out of scoring and text.
+    """
+    if tag.name in NON_CONTENT_TAGS:
+        return True
+    if tag.name in ("html", "body", "a", "main", "article"):
+        return False
+    names = _names(tag)
+    return bool(UNLIKELY_NAMES.search(names)) and not MAYBE_NAMES.search(names)
+
+
+@dataclass
+class Candidate:
+    tag: Tag
+    score: float
+    text_length: int = 0
+    link_length: int = 0
+
+    @property
+    def link_density(self) -> float:
+        return self.link_length / self.text_length if self.text_length else 0.0
+
+    @property
+    def final_score(self) -> float:
+        return self.score * (1 - self.link_density)
+
+
+@dataclass
+class _Frame:
+    tag: Tag
+    children: Iterator[PageElement]
+    text_length: int = 0
+    link_length: int = 0
+    commas: int = 0
+    has_blocks: bool = False
+    in_link: bool = False
+
+
+@dataclass
+class ContentScores:
+    """
+    Scores of every candidate block of a page, built by ``score_document``.
+    """
+
+    candidates: dict[int, Candidate] = field(default_factory=dict)
+
+    def candidate(self, tag: Tag) -> Candidate:
+        key = id(tag)
+        if key not in self.candidates:
+            self.candidates[key] = Candidate(
+                tag, TAG_SCORES.get(tag.name, 0) + class_weight(tag)
+            )
+        return self.candidates[key]
+
+    def get(self, tag: Tag) -> Candidate | None:
+        return self.candidates.get(id(tag))
+
+    def best(self) -> Candidate | None:
+        return max(self.candidates.values(), key=lambda c: c.final_score, default=None)
+
+
+def score_document(root: Tag) -> ContentScores:
+    """
+    Score candidate blocks in one walk over the tree.
+
+    Every paragraph-like block with enough text credits its parent with
+    1 point, 1 per comma and 1 per 100 characters (at most 3), and its
+    grandparent with half of that. Each candidate also records its text
+    and link-text length so its link density is known without walking it
+    again. Boilerplate subtrees are not entered.
+    """
+    scores = ContentScores()
+    stack = [_Frame(root, iter(root.children))]
+    while stack:
+        frame = stack[-1]
+        child = next(frame.children, None)
+        if child is None:
+            stack.pop()
+            tag = frame.tag
+            candidate = scores.get(tag)
+            if candidate is not None:
+                candidate.text_length = frame.text_length
+                candidate.link_length = frame.link_length
+            if not stack:
+                break
+            parent = stack[-1]
+            parent.text_length += frame.text_length
+            parent.link_length += frame.link_length
+            parent.commas += frame.commas
+            if tag.name in BLOCK_TAGS:
+                parent.has_blocks = True
+            is_paragraph = tag.name in PARAGRAPH_TAGS or (
+                tag.name == "div" and not frame.has_blocks
+            )
+            if is_paragraph and frame.text_length >= MIN_PARAGRAPH_LENGTH:
+                points = 1 + frame.commas + min(frame.text_length // 100, 3)
+                scores.candidate(parent.tag).score += points
+                if len(stack) > 1:
+                    scores.candidate(stack[-2].tag).score += points / 2
+        elif isinstance(child, Tag):
+            if not is_boilerplate(child):
+                stack.append(
+                    _Frame(
+                        child,
+                        iter(child.children),
+                        in_link=frame.in_link or child.name == "a",
+                    )
+                )
+        elif type(child) in (NavigableString, CData):
+            text = child.strip()
+            frame.text_length += len(text)
+            frame.commas += text.count(",")
+            if frame.in_link:
+                frame.link_length += len(text)
+    return scores
+
+
+def _visible_text(element: Tag, parts: list[str]) -> None:
+    stack = [iter(element.children)]
+    while stack:
+        child = next(stack[-1], None)
+        if child is None:
+            stack.pop()
+        elif isinstance(child, Tag):
+            if not is_boilerplate(child):
+                if child.name in BLOCK_TAGS:
+                    # Keep the text of adjacent blocks such as table cells
+                    # apart.
+                    parts.append(" ")
+                stack.append(iter(child.children))
+        elif type(child) in (NavigableString, CData):
+            parts.append(str(child))
+
+
+def main_content(soup: BeautifulSoup) -> list[Tag]:
+    """
+    Return the blocks that make up the main content of a page, in document
+    order: the best scoring candidate, or a wrapper around it that scores
+    nearly as high, and any sibling candidates that score close to it.
+    Falls back to the body, or an empty list.
+    """
+    root = soup.body or soup
+    scores = score_document(root)
+    best = scores.best()
+    if best is None:
+        return [soup.body] if soup.body else []
+    parent = scores.get(best.tag.parent) if best.tag.parent else None
+    while (
+        parent is not None
+        and parent.final_score >= best.final_score * PARENT_SCORE_RATIO
+    ):
+        best = parent
+        parent = scores.get(best.tag.parent) if best.tag.parent else None
+    if best.tag.parent is None:
+        return [best.tag]
+    threshold = max(MIN_SIBLING_SCORE, best.final_score * SIBLING_SCORE_RATIO)
+    blocks = []
+    for sibling in best.tag.parent.children:
+        if sibling is best.tag:
+            blocks.append(sibling)
+        elif isinstance(sibling, Tag):
+            candidate = scores.get(sibling)
+            if candidate is not None and candidate.final_score >= threshold:
+                blocks.append(sibling)
+    return blocks
+
+
+def main_content_text(soup: BeautifulSoup) -> str:
+    """
+    Return the whitespace-normalized text of the main content of a page,
+    or "No main content found".
+    """
+    blocks = main_content(soup)
+    if not blocks:
+        return "No main content found"
+    parts: list[str] = []
+    for block in blocks:
+        _visible_text(block, parts)
+        parts.append(" ")
+    return " ".join("".join(parts).split())
@@ -0,0 +1,233 @@
+import asyncio
+import atexit
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Sequence, TypeVar
+
+from nodetool.nodes.lib.network.html_content import main_content_text
+from nodetool.nodes.lib.network.html_parsing import (
+    LinkTable,
+    ParserBackend,
+    find_audio_urls,
+    find_image_urls,
+    find_metadata,
+    find_video_urls,
+    get_document_cache,
+    link_table,
+    parse_html,
+    resolve_parser,
+)
+from nodetool.nodes.lib.network.html_stream import iter_media_links
+
+T = TypeVar("T")
+
+# More chunks than workers keeps every worker busy when documents differ
+# in size.
+CHUNKS_PER_WORKER = 4
+
+
+@dataclass(frozen=True)
+class ExecutorConfig:
+    """
+    Settings for the worker process pool used for large HTML documents.
+    """
+
+    max_workers: int = os.cpu_count() or 1
+    # Documents smaller than this are parsed inline, where the pickling
+    # round trip would cost more than the parse itself.
+    inline_threshold: int = 256 * 1024
+
+
+_config = ExecutorConfig()
+_pool: ProcessPoolExecutor | None = None
+
+
+def configure_html_executor(**kwargs: Any) -> ExecutorConfig:
+    """
+    Update the executor settings. A running pool is shut down and replaced
+    on next use.
+    """
+    global _config
+    _config = replace(_config, **kwargs)
+    shutdown_html_executor()
+    return _config
+
+
+def _init_worker() -> None:
+    # Workers see each document once, so caching trees only costs memory.
+    get_document_cache().max_bytes = 0
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=max(1, _config.max_workers),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+    return _pool
+
+
+def shutdown_html_executor() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+atexit.register(shutdown_html_executor)
+
+
+async def run_cpu_bound(
+    func: Callable[..., T], *args: Any, size: int, offload: bool = True
+) -> T:
+    """
+    Run ``func(*args)`` in the worker pool if ``offload`` is set and the
+    input ``size`` reaches the inline threshold, otherwise call it inline.
+    ``func`` and its arguments must be picklable.
+    """
+    if not offload or size < _config.inline_threshold:
+        return func(*args)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_process_pool(), func, *args)
+
+
+def _apply_chunk(func: Callable[..., T], chunk: list[tuple]) -> list[T]:
+    return [func(*args) for args in chunk]
+
+
+async def map_cpu_bound(
+    func: Callable[..., T],
+    items: Sequence[tuple],
+    sizes: Sequence[int],
+    offload: bool = True,
+) -> list[T]:
+    """
+    Call ``func(*args)`` for every tuple in ``items`` and return the results
+    in order. With ``offload`` and a combined input size at or above the
+    inline threshold, the items are sent to the worker pool in contiguous
+    chunks, a few per worker, so each round trip carries many documents.
+    """
+    if not offload or sum(sizes) < _config.inline_threshold:
+        return [func(*args) for args in items]
+    workers = max(1, _config.max_workers)
+    chunk_size = max(1, -(-len(items) // (workers * CHUNKS_PER_WORKER)))
+    loop = asyncio.get_running_loop()
+    pool = get_process_pool()
+    chunks = await asyncio.gather(
+        *(
+            loop.run_in_executor(
+                pool, _apply_chunk, func, list(items[start : start + chunk_size])
+            )
+            for start in range(0, len(items), chunk_size)
+        )
+    )
+    return [result for chunk in chunks for result in chunk]
+
+
+_TREE_EXTRACTORS: dict[str, Callable[..., Any]] = {
+    "links": link_table,
+    "images": find_image_urls,
+    "videos": find_video_urls,
+    "audio": find_audio_urls,
+    "metadata": lambda soup, base_url: find_metadata(soup),
+    "content": lambda soup, base_url: main_content_text(soup),
+}
+_STREAM_KINDS = {
+    "links": "link",
+    "images": "image",
+    "videos": "video",
+    "audio": "audio",
+}
+
+
+def extract_html_task(
+    kind: str,
+    html: bytes | str,
+    base_url: str = "",
+    parser: str = ParserBackend.AUTO,
+    streaming: bool = False,
+) -> Any:
+    """
+    Run one extraction over a document and return plain Python results.
+
+    ``kind`` is one of links, images, videos, audio, metadata or content.
+    With ``streaming`` the tokenizer is used instead of a document tree,
+    which is only supported for links and media. The selectolax backend has
+    its own extraction path for everything but content. Links are returned
+    as a LinkTable, everything else as lists, dicts or strings.
+    """
+    if isinstance(html, bytes):
+        html = html.decode("utf-8", "surrogatepass")
+    if streaming:
+        if kind not in _STREAM_KINDS:
+            raise ValueError(f"Streaming extraction does not support {kind}")
+        events = iter_media_links(html, base_url, [_STREAM_KINDS[kind]])
+        values = [value for _, value in events]
+        if kind == "links":
+            table = LinkTable(base_url)
+            table.extend(values)
+            return table
+        return values
+    if kind != "content" and resolve_parser(parser) == ParserBackend.SELECTOLAX:
+        from nodetool.nodes.lib.network import html_selectolax
+
+        return html_selectolax.extract(kind, html, base_url)
+    return _TREE_EXTRACTORS[kind](parse_html(html, parser), base_url)
+
+
+async def extract_html(
+    kind: str,
+    html: str,
+    base_url: str = "",
+    parser: str = ParserBackend.AUTO,
+    streaming: bool = False,
+    offload: bool = False,
+) -> Any:
+    """
+    Run ``extract_html_task``, sending large documents to the worker pool
+    when ``offload`` is set. Offloaded documents travel as UTF-8 bytes.
+    """
+    if not offload or len(html) < _config.inline_threshold:
+        return extract_html_task(kind, html, base_url, parser, streaming)
+    return await run_cpu_bound(
+        extract_html_task,
+        kind,
+        html.encode("utf-8", "surrogatepass"),
+        base_url,
+        # Resolved here since workers do not see configure_html_parser().
+        resolve_parser(parser),
+        streaming,
+        size=len(html),
+    )
+
+
+async def extract_html_many(
+    kind: str,
+    documents: Sequence[str],
+    base_urls: Sequence[str] = (),
+    parser: str = ParserBackend.AUTO,
+    streaming: bool = False,
+    offload: bool = True,
+) -> list[Any]:
+    """
+    Run ``extract_html_task`` over many documents and return one result per
+    document, in input order. ``base_urls`` is either empty or aligned with
+    ``documents``.
+    """
+    if base_urls and len(base_urls) != len(documents):
+        raise ValueError("base_urls must be empty or have one entry per document")
+    urls = base_urls or [""] * len(documents)
+    parser = resolve_parser(parser)
+    return await map_cpu_bound(
+        extract_html_task,
+        [
+            (kind, html, base_url, parser, streaming)
+            for html, base_url in zip(documents, urls)
+        ],
+        [len(html) for html in documents],
+        offload,
+    )
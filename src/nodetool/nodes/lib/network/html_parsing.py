@@ -0,0 +1,384 @@
+import hashlib
+import importlib.util
+import logging
+import threading
+from collections import OrderedDict
+from enum import Enum
+from functools import cache, lru_cache
+from operator import itemgetter
+from typing import Iterable
+from urllib.parse import urljoin, urlsplit
+
+import numpy as np
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+
+log = logging.getLogger(__name__)
+
+DEFAULT_PARSER = "html.parser"
+DEFAULT_MAX_ENTRIES = 32
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class ParserBackend(str, Enum):
+    AUTO = "auto"
+    SELECTOLAX = "selectolax"
+    LXML = "lxml"
+    HTML_PARSER = "html.parser"
+
+
+# Optional module each backend needs, in order of preference for "auto".
+PARSER_MODULES = {
+    ParserBackend.SELECTOLAX: "selectolax",
+    ParserBackend.LXML: "lxml",
+    ParserBackend.HTML_PARSER: None,
+}
+
+_default_backend = ParserBackend.AUTO
+
+
+@cache
+def parser_available(parser: str) -> bool:
+    module = PARSER_MODULES[ParserBackend(parser)]
+    return module is None or importlib.util.find_spec(module) is not None
+
+
+def configure_html_parser(parser: str) -> None:
+    """
+    Set the backend used by extractors whose parser is "auto".
+    """
+    global _default_backend
+    _default_backend = ParserBackend(parser)
+
+
+def resolve_parser(parser: str = ParserBackend.AUTO) -> str:
+    """
+    Return the backend to use for ``parser``. "auto" picks the process
+    default, or the fastest installed backend; a backend whose dependency
+    is missing falls back to the built-in html.parser.
+    """
+    backend = ParserBackend(parser)
+    if backend is ParserBackend.AUTO:
+        backend = _default_backend
+    if backend is ParserBackend.AUTO:
+        backend = next(b for b in PARSER_MODULES if parser_available(b))
+    elif not parser_available(backend):
+        _warn_missing(backend)
+        backend = ParserBackend.HTML_PARSER
+    return backend.value
+
+
+def tree_builder(parser: str = ParserBackend.AUTO) -> str:
+    """
+    Return the BeautifulSoup tree builder to use for ``parser``. selectolax
+    is not a tree builder, so extractors that need a BeautifulSoup tree use
+    the fastest installed one instead.
+    """
+    backend = resolve_parser(parser)
+    if backend == ParserBackend.SELECTOLAX:
+        backend = next(
+            b.value
+            for b in PARSER_MODULES
+            if b is not ParserBackend.SELECTOLAX and parser_available(b)
+        )
+    return backend
+
+
+@cache
+def _warn_missing(backend: ParserBackend) -> None:
+    log.warning(
+        "%s parser requested but %s is not installed, using html.parser",
+        backend.value,
+        PARSER_MODULES[backend],
+    )
+
+
+class DocumentCache:
+    """
+    LRU cache of parsed HTML documents keyed by a hash of their content.
+
+    Several extractor nodes are usually wired to the same page, so the page
+    is parsed once and the tree is shared. Entries are evicted once either
+    ``max_entries`` documents or ``max_bytes`` of source HTML are cached.
+    Cached trees are shared and must not be modified by callers.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, str], tuple[BeautifulSoup, int]] = (
+            OrderedDict()
+        )
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(html: str, parser: str) -> tuple[str, str]:
+        digest = hashlib.sha256(html.encode("utf-8", "surrogatepass")).hexdigest()
+        return digest, parser
+
+    def get(self, html: str, parser: str = DEFAULT_PARSER) -> BeautifulSoup:
+        """
+        Return the parsed document for ``html``, parsing it on a miss.
+        """
+        key = self._key(html, parser)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[0]
+
+        soup = BeautifulSoup(html, parser)
+        size = len(html)
+        if size > self.max_bytes:
+            return soup
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (soup, size)
+                self._bytes += size
+                self._evict()
+        return soup
+
+    def _evict(self) -> None:
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+_cache = DocumentCache()
+
+
+def parse_html(html: str, parser: str = ParserBackend.AUTO) -> BeautifulSoup:
+    """
+    Parse ``html`` through the process-wide document cache. The returned
+    tree may be shared with other callers and must be treated as read-only.
+    """
+    return _cache.get(html, tree_builder(parser))
+
+
+def get_document_cache() -> DocumentCache:
+    return _cache
+
+
+def text_content(element: Tag, skip: frozenset[str] = frozenset()) -> str:
+    """
+    Concatenate the text of ``element`` like ``get_text()``, leaving out
+    the subtrees of tags named in ``skip``. Unlike removing those tags
+    first, this leaves the (possibly shared) tree untouched.
+    """
+    parts: list[str] = []
+    stack = [iter(element.children)]
+    while stack:
+        child = next(stack[-1], None)
+        if child is None:
+            stack.pop()
+        elif isinstance(child, Tag):
+            if child.name not in skip:
+                stack.append(iter(child.children))
+        elif type(child) in (NavigableString, CData):
+            parts.append(str(child))
+    return "".join(parts)
+
+
+LINK_COLUMNS = ("href", "text", "type", "url", "host", "path", "rel")
+LINK_DTYPE = np.dtypes.StringDType()
+# Links buffered as tuples before they are packed into a string array.
+CHUNK_ROWS = 4096
+_record_values = itemgetter(*LINK_COLUMNS)
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+@lru_cache(maxsize=1024)
+def _host(url: str) -> str:
+    parts = urlsplit(url)
+    host = parts.hostname or ""
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port is not None and port != DEFAULT_PORTS.get(parts.scheme.lower()):
+        host = f"{host}:{port}"
+    return host
+
+
+def _remove_dot_segments(path: str) -> str:
+    output: list[str] = []
+    for segment in path.split("/"):
+        if segment == "..":
+            if len(output) > 1:
+                output.pop()
+        elif segment != ".":
+            output.append(segment)
+    if path.endswith(("/.", "/..")):
+        output.append("")
+    return "/".join(output)
+
+
+@lru_cache(maxsize=4096)
+def resolve_link(href: str, base_url: str = "") -> tuple[str, str, str, str]:
+    """
+    Resolve ``href`` against ``base_url`` and return its absolute URL,
+    normalized host, normalized path and type. The type is "internal" when
+    the link points to the host of ``base_url``, "external" when it points
+    elsewhere and "other" for non-HTTP links such as mailto: or javascript:.
+    """
+    url = urljoin(base_url, href.strip())
+    parts = urlsplit(url)
+    if parts.scheme and parts.scheme.lower() not in DEFAULT_PORTS:
+        return url, "", "", "other"
+    host = _host(url)
+    path = _remove_dot_segments(parts.path) or "/"
+    return url, host, path, "internal" if host == _host(base_url) else "external"
+
+
+class LinkTable:
+    """
+    Links of one or more pages stored in numpy string arrays with one
+    column per entry of LINK_COLUMNS. Rows are buffered as tuples and packed
+    into a new array every CHUNK_ROWS links, so a large crawl holds no
+    Python object per link. Columns are read as arrays through attributes
+    named after LINK_COLUMNS.
+    """
+
+    def __init__(self, base_url: str = ""):
+        self.base_url = base_url
+        self._chunks: list[np.ndarray] = []
+        self._pending: list[tuple[str, ...]] = []
+
+    def _push(self, row: tuple[str, ...]) -> None:
+        self._pending.append(row)
+        if len(self._pending) >= CHUNK_ROWS:
+            self._pack()
+
+    def _pack(self) -> None:
+        if self._pending:
+            self._chunks.append(np.array(self._pending, dtype=LINK_DTYPE))
+            self._pending = []
+
+    def append(self, href: str, text: str, rel: str = "") -> None:
+        url, host, path, link_type = resolve_link(href, self.base_url)
+        self._push((href, text, link_type, url, host, path, rel))
+
+    def extend(self, records: Iterable[dict[str, str]]) -> None:
+        for row in map(_record_values, records):
+            self._push(row)
+
+    def array(self) -> np.ndarray:
+        """
+        Return the links as one (rows, columns) string array.
+        """
+        self._pack()
+        if not self._chunks:
+            return np.empty((0, len(LINK_COLUMNS)), dtype=LINK_DTYPE)
+        return np.concatenate(self._chunks)
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        if name not in LINK_COLUMNS:
+            raise AttributeError(name)
+        index = LINK_COLUMNS.index(name)
+        self._pack()
+        return np.concatenate(
+            [chunk[:, index] for chunk in self._chunks]
+            or [np.empty(0, dtype=LINK_DTYPE)]
+        )
+
+    def columns(self) -> list[np.ndarray]:
+        return [getattr(self, column) for column in LINK_COLUMNS]
+
+    def rows(self) -> list[list[str]]:
+        self._pack()
+        return [row for chunk in self._chunks for row in chunk.tolist()]
+
+    def records(self) -> list[dict[str, str]]:
+        return [dict(zip(LINK_COLUMNS, row)) for row in self.rows()]
+
+    def __len__(self) -> int:
+        return sum(map(len, self._chunks)) + len(self._pending)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, LinkTable):
+            return NotImplemented
+        return self.base_url == other.base_url and np.array_equal(
+            self.array(), other.array()
+        )
+
+
+def link_record(href: str, text: str, rel: str = "", base_url: str = "") -> dict:
+    """
+    Return a single link as a dict with the LINK_COLUMNS keys.
+    """
+    url, host, path, link_type = resolve_link(href, base_url)
+    return dict(zip(LINK_COLUMNS, (href, text, link_type, url, host, path, rel)))
+
+
+def link_table(soup: BeautifulSoup, base_url: str = "") -> LinkTable:
+    """
+    Collect every link of a page into a LinkTable in one pass.
+    """
+    table = LinkTable(base_url)
+    for a in soup.find_all("a", href=True):
+        rel = a.get("rel") or []
+        table.append(
+            a["href"], a.text.strip(), " ".join(rel) if isinstance(rel, list) else rel
+        )
+    return table
+
+
+def find_links(soup: BeautifulSoup, base_url: str = "") -> list[dict[str, str]]:
+    """
+    Return every link as a dict with the LINK_COLUMNS keys.
+    """
+    return link_table(soup, base_url).records()
+
+
+def find_metadata(soup: BeautifulSoup) -> dict[str, str | None]:
+    """
+    Return the title, description and keywords of a page.
+    """
+    metadata: dict[str, str | None] = {
+        "title": str(soup.title.string) if soup.title and soup.title.string else None
+    }
+    for name in ("description", "keywords"):
+        meta = soup.find("meta", attrs={"name": name})
+        metadata[name] = meta["content"] if meta else None  # type: ignore
+    return metadata
+
+
+def find_image_urls(soup: BeautifulSoup, base_url: str = "") -> list[str]:
+    return [
+        urljoin(base_url, img["src"]) for img in soup.find_all("img") if img.get("src")
+    ]
+
+
+def find_video_urls(soup: BeautifulSoup, base_url: str = "") -> list[str]:
+    urls = []
+    for video in soup.find_all(["video", "iframe"]):
+        if video.name == "video":
+            src = video.get("src") or (video.source and video.source.get("src"))
+        else:  # iframe
+            src = video.get("src")
+        if src:
+            urls.append(urljoin(base_url, src))
+    return urls
+
+
+def find_audio_urls(soup: BeautifulSoup, base_url: str = "") -> list[str]:
+    return [
+        urljoin(base_url, audio["src"])
+        for audio in soup.find_all(["audio", "source"])
+        if audio.get("src")
+    ]
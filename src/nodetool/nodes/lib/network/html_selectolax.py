@@ -0,0 +1,91 @@
+"""
+Extraction path for the selectolax backend.
+
+selectolax wraps the lexbor C parser and is not a BeautifulSoup tree
+builder, so links, media and metadata are read from its own node API here.
+The results match the ``find_*`` helpers in html_parsing. Main content
+extraction scores a BeautifulSoup tree and has no selectolax path.
+"""
+
+from typing import Any, Callable
+from urllib.parse import urljoin
+
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+
+from nodetool.nodes.lib.network.html_parsing import LinkTable
+
+
+def _src(node: LexborNode) -> str:
+    return node.attributes.get("src") or ""
+
+
+def link_table(tree: LexborHTMLParser, base_url: str = "") -> LinkTable:
+    table = LinkTable(base_url)
+    for a in tree.css("a[href]"):
+        attributes = a.attributes
+        table.append(
+            attributes["href"] or "",
+            a.text(deep=True).strip(),
+            " ".join((attributes.get("rel") or "").split()),
+        )
+    return table
+
+
+def find_metadata(tree: LexborHTMLParser) -> dict[str, str | None]:
+    title = tree.css_first("title")
+    metadata: dict[str, str | None] = {"title": (title and title.text()) or None}
+    for name in ("description", "keywords"):
+        metadata[name] = next(
+            (
+                meta.attributes.get("content")
+                for meta in tree.css("meta[name]")
+                if meta.attributes["name"] == name
+            ),
+            None,
+        )
+    return metadata
+
+
+def find_image_urls(tree: LexborHTMLParser, base_url: str = "") -> list[str]:
+    return [urljoin(base_url, _src(img)) for img in tree.css("img") if _src(img)]
+
+
+def _walk(tree: LexborHTMLParser, tags: frozenset[str]):
+    # traverse() keeps document order across tag names, unlike a CSS group.
+    return (node for node in tree.root.traverse() if node.tag in tags)
+
+
+def find_video_urls(tree: LexborHTMLParser, base_url: str = "") -> list[str]:
+    urls = []
+    for node in _walk(tree, frozenset(["video", "iframe"])):
+        src = _src(node)
+        if not src and node.tag == "video":
+            source = node.css_first("source")
+            src = _src(source) if source is not None else ""
+        if src:
+            urls.append(urljoin(base_url, src))
+    return urls
+
+
+def find_audio_urls(tree: LexborHTMLParser, base_url: str = "") -> list[str]:
+    return [
+        urljoin(base_url, _src(node))
+        for node in _walk(tree, frozenset(["audio", "source"]))
+        if _src(node)
+    ]
+
+
+EXTRACTORS: dict[str, Callable[..., Any]] = {
+    "links": link_table,
+    "images": find_image_urls,
+    "videos": find_video_urls,
+    "audio": find_audio_urls,
+    "metadata": lambda tree, base_url: find_metadata(tree),
+}
+
+
+def extract(kind: str, html: str, base_url: str = "") -> Any:
+    """
+    Parse ``html`` with selectolax and run the extractor for ``kind``.
+    """
+    return EXTRACTORS[kind](LexborHTMLParser(html), base_url)
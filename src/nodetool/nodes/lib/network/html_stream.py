@@ -0,0 +1,147 @@
+import codecs
+from html.parser import HTMLParser
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator
+from urllib.parse import urljoin
+
+from nodetool.nodes.lib.network.html_parsing import link_record
+
+KINDS = frozenset(["link", "image", "video", "audio"])
+CHUNK_SIZE = 64 * 1024
+
+
+class MediaLinkParser(HTMLParser):
+    """
+    Incremental tokenizer that reports links, images, videos and audio
+    sources as their tags go by, without building a document tree.
+
+    Feed it text with ``push`` in chunks of any size; each call returns the
+    ``(kind, value)`` events completed so far. Links are reported as dicts
+    with the LINK_COLUMNS keys, media as absolute URLs. The results match
+    ``find_links`` and the ``find_*_urls`` helpers. Memory use is bounded
+    by the largest unfinished tag or link text, not by the page size.
+    """
+
+    def __init__(self, base_url: str = "", kinds: Iterable[str] = KINDS):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.kinds = frozenset(kinds)
+        self._events: list[tuple[str, Any]] = []
+        self._href: str | None = None
+        self._text: list[str] = []
+        self._rel = ""
+        self._video_without_src = False
+
+    def _emit(self, kind: str, value: Any) -> None:
+        if kind in self.kinds:
+            self._events.append((kind, value))
+
+    def _emit_url(self, kind: str, src: str) -> None:
+        if kind in self.kinds:
+            self._events.append((kind, urljoin(self.base_url, src)))
+
+    def _finish_link(self) -> None:
+        if self._href is not None:
+            self._emit(
+                "link",
+                link_record(
+                    self._href, "".join(self._text).strip(), self._rel, self.base_url
+                ),
+            )
+        self._href = None
+        self._text = []
+        self._rel = ""
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        values = {name: value or "" for name, value in attrs}
+        src = values.get("src")
+        if tag == "a":
+            self._finish_link()
+            if "href" in values and "link" in self.kinds:
+                self._href = values["href"]
+                self._rel = " ".join(values.get("rel", "").split())
+        elif tag == "img":
+            if src:
+                self._emit_url("image", src)
+        elif tag == "iframe":
+            if src:
+                self._emit_url("video", src)
+        elif tag == "video":
+            if src:
+                self._emit_url("video", src)
+            else:
+                self._video_without_src = True
+        elif tag == "audio":
+            if src:
+                self._emit_url("audio", src)
+        elif tag == "source":
+            if self._video_without_src:
+                # Only the first <source> of a <video> counts as its URL.
+                self._video_without_src = False
+                if src:
+                    self._emit_url("video", src)
+            if src:
+                self._emit_url("audio", src)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "a":
+            self._finish_link()
+        elif tag == "video":
+            self._video_without_src = False
+
+    def handle_data(self, data: str) -> None:
+        if self._href is not None:
+            self._text.append(data)
+
+    def push(self, data: str) -> list[tuple[str, Any]]:
+        """
+        Feed the next chunk of text and return the events it completed.
+        """
+        self.feed(data)
+        events, self._events = self._events, []
+        return events
+
+    def finish(self) -> list[tuple[str, Any]]:
+        """
+        Flush buffered input at the end of the document.
+        """
+        self.close()
+        self._finish_link()
+        events, self._events = self._events, []
+        return events
+
+
+def iter_media_links(
+    html: str,
+    base_url: str = "",
+    kinds: Iterable[str] = KINDS,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[tuple[str, Any]]:
+    """
+    Yield ``(kind, value)`` events for a complete HTML string.
+    """
+    parser = MediaLinkParser(base_url, kinds)
+    for start in range(0, len(html), chunk_size):
+        yield from parser.push(html[start : start + chunk_size])
+    yield from parser.finish()
+
+
+async def stream_media_links(
+    chunks: AsyncIterable[bytes],
+    base_url: str = "",
+    encoding: str = "utf-8",
+    kinds: Iterable[str] = KINDS,
+) -> AsyncIterator[tuple[str, Any]]:
+    """
+    Yield ``(kind, value)`` events from HTML arriving as byte chunks, for
+    example a streaming HTTP response body.
+    """
+    try:
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    parser = MediaLinkParser(base_url, kinds)
+    async for chunk in chunks:
+        for event in parser.push(decoder.decode(chunk)):
+            yield event
+    for event in parser.push(decoder.decode(b"", final=True)) + parser.finish():
+        yield event
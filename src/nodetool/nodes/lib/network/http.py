@@ -1,14 +1,18 @@
 import asyncio
+import logging
 import os
+from enum import Enum
 from typing import Any
 from urllib.parse import urljoin
 import aiohttp
 from pydantic import Field
 from nodetool.metadata.types import (
+    AudioRef,
     DataframeRef,
     DocumentRef,
     FilePath,
     ImageRef,
+    VideoRef,
 )
 from nodetool.workflows.base_node import BaseNode
 from nodetool.workflows.processing_context import ProcessingContext
@@ -17,20 +21,104 @@ from pydantic import Field
 from nodetool.metadata.types import DataframeRef, ImageRef
 from nodetool.workflows.base_node import BaseNode
 from nodetool.workflows.processing_context import ProcessingContext
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 
 from nodetool.workflows.types import NodeProgress
+from nodetool.nodes.lib.network.browser import (
+    DriverPool,
+    block_patterns,
+    get_driver_pool,
+    render_page,
+)
+from nodetool.nodes.lib.network.concurrency import WorkPool, url_host
+from nodetool.nodes.lib.network.sessions import (
+    PooledResponse,
+    get_session,
+    pooled_request,
+)
+from nodetool.nodes.lib.network.http_cache import cached_get, get_http_cache
+from nodetool.nodes.lib.network.retry import RetryPolicy, RetryStats, with_retry
+from nodetool.nodes.lib.network.rate_limit import (
+    TokenBucket,
+    get_rate_limiter,
+    send_limited,
+)
+from nodetool.nodes.lib.network.html_stream import stream_media_links
+from nodetool.nodes.lib.network.downloads import (
+    CHUNK_SIZE,
+    RangeNotSatisfied,
+    discard_partial,
+    download_ranges,
+    filename_from_response,
+    probe_ranges,
+    split_ranges,
+    stream_to_file,
+)
 
+log = logging.getLogger(__name__)
 
-class HTTPBaseNode(BaseNode):
+
+class RetryingNode(BaseNode):
+    """
+    Base for nodes that retry transient HTTP failures with exponential
+    backoff.
+    """
+
+    max_retries: int = Field(
+        default=3,
+        description="Maximum number of retries for transient failures such as 429, 502, 503 or connection resets.",
+    )
+    retry_backoff: float = Field(
+        default=0.5,
+        description="Base delay in seconds for exponential backoff between retries.",
+    )
+    retry_backoff_max: float = Field(
+        default=30.0,
+        description="Maximum delay in seconds between retries.",
+    )
+
+    @classmethod
+    def is_visible(cls) -> bool:
+        return cls is not RetryingNode
+
+    def get_retry_policy(self) -> RetryPolicy:
+        return RetryPolicy(
+            max_attempts=self.max_retries + 1,
+            backoff_base=self.retry_backoff,
+            backoff_max=self.retry_backoff_max,
+        )
+
+
+class RateLimitedNode(RetryingNode):
+    """
+    Base for retrying nodes that also throttle requests per host.
+    """
+
+    requests_per_second: float = Field(
+        default=0.0,
+        description="Maximum requests per second to each host, shared by all nodes in this process (0 for no limit). Lowered automatically on 429 or X-RateLimit headers.",
+    )
+    rate_limit_burst: int = Field(
+        default=1,
+        description="Number of requests that may be sent back to back before the per-host rate limit applies.",
+    )
+
+    @classmethod
+    def is_visible(cls) -> bool:
+        return cls is not RateLimitedNode
+
+    def get_rate_limiter(self, url: str) -> TokenBucket | None:
+        return get_rate_limiter(url, self.requests_per_second, self.rate_limit_burst)
+
+
+class HTTPBaseNode(RateLimitedNode):
     url: str = Field(
         default="",
         description="The URL to make the request to.",
     )
+    use_connection_pool: bool = Field(
+        default=False,
+        description="Send the request over the shared keep-alive connection pool.",
+    )
 
     @classmethod
     def is_visible(cls) -> bool:
@@ -43,8 +131,63 @@ class HTTPBaseNode(BaseNode):
     def get_basic_fields(cls):
         return ["url"]
 
+    def get_rate_limiter(self, url: str | None = None) -> TokenBucket | None:
+        return super().get_rate_limiter(url or self.url)
+
+    async def send_request(
+        self, context: ProcessingContext, method: str, **kwargs: Any
+    ) -> Any:
+        limiter = self.get_rate_limiter()
+
+        async def attempt() -> Any:
+            return await send_limited(
+                limiter,
+                lambda: self.send_request_once(context, method, **kwargs),
+                lambda res: (getattr(res, "status_code", None), res.headers),
+            )
+
+        stats = RetryStats()
+        res = await with_retry(
+            self.get_retry_policy().for_method(method), attempt, stats
+        )
+        if stats.retries:
+            log.info(
+                "%s %s succeeded after %d retries", method, self.url, stats.retries
+            )
+        return res
+
+    async def send_request_once(
+        self, context: ProcessingContext, method: str, **kwargs: Any
+    ) -> Any:
+        if self.use_connection_pool:
+            return await pooled_request(method, self.url, **kwargs)
+        send = getattr(context, f"http_{method.lower()}")
+        return await send(self.url, **kwargs)
 
-class GetRequest(HTTPBaseNode):
+
+class HTTPGetNode(HTTPBaseNode):
+    use_cache: bool = Field(
+        default=False,
+        description="Cache responses on disk and revalidate them with ETag/Last-Modified instead of downloading unchanged content again.",
+    )
+
+    @classmethod
+    def is_visible(cls) -> bool:
+        return cls is not HTTPGetNode
+
+    async def send_request_once(
+        self, context: ProcessingContext, method: str, **kwargs: Any
+    ) -> Any:
+        if (
+            self.use_cache
+            and method == "GET"
+            and "Range" not in kwargs.get("headers", {})
+        ):
+            return await cached_get(get_http_cache(), self.url, **kwargs)
+        return await super().send_request_once(context, method, **kwargs)
+
+
+class GetRequest(HTTPGetNode):
     """
     Perform an HTTP GET request to retrieve data from a specified URL.
     http, get, request, url
@@ -61,7 +204,7 @@ class GetRequest(HTTPBaseNode):
         return "GET Request"
 
     async def process(self, context: ProcessingContext) -> str:
-        res = await context.http_get(self.url, **self.get_request_kwargs())
+        res = await self.send_request(context, "GET", **self.get_request_kwargs())
         return res.content.decode(res.encoding or "utf-8")
 
 
@@ -87,8 +230,8 @@ class PostRequest(HTTPBaseNode):
     )
 
     async def process(self, context: ProcessingContext) -> str:
-        res = await context.http_post(
-            self.url, data=self.data, **self.get_request_kwargs()
+        res = await self.send_request(
+            context, "POST", data=self.data, **self.get_request_kwargs()
         )
         return res.content.decode(res.encoding or "utf-8")
 
@@ -115,8 +258,8 @@ class PutRequest(HTTPBaseNode):
     )
 
     async def process(self, context: ProcessingContext) -> str:
-        res = await context.http_put(
-            self.url, data=self.data, **self.get_request_kwargs()
+        res = await self.send_request(
+            context, "PUT", data=self.data, **self.get_request_kwargs()
         )
         return res.content.decode(res.encoding or "utf-8")
 
@@ -138,7 +281,7 @@ class DeleteRequest(HTTPBaseNode):
         return "DELETE Request"
 
     async def process(self, context: ProcessingContext) -> str:
-        res = await context.http_delete(self.url, **self.get_request_kwargs())
+        res = await self.send_request(context, "DELETE", **self.get_request_kwargs())
         return res.content.decode(res.encoding or "utf-8")
 
 
@@ -158,7 +301,7 @@ class HeadRequest(HTTPBaseNode):
         return "HEAD Request"
 
     async def process(self, context: ProcessingContext) -> dict[str, str]:
-        res = await context.http_head(self.url, **self.get_request_kwargs())
+        res = await self.send_request(context, "HEAD", **self.get_request_kwargs())
         return dict(res.headers.items())
 
 
@@ -182,6 +325,15 @@ class FetchPage(BaseNode):
         description="Maximum time to wait for page load (in seconds).",
     )
 
+    max_browsers: int = Field(
+        default=2,
+        description="Maximum number of pooled browser instances shared by page fetches in this workflow run.",
+    )
+    pages_per_browser: int = Field(
+        default=50,
+        description="Number of pages a pooled browser renders before it is restarted.",
+    )
+
     @classmethod
     def return_type(cls):
         return {
@@ -191,19 +343,12 @@ class FetchPage(BaseNode):
         }
 
     async def process(self, context: ProcessingContext):
-        options = Options()
-        options.add_argument("--headless")
-        driver = webdriver.Chrome(options=options)
-        html = ""
-
+        pool = get_driver_pool(self.max_browsers, self.pages_per_browser)
         try:
-            driver.get(self.url)
-            WebDriverWait(driver, self.wait_time).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-
-            html = driver.page_source
-
+            async with pool.lease() as driver:
+                html = await asyncio.to_thread(
+                    render_page, driver, self.url, "load", self.wait_time
+                )
             return {
                 "html": html,
                 "success": True,
@@ -211,15 +356,127 @@ class FetchPage(BaseNode):
             }
         except Exception as e:
             return {
-                "html": html,
+                "html": "",
                 "success": False,
                 "error_message": str(e),
             }
-        finally:
-            driver.quit()
 
 
-class ImageDownloader(BaseNode):
+class FetchPages(BaseNode):
+    """
+    Render many web pages with pooled headless browsers and stream the HTML of each as it finishes.
+    selenium, fetch, webpage, batch, scraping, stream
+
+    Results are emitted in completion order as dicts with the input index,
+    url, html, success and error_message of each page.
+
+    Use cases:
+    - Scrape JavaScript-rendered pages in bulk
+    - Skip images, fonts, media and trackers to render pages faster
+    - Wait for a specific element instead of a fixed page load
+    """
+
+    class WaitFor(str, Enum):
+        LOAD = "load"
+        DOM_READY = "dom_ready"
+        NETWORK_IDLE = "network_idle"
+        SELECTOR = "selector"
+
+    urls: list[str] = Field(
+        default=[],
+        description="The URLs of the pages to fetch.",
+    )
+    wait_for: WaitFor = Field(
+        default=WaitFor.LOAD,
+        description="When a page counts as rendered: on load, at DOM ready, once the network is idle, or when the CSS selector matches.",
+    )
+    selector: str = Field(
+        default="",
+        description="CSS selector to wait for when wait_for is 'selector'.",
+    )
+    wait_time: int = Field(
+        default=10,
+        description="Maximum time to wait for each page (in seconds).",
+    )
+    block_images: bool = Field(
+        default=True,
+        description="Do not load images.",
+    )
+    block_fonts: bool = Field(
+        default=True,
+        description="Do not load web fonts.",
+    )
+    block_media: bool = Field(
+        default=True,
+        description="Do not load audio and video.",
+    )
+    block_trackers: bool = Field(
+        default=True,
+        description="Do not load common analytics and advertising scripts.",
+    )
+    max_browsers: int = Field(
+        default=4,
+        description="Maximum number of pooled browser instances rendering pages at once.",
+    )
+    pages_per_browser: int = Field(
+        default=50,
+        description="Number of pages a pooled browser renders before it is restarted.",
+    )
+
+    @classmethod
+    def get_title(cls):
+        return "Fetch Pages"
+
+    @classmethod
+    def return_type(cls):
+        return {
+            "result": dict,
+        }
+
+    async def fetch(
+        self, pool: DriverPool, url: str, blocked: list[str]
+    ) -> dict[str, Any]:
+        try:
+            async with pool.lease() as driver:
+                html = await asyncio.to_thread(
+                    render_page,
+                    driver,
+                    url,
+                    self.wait_for.value,
+                    self.wait_time,
+                    self.selector,
+                    blocked,
+                )
+            return {"url": url, "html": html, "success": True, "error_message": None}
+        except Exception as e:
+            return {"url": url, "html": "", "success": False, "error_message": str(e)}
+
+    async def gen_process(self, context: ProcessingContext):
+        if self.wait_for == self.WaitFor.SELECTOR and not self.selector:
+            raise ValueError("A CSS selector is required when waiting for a selector")
+        blocked = block_patterns(
+            images=self.block_images,
+            fonts=self.block_fonts,
+            media=self.block_media,
+            trackers=self.block_trackers,
+        )
+        pool = get_driver_pool(self.max_browsers, self.pages_per_browser)
+        num_completed = 0
+        async for index, result in WorkPool(self.max_browsers).map(
+            lambda url: self.fetch(pool, url, blocked), self.urls
+        ):
+            num_completed += 1
+            context.post_message(
+                NodeProgress(
+                    node_id=self.id,
+                    progress=num_completed,
+                    total=len(self.urls),
+                )
+            )
+            yield "result", {"index": index, **result}
+
+
+class ImageDownloader(RateLimitedNode):
     """
     Download images from list of URLs and return a list of ImageRefs.
     image download, web scraping, data processing
@@ -242,12 +499,17 @@ class ImageDownloader(BaseNode):
         default=10,
         description="Maximum number of concurrent image downloads.",
     )
+    max_concurrent_per_host: int = Field(
+        default=0,
+        description="Maximum number of concurrent downloads from a single host (0 for no limit).",
+    )
 
     @classmethod
     def return_type(cls):
         return {
             "images": list[ImageRef],
             "failed_urls": list[str],
+            "retries": int,
         }
 
     async def download_image(
@@ -255,57 +517,51 @@ class ImageDownloader(BaseNode):
         session: aiohttp.ClientSession,
         url: str,
         context: ProcessingContext,
+        stats: RetryStats | None = None,
     ) -> tuple[ImageRef | None, str | None]:
-        try:
+        policy = self.get_retry_policy()
+        limiter = self.get_rate_limiter(url)
+
+        async def fetch() -> tuple[int, Any, bytes | None]:
             async with session.get(url) as response:
-                if response.status == 200:
-                    content = await response.read()
-                    image_ref = await context.image_from_bytes(content)
-                    return image_ref, None
-                else:
-                    error_msg = f"Failed to download image from {url}. Status code: {response.status}"
-                    print(error_msg)
-                    return None, url
+                body = await response.read() if response.status == 200 else None
+                return response.status, response.headers, body
+
+        async def attempt() -> bytes:
+            status, headers, body = await send_limited(
+                limiter, fetch, lambda res: (res[0], res[1])
+            )
+            if body is not None:
+                return body
+            policy.check_status(status, headers, url)
+            raise ValueError(f"Status code: {status}")
+
+        try:
+            content = await with_retry(policy, attempt, stats)
+            image_ref = await context.image_from_bytes(content)
+            return image_ref, None
         except Exception as e:
-            error_msg = f"Error downloading image from {url}: {str(e)}"
-            print(error_msg)
+            log.warning("Error downloading image from %s: %s", url, e)
             return None, url
 
     async def process(self, context: ProcessingContext):
-        images = []
-        failed_urls = []
-
-        async with aiohttp.ClientSession() as session:
-            tasks = []
-            for src in self.images:
-                url = urljoin(self.base_url, src)
-                task = self.download_image(session, url, context)
-                tasks.append(task)
-
-                if len(tasks) >= self.max_concurrent_downloads:
-                    completed = await asyncio.gather(*tasks)
-                    for img, failed_url in completed:
-                        if img is not None:
-                            images.append(img)
-                        if failed_url is not None:
-                            failed_urls.append(failed_url)
-                    tasks = []
-
-            if tasks:
-                completed = await asyncio.gather(*tasks)
-                for img, failed_url in completed:
-                    if img is not None:
-                        images.append(img)
-                    if failed_url is not None:
-                        failed_urls.append(failed_url)
+        urls = [urljoin(self.base_url, src) for src in self.images]
+        pool = WorkPool(self.max_concurrent_downloads, self.max_concurrent_per_host)
+        stats = RetryStats()
+
+        session = await get_session()
+        completed = await pool.run(
+            lambda url: self.download_image(session, url, context, stats), urls
+        )
 
         return {
-            "images": images,
-            "failed_urls": failed_urls,
+            "images": [img for img, _ in completed if img is not None],
+            "failed_urls": [url for _, url in completed if url is not None],
+            "retries": stats.retries,
         }
 
 
-class GetRequestBinary(HTTPBaseNode):
+class GetRequestBinary(HTTPGetNode):
     """
     Perform an HTTP GET request and return raw binary data.
     http, get, request, url, binary, download
@@ -317,16 +573,69 @@ class GetRequestBinary(HTTPBaseNode):
     - Download any non-text content
     """
 
+    connections: int = Field(
+        default=1,
+        description="Number of parallel range requests to split the download into when the server supports them.",
+    )
+
     @classmethod
     def get_title(cls):
         return "GET Binary"
 
+    async def fetch_ranges(self, context: ProcessingContext) -> bytearray | None:
+        head = await self.send_request(context, "HEAD", **self.get_request_kwargs())
+        if "bytes" not in head.headers.get("Accept-Ranges", "").lower():
+            return None
+        try:
+            size = int(head.headers.get("Content-Length", ""))
+        except ValueError:
+            return None
+
+        ranges = split_ranges(size, self.connections)
+        if len(ranges) < 2:
+            return None
+
+        headers = {}
+        validator = head.headers.get("ETag") or head.headers.get("Last-Modified")
+        if validator:
+            headers["If-Range"] = validator
+
+        buffer = bytearray(size)
+
+        async def fetch_range(byte_range: tuple[int, int]):
+            start, end = byte_range
+            res = await self.send_request(
+                context,
+                "GET",
+                headers={**headers, "Range": f"bytes={start}-{end}"},
+                **self.get_request_kwargs(),
+            )
+            if (
+                "Content-Range" not in res.headers
+                or len(res.content) != end - start + 1
+            ):
+                raise RangeNotSatisfied(f"Server ignored range request to {self.url}")
+            buffer[start : end + 1] = res.content
+
+        await WorkPool(max_concurrency=len(ranges)).run(fetch_range, ranges)
+        # Returned as is: bytes(buffer) would hold the body in memory twice.
+        return buffer
+
     async def process(self, context: ProcessingContext) -> bytes:
-        res = await context.http_get(self.url, **self.get_request_kwargs())
+        if self.connections > 1:
+            try:
+                content = await self.fetch_ranges(context)
+            except RangeNotSatisfied:
+                # The server ignored Range or the resource changed between
+                # requests; a single GET still returns a consistent body.
+                content = None
+            if content is not None:
+                return content
+        res = await self.send_request(context, "GET", **self.get_request_kwargs())
         return res.content
 
 
-class GetRequestDocument(HTTPBaseNode):
+class GetRequestDocument(HTTPGetNode):
     """
     Perform an HTTP GET request and return a document
     http, get, request, url, document
@@ -343,7 +652,7 @@ class GetRequestDocument(HTTPBaseNode):
         return "GET Document"
 
     async def process(self, context: ProcessingContext) -> DocumentRef:
-        res = await context.http_get(self.url, **self.get_request_kwargs())
+        res = await self.send_request(context, "GET", **self.get_request_kwargs())
         return DocumentRef(data=res.content)
 
 
@@ -369,8 +678,8 @@ class PostRequestBinary(HTTPBaseNode):
     )
 
     async def process(self, context: ProcessingContext) -> bytes:
-        res = await context.http_post(
-            self.url, data=self.data, **self.get_request_kwargs()
+        res = await self.send_request(
+            context, "POST", data=self.data, **self.get_request_kwargs()
         )
         return res.content
 
@@ -398,47 +707,56 @@ class FilterValidURLs(HTTPBaseNode):
         default=10,
         description="Maximum number of concurrent HEAD requests.",
     )
+    max_concurrent_per_host: int = Field(
+        default=0,
+        description="Maximum number of concurrent HEAD requests to a single host (0 for no limit).",
+    )
 
     async def check_url(
         self,
         session: aiohttp.ClientSession,
         url: str,
+        stats: RetryStats | None = None,
     ) -> tuple[str, bool]:
-        try:
+        limiter = self.get_rate_limiter(url)
+
+        async def head() -> tuple[int, Any]:
             async with session.head(
                 url,
                 allow_redirects=True,
                 **self.get_request_kwargs(),
             ) as response:
-                is_valid = 200 <= response.status < 400
-                return url, is_valid
+                return response.status, response.headers
+
+        async def attempt() -> tuple[int, Any]:
+            return await send_limited(limiter, head, lambda res: res)
+
+        try:
+            status, _ = await with_retry(
+                self.get_retry_policy(), attempt, stats, status_of=lambda res: res
+            )
+            is_valid = 200 <= status < 400
+            return url, is_valid
         except Exception:
             return url, False
 
     async def process(self, context: ProcessingContext) -> list[str]:
-        results = []
-
-        async with aiohttp.ClientSession() as session:
-            tasks = []
-            for url in self.urls:
-                task = self.check_url(session, url)
-                tasks.append(task)
+        pool = WorkPool(self.max_concurrent_requests, self.max_concurrent_per_host)
+        stats = RetryStats()
 
-                if len(tasks) >= self.max_concurrent_requests:
-                    completed = await asyncio.gather(*tasks)
-                    results.extend(completed)
-                    tasks = []
-
-            if tasks:
-                completed = await asyncio.gather(*tasks)
-                results.extend(completed)
+        session = await get_session()
+        results = await pool.run(
+            lambda url: self.check_url(session, url, stats), self.urls
+        )
+        if stats.retries:
+            log.info("Checking %d URLs took %d retries", len(self.urls), stats.retries)
 
         valid_urls = [url for url, is_valid in results if is_valid]
 
         return valid_urls
 
 
-class DownloadFiles(BaseNode):
+class DownloadFiles(RetryingNode):
     """
     Download files from a list of URLs into a local folder.
     download, files, urls, batch
@@ -470,95 +788,266 @@ class DownloadFiles(BaseNode):
         default=5,
         description="Maximum number of concurrent downloads.",
     )
+    max_concurrent_per_host: int = Field(
+        default=0,
+        description="Maximum number of concurrent downloads from a single host (0 for no limit).",
+    )
+    connections_per_file: int = Field(
+        default=1,
+        description="Number of parallel range requests per file when the server supports them. Interrupted downloads resume from the partial .part file.",
+    )
 
     async def download_file(
         self,
         session: aiohttp.ClientSession,
         url: str,
+        stats: RetryStats | None = None,
     ) -> str:
-        try:
+        policy = self.get_retry_policy()
+        expanded_path = os.path.expanduser(self.output_folder.path)
+
+        async def attempt() -> str:
+            if self.connections_per_file > 1:
+                probe = await probe_ranges(session, url, **self.get_request_kwargs())
+                if probe is not None:
+                    filename = filename_from_response(url, probe.headers)
+                    filepath = os.path.join(expanded_path, filename)
+                    # Retried attempts resume from the .part manifest.
+                    try:
+                        await download_ranges(
+                            session,
+                            url,
+                            filepath,
+                            probe,
+                            parts=self.connections_per_file,
+                            **self.get_request_kwargs(),
+                        )
+                        return filepath
+                    except RangeNotSatisfied:
+                        # Fall back to a single stream; the partial ranges
+                        # may belong to an older version of the resource.
+                        await asyncio.to_thread(discard_partial, filepath)
+
             async with session.get(url, **self.get_request_kwargs()) as response:
                 if response.status == 200:
-                    # Extract filename from URL or Content-Disposition header
-                    filename = response.headers.get("Content-Disposition")
-                    if filename and "filename=" in filename:
-                        filename = filename.split("filename=")[-1].strip("\"'")
-                    else:
-                        filename = url.split("/")[-1]
-                        if not filename:
-                            filename = "unnamed_file"
-
-                    expanded_path = os.path.expanduser(self.output_folder.path)
-                    os.makedirs(os.path.dirname(expanded_path), exist_ok=True)
-
+                    filename = filename_from_response(url, response.headers)
                     filepath = os.path.join(expanded_path, filename)
-                    content = await response.read()
-
-                    with open(filepath, "wb") as f:
-                        f.write(content)
+                    await stream_to_file(response, filepath)
 
                     return filepath
-                else:
-                    return ""
+                policy.check_status(response.status, response.headers, url)
+                raise ValueError(f"Status code: {response.status}")
+
+        try:
+            await asyncio.to_thread(os.makedirs, expanded_path, exist_ok=True)
+            return await with_retry(policy, attempt, stats)
         except Exception as e:
+            log.warning("Error downloading file from %s: %s", url, e)
             return ""
 
     @classmethod
     def return_type(cls):
         return {
-            "success": list[str],
+            "successful": list[str],
             "failed": list[str],
+            "retries": int,
         }
 
     async def process(self, context: ProcessingContext):
-        successful = []
-        failed = []
-
-        async with aiohttp.ClientSession() as session:
-            tasks = []
-            num_completed = 0
-            for url in self.urls:
-                task = self.download_file(session, url)
-                tasks.append(task)
-
-                if len(tasks) >= self.max_concurrent_downloads:
-                    completed = await asyncio.gather(*tasks)
-                    num_completed += len(completed)
-                    context.post_message(
-                        NodeProgress(
-                            node_id=self.id,
-                            progress=num_completed,
-                            total=len(self.urls),
-                        )
-                    )
-                    for filepath in completed:
-                        if filepath:
-                            successful.append(filepath)
-                        else:
-                            failed.append(url)
-                    tasks = []
-
-            if tasks:
-                completed = await asyncio.gather(*tasks)
-                num_completed += len(completed)
-                context.post_message(
-                    NodeProgress(
-                        node_id=self.id,
-                        progress=num_completed,
-                        total=len(self.urls),
-                    )
+        pool = WorkPool(self.max_concurrent_downloads, self.max_concurrent_per_host)
+        filepaths = [""] * len(self.urls)
+        num_completed = 0
+        stats = RetryStats()
+
+        session = await get_session()
+        async for index, filepath in pool.map(
+            lambda url: self.download_file(session, url, stats), self.urls
+        ):
+            filepaths[index] = filepath
+            num_completed += 1
+            context.post_message(
+                NodeProgress(
+                    node_id=self.id,
+                    progress=num_completed,
+                    total=len(self.urls),
+                )
+            )
+
+        return {
+            "successful": [filepath for filepath in filepaths if filepath],
+            "failed": [
+                url for url, filepath in zip(self.urls, filepaths) if not filepath
+            ],
+            "retries": stats.retries,
+        }
+
+
+class BatchRequest(RateLimitedNode):
+    """
+    Send many HTTP requests concurrently and stream each result as it completes.
+    http, batch, request, url, concurrent, stream
+
+    Results are emitted in completion order as dicts with the input index,
+    url, status, headers, content, error and retries of each request.
+
+    Use cases:
+    - Fetch thousands of API endpoints in a single node
+    - Crawl a list of pages without one node run per URL
+    - Start downstream processing before the whole batch finishes
+    """
+
+    urls: list[str] = Field(
+        default=[],
+        description="List of URLs to request.",
+    )
+    method: str = Field(
+        default="GET",
+        description="HTTP method used for the entries in urls.",
+    )
+    requests: list[dict] = Field(
+        default=[],
+        description="Request specs with a url and optional method, headers, data and json keys. Sent after the entries in urls.",
+    )
+    max_concurrent_requests: int = Field(
+        default=10,
+        description="Maximum number of concurrent requests.",
+    )
+    max_concurrent_per_host: int = Field(
+        default=0,
+        description="Maximum number of concurrent requests to a single host (0 for no limit).",
+    )
+
+    @classmethod
+    def get_title(cls):
+        return "Batch Request"
+
+    @classmethod
+    def return_type(cls):
+        return {
+            "result": dict,
+        }
+
+    def get_request_specs(self) -> list[dict]:
+        specs = [{"url": url, "method": self.method} for url in self.urls]
+        for spec in self.requests:
+            if not spec.get("url"):
+                raise ValueError("Every request spec needs a url")
+            specs.append(spec)
+        return specs
+
+    async def send(self, spec: dict) -> dict[str, Any]:
+        url = spec["url"]
+        method = spec.get("method", "GET").upper()
+        kwargs = {key: spec[key] for key in ("headers", "data", "json") if key in spec}
+        limiter = self.get_rate_limiter(url)
+
+        async def attempt() -> PooledResponse:
+            return await send_limited(
+                limiter,
+                lambda: pooled_request(method, url, raise_for_status=False, **kwargs),
+                lambda res: (res.status, res.headers),
+            )
+
+        stats = RetryStats()
+        try:
+            res = await with_retry(
+                self.get_retry_policy().for_method(method),
+                attempt,
+                stats,
+                status_of=lambda res: (res.status, res.headers),
+            )
+            return {
+                "url": url,
+                "status": res.status,
+                "headers": dict(res.headers.items()),
+                "content": res.content.decode(
+                    res.encoding or "utf-8", errors="replace"
+                ),
+                "error": None,
+                "retries": stats.retries,
+            }
+        except Exception as e:
+            return {
+                "url": url,
+                "status": None,
+                "headers": {},
+                "content": "",
+                "error": str(e),
+                "retries": stats.retries,
+            }
+
+    async def gen_process(self, context: ProcessingContext):
+        specs = self.get_request_specs()
+        pool = WorkPool(
+            self.max_concurrent_requests,
+            self.max_concurrent_per_host,
+            key=lambda spec: url_host(spec["url"]),
+        )
+        num_completed = 0
+        async for index, result in pool.map(self.send, specs):
+            num_completed += 1
+            context.post_message(
+                NodeProgress(
+                    node_id=self.id,
+                    progress=num_completed,
+                    total=len(specs),
                 )
-                for filepath in completed:
-                    if filepath:
-                        successful.append(filepath)
-                    else:
-                        failed.append(url)
+            )
+            yield "result", {"index": index, **result}
+
+
+class StreamPageLinks(BaseNode):
+    """
+    Stream the links, images, videos and audio of a web page while it downloads.
+    links, images, media, scraping, stream, crawl
+
+    The page is scanned with an incremental tokenizer as chunks arrive, so
+    no document tree is built and memory use stays flat on very large pages.
+
+    Use cases:
+    - Crawl huge pages without holding them in memory
+    - Start following links before the page has finished downloading
+    - Collect media URLs from long listing or archive pages
+    """
+
+    url: str = Field(
+        default="",
+        description="The URL of the page to scan.",
+    )
+
+    @classmethod
+    def get_title(cls):
+        return "Stream Page Links"
 
+    @classmethod
+    def return_type(cls):
         return {
-            "successful": successful,
-            "failed": failed,
+            "link": dict,
+            "image": ImageRef,
+            "video": VideoRef,
+            "audio": AudioRef,
         }
 
+    async def gen_process(self, context: ProcessingContext):
+        if not self.url:
+            raise ValueError("URL must not be empty")
+        session = await get_session()
+        async with session.get(self.url) as response:
+            response.raise_for_status()
+            events = stream_media_links(
+                response.content.iter_chunked(CHUNK_SIZE),
+                base_url=str(response.url),
+                encoding=response.charset or "utf-8",
+            )
+            async for kind, value in events:
+                if kind == "image":
+                    value = ImageRef(uri=value)
+                elif kind == "video":
+                    value = VideoRef(uri=value)
+                elif kind == "audio":
+                    value = AudioRef(uri=value)
+                yield kind, value
+
 
 class JSONPostRequest(HTTPBaseNode):
     """
@@ -581,8 +1070,9 @@ class JSONPostRequest(HTTPBaseNode):
     )
 
     async def process(self, context: ProcessingContext) -> dict:
-        res = await context.http_post(
-            self.url,
+        res = await self.send_request(
+            context,
+            "POST",
             json=self.data,
             headers={
                 "Content-Type": "application/json",
@@ -613,8 +1103,9 @@ class JSONPutRequest(HTTPBaseNode):
 
     async def process(self, context: ProcessingContext) -> dict:
         headers = {"Content-Type": "application/json"}
-        res = await context.http_put(
-            self.url,
+        res = await self.send_request(
+            context,
+            "PUT",
             json=self.data,
             headers=headers,
         )
@@ -643,15 +1134,16 @@ class JSONPatchRequest(HTTPBaseNode):
 
     async def process(self, context: ProcessingContext) -> dict:
         headers = {"Content-Type": "application/json"}
-        res = await context.http_patch(
-            self.url,
+        res = await self.send_request(
+            context,
+            "PATCH",
             json=self.data,
             headers=headers,
         )
         return res.json()
 
 
-class JSONGetRequest(HTTPBaseNode):
+class JSONGetRequest(HTTPGetNode):
     """
     Perform an HTTP GET request and parse the response as JSON.
     http, get, request, url, json, api
@@ -668,8 +1160,9 @@ class JSONGetRequest(HTTPBaseNode):
 
     async def process(self, context: ProcessingContext) -> dict:
         headers = {"Accept": "application/json"}
-        res = await context.http_get(
-            self.url,
+        res = await self.send_request(
+            context,
+            "GET",
             headers=headers,
         )
         return res.json()
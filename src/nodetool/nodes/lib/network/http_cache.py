@@ -0,0 +1,336 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Mapping
+
+from multidict import CIMultiDict
+
+from nodetool.nodes.lib.network.sessions import PooledResponse, pooled_request
+from nodetool.nodes.lib.network.sqlite_store import SQLiteStore, StoreSlot
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "nodetool", "http_cache.sqlite3"
+)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# The cache is shared by everyone using the process, so requests carrying
+# any of these are never answered from it or stored in it.
+CREDENTIAL_HEADERS = ("authorization", "cookie")
+
+
+def parse_cache_control(value: str) -> dict[str, str | None]:
+    """
+    Parse a Cache-Control header into a dict of lower-cased directives.
+    """
+    directives: dict[str, str | None] = {}
+    for part in value.split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('" ') if arg else None
+    return directives
+
+
+def has_credentials(headers: Mapping[str, str]) -> bool:
+    """
+    Whether request ``headers`` carry credentials that make the response
+    specific to one user.
+    """
+    return any(name.lower() in CREDENTIAL_HEADERS for name in headers)
+
+
+def _parse_http_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def freshness_lifetime(headers: Mapping[str, str], now: float) -> float | None:
+    """
+    Return how many seconds a response may be reused without revalidation,
+    or None if it must not be stored at all.
+    """
+    directives = parse_cache_control(headers.get("Cache-Control", ""))
+    if (
+        "no-store" in directives
+        or "private" in directives
+        or headers.get("Vary", "").strip() == "*"
+    ):
+        return None
+    if "no-cache" in directives:
+        return 0.0
+    if "max-age" in directives:
+        try:
+            age = float(headers.get("Age", 0))
+            return max(0.0, float(directives["max-age"] or 0) - age)
+        except ValueError:
+            return 0.0
+    expires = _parse_http_date(headers.get("Expires"))
+    if expires is not None:
+        date = _parse_http_date(headers.get("Date")) or now
+        return max(0.0, expires - date)
+    return 0.0
+
+
+@dataclass
+class CacheEntry:
+    key: str
+    status: int
+    headers: CIMultiDict
+    body: bytes
+    encoding: str | None
+    expires_at: float
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        return (now or time.time()) < self.expires_at
+
+    def to_response(self) -> PooledResponse:
+        return PooledResponse(
+            status=self.status,
+            headers=CIMultiDict(self.headers),
+            content=self.body,
+            encoding=self.encoding,
+        )
+
+
+class HTTPCache(SQLiteStore):
+    """
+    On-disk HTTP response cache backed by SQLite.
+
+    Entries are keyed by method, URL and the request headers named in the
+    response's Vary header. As a shared cache it never stores responses
+    marked ``private`` or requested with credentials. The total size of
+    stored bodies is bounded by ``max_bytes``; the least recently used
+    entries are evicted first.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS vary (
+            base_key TEXT PRIMARY KEY,
+            headers TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            status INTEGER NOT NULL,
+            headers TEXT NOT NULL,
+            body BLOB NOT NULL,
+            encoding TEXT,
+            size INTEGER NOT NULL,
+            expires_at REAL NOT NULL,
+            last_access REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS responses_last_access
+            ON responses (last_access);
+        """
+
+    def __init__(
+        self, path: str = DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        super().__init__(path)
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def _base_key(method: str, url: str) -> str:
+        return hashlib.sha256(f"{method.upper()} {url}".encode()).hexdigest()
+
+    @staticmethod
+    def _variant_key(
+        base_key: str, vary: list[str], request_headers: Mapping[str, str]
+    ) -> str:
+        headers = {k.lower(): v for k, v in request_headers.items()}
+        parts = [base_key] + [f"{name}:{headers.get(name, '')}" for name in vary]
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+    def lookup(
+        self, method: str, url: str, request_headers: Mapping[str, str]
+    ) -> CacheEntry | None:
+        base_key = self._base_key(method, url)
+        with self._lock:
+            db = self._connect()
+            row = db.execute(
+                "SELECT headers FROM vary WHERE base_key = ?", (base_key,)
+            ).fetchone()
+            if row is None:
+                return None
+            key = self._variant_key(base_key, json.loads(row[0]), request_headers)
+            row = db.execute(
+                "SELECT status, headers, body, encoding, expires_at"
+                " FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            db.execute(
+                "UPDATE responses SET last_access = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            db.commit()
+        status, headers, body, encoding, expires_at = row
+        return CacheEntry(
+            key=key,
+            status=status,
+            headers=CIMultiDict(json.loads(headers)),
+            body=body,
+            encoding=encoding,
+            expires_at=expires_at,
+        )
+
+    def store(
+        self,
+        method: str,
+        url: str,
+        request_headers: Mapping[str, str],
+        response: PooledResponse,
+    ) -> None:
+        now = time.time()
+        lifetime = freshness_lifetime(response.headers, now)
+        if (
+            response.status != 200
+            or lifetime is None
+            or has_credentials(request_headers)
+        ):
+            return
+        if lifetime == 0 and not (
+            "ETag" in response.headers or "Last-Modified" in response.headers
+        ):
+            # Nothing to revalidate with, so the entry could never be reused.
+            return
+        size = len(response.content)
+        if size > self.max_bytes:
+            return
+
+        base_key = self._base_key(method, url)
+        vary = sorted(
+            {
+                name.strip().lower()
+                for name in response.headers.get("Vary", "").split(",")
+                if name.strip()
+            }
+        )
+        key = self._variant_key(base_key, vary, request_headers)
+        with self._lock:
+            db = self._connect()
+            db.execute(
+                "INSERT OR REPLACE INTO vary (base_key, headers) VALUES (?, ?)",
+                (base_key, json.dumps(vary)),
+            )
+            db.execute(
+                "INSERT OR REPLACE INTO responses"
+                " (key, status, headers, body, encoding, size, expires_at, last_access)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.status,
+                    json.dumps(list(response.headers.items())),
+                    response.content,
+                    response.encoding,
+                    size,
+                    now + lifetime,
+                    now,
+                ),
+            )
+            self._evict(db, "responses", self.max_bytes)
+            db.commit()
+
+    def refresh(self, entry: CacheEntry, headers: Mapping[str, str]) -> CacheEntry:
+        """
+        Update a stored entry with the headers of a 304 Not Modified response.
+        """
+        merged = CIMultiDict(entry.headers)
+        updates = [
+            (name, value)
+            for name, value in headers.items()
+            if name.lower() not in ("content-length", "transfer-encoding")
+        ]
+        for name, _ in updates:
+            merged.popall(name, None)
+        for name, value in updates:
+            merged.add(name, value)
+        now = time.time()
+        lifetime = freshness_lifetime(merged, now) or 0.0
+        entry.headers = merged
+        entry.expires_at = now + lifetime
+        with self._lock:
+            db = self._connect()
+            db.execute(
+                "UPDATE responses SET headers = ?, expires_at = ?, last_access = ?"
+                " WHERE key = ?",
+                (json.dumps(list(merged.items())), entry.expires_at, now, entry.key),
+            )
+            db.commit()
+        return entry
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            db = self._connect()
+            return db.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            db = self._connect()
+            db.execute("DELETE FROM responses")
+            db.execute("DELETE FROM vary")
+            db.commit()
+
+
+_cache = StoreSlot(HTTPCache)
+
+
+def get_http_cache() -> HTTPCache:
+    """
+    Return the process-wide response cache.
+    """
+    return _cache.get()
+
+
+def configure_http_cache(
+    path: str = DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES
+) -> HTTPCache:
+    """
+    Replace the process-wide response cache.
+    """
+    return _cache.configure(path, max_bytes)
+
+
+async def cached_get(
+    cache: HTTPCache,
+    url: str,
+    headers: Mapping[str, str] | None = None,
+    **kwargs: Any,
+) -> PooledResponse:
+    """
+    GET ``url`` through ``cache``.
+
+    Fresh entries are returned without touching the network. Stale entries
+    are revalidated with If-None-Match / If-Modified-Since and their body is
+    reused when the server answers 304 Not Modified. Requests with
+    credentials, in headers or as ``auth``, bypass the cache.
+    """
+    headers = dict(headers or {})
+    if has_credentials(headers) or kwargs.get("auth") is not None:
+        return await pooled_request("GET", url, headers=headers, **kwargs)
+    entry = await asyncio.to_thread(cache.lookup, "GET", url, headers)
+    if entry is not None and entry.is_fresh():
+        return entry.to_response()
+
+    request_headers = dict(headers)
+    if entry is not None:
+        if "ETag" in entry.headers:
+            request_headers["If-None-Match"] = entry.headers["ETag"]
+        if "Last-Modified" in entry.headers:
+            request_headers["If-Modified-Since"] = entry.headers["Last-Modified"]
+
+    response = await pooled_request("GET", url, headers=request_headers, **kwargs)
+    if response.status == 304 and entry is not None:
+        entry = await asyncio.to_thread(cache.refresh, entry, response.headers)
+        return entry.to_response()
+
+    await asyncio.to_thread(cache.store, "GET", url, headers, response)
+    return response
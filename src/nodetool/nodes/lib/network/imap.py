@@ -0,0 +1,637 @@
+import email
+import imaplib
+import re
+from collections import defaultdict
+from datetime import datetime
+from email.header import decode_header
+from email.message import Message
+from email.utils import parsedate_to_datetime
+from enum import Enum
+from functools import partial
+
+from pydantic import Field
+from nodetool.common.convert_html import convert_html_to_text
+from nodetool.metadata.types import (
+    Datetime,
+    Email,
+    EmailSearchCriteria,
+    IMAPConnection,
+)
+from nodetool.workflows.base_node import BaseNode
+from nodetool.workflows.processing_context import ProcessingContext
+from nodetool.nodes.lib.network.imap_fetch import (
+    DEFAULT_BATCH_SIZE,
+    HEADER_ITEMS,
+    TextPart,
+    decode_part,
+    fetch_batches,
+    find_text_part,
+    parse_fetch_items,
+    parse_fetch_response,
+)
+from nodetool.nodes.lib.network.imap_cache import CachedMailbox, get_email_cache
+from nodetool.nodes.lib.network.imap_pool import IMAPSession, get_imap_pool
+from nodetool.nodes.lib.network.imap_sync import (
+    DEFAULT_IDLE_TIMEOUT,
+    MailboxState,
+    account_key,
+    get_mailbox_state_store,
+    idle,
+    mailbox_key,
+    new_uids,
+    search_uids,
+)
+
+
+class BodyMode(str, Enum):
+    FULL = "full"
+    TEXT = "text"
+    NONE = "none"
+
+
+def create_gmail_connection(email_address: str, app_password: str) -> IMAPConnection:
+    """
+    Create an IMAP connection for a Gmail account using an app password.
+    """
+    if not email_address:
+        raise ValueError("Email address is required")
+    if not app_password:
+        raise ValueError("App password is required")
+    return IMAPConnection(
+        host="imap.gmail.com",
+        port=993,
+        username=email_address,
+        password=app_password,
+        use_ssl=True,
+    )
+
+
+def decode_bytes_with_fallback(
+    byte_string: bytes, encodings=("utf-8", "latin-1", "ascii")
+) -> str:
+    """
+    Decode bytes with the first encoding that works, or return "".
+    """
+    for encoding in encodings:
+        try:
+            return byte_string.decode(encoding)
+        except (UnicodeDecodeError, LookupError):
+            continue
+    return ""
+
+
+def decode_header_value(value: str | None) -> str:
+    """
+    Decode an RFC 2047 encoded header into a string.
+    """
+    if not value:
+        return ""
+    parts = []
+    for part, charset in decode_header(value):
+        if isinstance(part, bytes):
+            encodings = (
+                (charset, "utf-8", "latin-1") if charset else ("utf-8", "latin-1")
+            )
+            parts.append(decode_bytes_with_fallback(part, encodings))
+        else:
+            parts.append(part)
+    return "".join(parts)
+
+
+def get_email_body(email_message: Message) -> str:
+    """
+    Return the text of an email, preferring the text/plain part and
+    converting text/html when there is no plain text.
+    """
+    if not email_message.is_multipart():
+        payload = email_message.get_payload(decode=True) or b""
+        return decode_bytes_with_fallback(payload).strip()
+
+    html = None
+    for part in email_message.walk():
+        content_type = part.get_content_type()
+        if content_type == "text/plain":
+            return decode_bytes_with_fallback(part.get_payload(decode=True) or b"")
+        if content_type == "text/html" and html is None:
+            html = decode_bytes_with_fallback(part.get_payload(decode=True) or b"")
+    return convert_html_to_text(html) if html is not None else ""
+
+
+def parse_email(message_id: str, raw: bytes, body: str | None = None) -> Email:
+    """
+    Build an Email from the raw RFC 822 bytes of a message, or from its
+    header block and an already extracted ``body``.
+    """
+    message = email.message_from_bytes(raw)
+    try:
+        date = parsedate_to_datetime(message["Date"])
+    except (TypeError, ValueError):
+        date = datetime.now()
+    return Email(
+        id=message_id,
+        subject=decode_header_value(message["Subject"]),
+        sender=decode_header_value(message["From"]),
+        date=Datetime.from_datetime(date),
+        body=get_email_body(message) if body is None else body,
+    )
+
+
+def _as_bytes(value) -> bytes:
+    if isinstance(value, str):
+        return value.encode("utf-8")
+    return value or b""
+
+
+def _parse_messages(data) -> dict[str, Email]:
+    return {
+        uid: parse_email(uid, raw) for uid, raw in parse_fetch_response(data).items()
+    }
+
+
+def _parse_headers(data) -> dict[str, tuple[bytes, TextPart | None]]:
+    headers = {}
+    for uid, items in parse_fetch_items(data).items():
+        block = next((v for k, v in items.items() if k.startswith("BODY[HEADER")), b"")
+        headers[uid] = (_as_bytes(block), find_text_part(items.get("BODYSTRUCTURE")))
+    return headers
+
+
+def _parse_bodies(parts: dict[str, TextPart], data) -> dict[str, str]:
+    bodies = {}
+    for uid, values in parse_fetch_items(data).items():
+        part = parts[uid]
+        payload = decode_part(
+            _as_bytes(values.get(f"BODY[{part.section}]")), part.encoding
+        )
+        encodings = ("utf-8", "latin-1")
+        if part.charset:
+            encodings = (part.charset,) + encodings
+        text = decode_bytes_with_fallback(payload, encodings)
+        if part.subtype == "html":
+            text = convert_html_to_text(text)
+        bodies[uid] = text.strip()
+    return bodies
+
+
+def fetch_email_headers(
+    imap: imaplib.IMAP4, message_ids: list[str], batch_size: int = DEFAULT_BATCH_SIZE
+) -> dict[str, tuple[bytes, TextPart | None]]:
+    """
+    Fetch the Subject, From, Date and Message-ID headers and the
+    BODYSTRUCTURE of messages, returning ``{uid: (headers, text_part)}``.
+    Nothing is marked as read and no part contents are transferred.
+    """
+    headers: dict[str, tuple[bytes, TextPart | None]] = {}
+    for batch in fetch_batches(
+        imap, message_ids, HEADER_ITEMS, batch_size, _parse_headers
+    ):
+        headers.update(batch)
+    return headers
+
+
+def fetch_email_bodies(
+    imap: imaplib.IMAP4,
+    parts: dict[str, TextPart],
+    max_bytes: int = 0,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> dict[str, str]:
+    """
+    Fetch only the given text part of each message and return
+    ``{uid: text}``, converting HTML to text. With ``max_bytes`` a partial
+    fetch transfers at most that many bytes of each part.
+    """
+    by_section: dict[str, list[str]] = defaultdict(list)
+    for uid, part in parts.items():
+        by_section[part.section].append(uid)
+
+    parse = partial(_parse_bodies, parts)
+    bodies: dict[str, str] = {}
+    byte_range = f"<0.{max_bytes}>" if max_bytes > 0 else ""
+    for section, uids in by_section.items():
+        items = f"(BODY.PEEK[{section}]{byte_range})"
+        for batch in fetch_batches(imap, uids, items, batch_size, parse):
+            bodies.update(batch)
+    return bodies
+
+
+def _cache_variant(body_mode: BodyMode, max_body_bytes: int) -> str:
+    if body_mode == BodyMode.TEXT and max_body_bytes > 0:
+        return f"text:{max_body_bytes}"
+    return body_mode.value
+
+
+def fetch_emails(
+    imap: imaplib.IMAP4,
+    message_ids: list[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    body_mode: BodyMode = BodyMode.FULL,
+    max_body_bytes: int = 0,
+    cache: CachedMailbox | None = None,
+) -> list[Email]:
+    """
+    Fetch messages by UID with one ``UID FETCH`` per ``batch_size`` messages
+    and return them in the order of ``message_ids``. Messages deleted since
+    the search are skipped.
+
+    ``BodyMode.FULL`` downloads whole messages. ``BodyMode.TEXT`` first
+    fetches headers and BODYSTRUCTURE, then only the text part of each
+    message (at most ``max_body_bytes`` of it when set), so attachments are
+    never transferred. ``BodyMode.NONE`` stops after the headers and leaves
+    the body empty.
+
+    With a ``cache`` for the selected folder, messages fetched before with
+    the same options are read from it and only the others are fetched.
+    """
+    variant = _cache_variant(body_mode, max_body_bytes)
+    emails: dict[str, Email] = {}
+    if cache is not None:
+        for uid, record in cache.lookup(message_ids, variant).items():
+            emails[uid] = Email.model_validate(record)
+    missing = [uid for uid in message_ids if uid not in emails]
+
+    fetched: dict[str, Email] = {}
+    if missing and body_mode == BodyMode.FULL:
+        for batch in fetch_batches(
+            imap, missing, "(RFC822)", batch_size, _parse_messages
+        ):
+            fetched.update(batch)
+    elif missing:
+        headers = fetch_email_headers(imap, missing, batch_size)
+        bodies = {}
+        if body_mode == BodyMode.TEXT:
+            parts = {uid: part for uid, (_, part) in headers.items() if part}
+            bodies = fetch_email_bodies(imap, parts, max_body_bytes, batch_size)
+        for uid, (block, _) in headers.items():
+            fetched[uid] = parse_email(uid, block, bodies.get(uid, ""))
+
+    if cache is not None and fetched:
+        cache.store(
+            {uid: item.model_dump(mode="json") for uid, item in fetched.items()},
+            variant,
+        )
+    emails.update(fetched)
+    return [emails[uid] for uid in message_ids if uid in emails]
+
+
+def quote_string(value: str) -> str:
+    """
+    Return ``value`` as an IMAP quoted string (RFC 3501), escaping
+    backslashes and double quotes. Quoted strings cannot hold line breaks,
+    so those become spaces.
+    """
+    value = re.sub(r"[\r\n]+", " ", value)
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def build_imap_query(criteria: EmailSearchCriteria) -> str:
+    """
+    Translate search criteria into an IMAP SEARCH query.
+    """
+    conditions = []
+    for key, value in [
+        ("FROM", criteria.from_address),
+        ("TO", criteria.to_address),
+        ("SUBJECT", criteria.subject),
+        ("BODY", criteria.body),
+        ("CC", criteria.cc),
+        ("TEXT", criteria.text),
+    ]:
+        if value:
+            conditions.append(f"{key} {quote_string(value)}")
+
+    date_condition = criteria.date_condition or criteria.date_query
+    if date_condition:
+        date = date_condition.date.to_datetime().strftime("%d-%b-%Y")
+        conditions.append(f'{date_condition.criteria.value} "{date}"')
+
+    for flag in criteria.flags:
+        conditions.append(flag.value)
+    for keyword in criteria.keywords:
+        conditions.append(f"KEYWORD {quote_string(keyword)}")
+
+    return " ".join(conditions) if conditions else "ALL"
+
+
+def search_mailbox(
+    session: IMAPSession,
+    connection: IMAPConnection,
+    criteria: EmailSearchCriteria,
+    max_results: int = 50,
+    body_mode: BodyMode = BodyMode.FULL,
+    max_body_bytes: int = 0,
+    only_new: bool = False,
+    use_cache: bool = False,
+) -> list[Email]:
+    """
+    Search the folder selected in ``session`` and return the newest
+    ``max_results`` matching emails, newest first. See ``fetch_emails``
+    for ``body_mode``.
+
+    With ``only_new``, the search only covers UIDs above the highest one
+    returned by the previous ``only_new`` search with the same criteria,
+    as long as the folder's UIDVALIDITY is unchanged. When more than
+    ``max_results`` new emails match, the oldest of them are returned and
+    the rest are left for the next search. With ``use_cache``, messages
+    are served from the local email cache when possible.
+    """
+    query = build_imap_query(criteria)
+    if only_new:
+        store = get_mailbox_state_store()
+        key = mailbox_key(connection, session.folder, query)
+        uids = new_uids(session.imap, store.load(key), session.uidvalidity, query)
+    else:
+        uids = search_uids(session.imap, query)
+    cache = None
+    if use_cache and session.uidvalidity is not None:
+        cache = CachedMailbox(
+            get_email_cache(),
+            account_key(connection),
+            session.folder,
+            session.uidvalidity,
+        )
+    if max_results <= 0:
+        uids = []
+    elif only_new:
+        # Only UIDs that are actually returned may be marked as seen.
+        uids = uids[:max_results]
+    else:
+        uids = uids[-max_results:]
+    emails = fetch_emails(
+        session.imap,
+        [str(uid) for uid in reversed(uids)],
+        body_mode=body_mode,
+        max_body_bytes=max_body_bytes,
+        cache=cache,
+    )
+    if only_new and uids:
+        store.save(MailboxState(key, session.uidvalidity, uids[-1]))
+    return emails
+
+
+def search_emails(
+    connection: IMAPConnection,
+    criteria: EmailSearchCriteria,
+    max_results: int = 50,
+    body_mode: BodyMode = BodyMode.FULL,
+    max_body_bytes: int = 0,
+    only_new: bool = False,
+    use_cache: bool = False,
+) -> list[Email]:
+    """
+    Search a mailbox over a pooled session, blocking the calling thread.
+    The session stays logged in for the next search. See
+    ``search_mailbox`` for the arguments.
+    """
+    with get_imap_pool().session(connection, criteria.folder or "INBOX") as session:
+        return search_mailbox(
+            session,
+            connection,
+            criteria,
+            max_results,
+            body_mode,
+            max_body_bytes,
+            only_new,
+            use_cache,
+        )
+
+
+async def search_emails_async(
+    connection: IMAPConnection,
+    criteria: EmailSearchCriteria,
+    max_results: int = 50,
+    body_mode: BodyMode = BodyMode.FULL,
+    max_body_bytes: int = 0,
+    only_new: bool = False,
+    use_cache: bool = False,
+) -> list[Email]:
+    """
+    Search a mailbox over a pooled session on that session's own thread,
+    so concurrent searches of several mailboxes or folders proceed in
+    parallel without blocking the event loop.
+    """
+    pool = get_imap_pool()
+    async with pool.connect(connection, criteria.folder or "INBOX") as session:
+        return await session.run(
+            search_mailbox,
+            session,
+            connection,
+            criteria,
+            max_results,
+            body_mode,
+            max_body_bytes,
+            only_new,
+            use_cache,
+        )
+
+
+class EmailFields(BaseNode):
+    """
+    Decomposes an email into its individual components.
+    email, decompose, extract
+
+    Takes an Email object and returns its individual fields:
+    - id: Message ID
+    - subject: Email subject
+    - sender: Sender address
+    - date: Datetime of email
+    - body: Email body content
+    """
+
+    email: Email = Field(default=None, description="Email object to decompose")
+
+    @classmethod
+    def return_type(cls):
+        return {
+            "id": str,
+            "subject": str,
+            "sender": str,
+            "date": Datetime,
+            "body": str,
+        }
+
+    async def process(self, context: ProcessingContext):
+        if self.email is None:
+            raise ValueError("Email is required")
+
+        return {
+            "id": self.email.id,
+            "subject": self.email.subject,
+            "sender": self.email.sender,
+            "date": self.email.date,
+            "body": self.email.body,
+        }
+
+
+class ConfigureIMAP(BaseNode):
+    """
+    Creates an IMAP configuration for email operations.
+    email, imap, config
+
+    Use cases:
+    - Set up email access credentials
+    - Enable programmatic email access
+    """
+
+    host: str = Field(
+        default="", description="IMAP server hostname (e.g. imap.gmail.com)"
+    )
+    port: int = Field(default=993, description="IMAP server port")
+    username: str = Field(default="", description="Email account username")
+    password: str = Field(default="", description="Email account password")
+    use_ssl: bool = Field(default=True, description="Whether to use SSL/TLS connection")
+
+    async def process(self, context: ProcessingContext) -> IMAPConnection:
+        connection = IMAPConnection(
+            host=self.host,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            use_ssl=self.use_ssl,
+        )
+        if not connection.is_configured():
+            raise ValueError("IMAP configuration is incomplete")
+        return connection
+
+
+class IMAPSearch(BaseNode):
+    """
+    Searches IMAP using IMAP-specific search operators.
+    email, imap, search
+
+    Returns emails with following fields:
+    - id: Message ID
+    - subject: Email subject
+    - from: Sender address
+    - date: Datetime of email
+    - body: Email body content
+
+    Use cases:
+    - Search for emails based on specific criteria
+    - Retrieve emails from a specific sender
+    - Filter emails by subject, sender, or date
+    - List subjects of a large mailbox without downloading attachments
+    """
+
+    connection: IMAPConnection = Field(
+        default=IMAPConnection(), description="IMAP connection details"
+    )
+    search_criteria: EmailSearchCriteria = Field(
+        default=EmailSearchCriteria(), description="Search criteria"
+    )
+    max_results: int = Field(
+        default=50, description="Maximum number of emails to return"
+    )
+    body_mode: BodyMode = Field(
+        default=BodyMode.FULL,
+        description="What to download: whole messages, only headers and the text part, or only headers",
+    )
+    max_body_bytes: int = Field(
+        default=0,
+        description="With body_mode 'text', fetch at most this many bytes of each body (0 for no limit)",
+    )
+    only_new: bool = Field(
+        default=False,
+        description="Only return emails that arrived since the last run with the same criteria",
+    )
+    use_cache: bool = Field(
+        default=False,
+        description="Keep fetched emails in a local cache and only download messages not fetched before",
+    )
+
+    async def process(self, context: ProcessingContext) -> list[Email]:
+        if not self.connection.is_configured():
+            raise ValueError("IMAP connection is not configured")
+
+        return await search_emails_async(
+            self.connection,
+            self.search_criteria,
+            self.max_results,
+            self.body_mode,
+            self.max_body_bytes,
+            self.only_new,
+            self.use_cache,
+        )
+
+
+class IMAPWatch(BaseNode):
+    """
+    Streams new emails as they arrive, using IMAP IDLE.
+    email, imap, watch, idle, stream
+
+    The server pushes a notification when mail arrives, so new messages
+    are emitted within seconds and without re-running the search. Only
+    messages that arrive after the node starts and match the criteria
+    are emitted.
+
+    Use cases:
+    - React to incoming email in a workflow
+    - Summarize or forward messages as they arrive
+    - Wait for a message from a given sender
+    """
+
+    connection: IMAPConnection = Field(
+        default=IMAPConnection(), description="IMAP connection details"
+    )
+    search_criteria: EmailSearchCriteria = Field(
+        default=EmailSearchCriteria(), description="Search criteria"
+    )
+    body_mode: BodyMode = Field(
+        default=BodyMode.FULL,
+        description="What to download: whole messages, only headers and the text part, or only headers",
+    )
+    max_body_bytes: int = Field(
+        default=0,
+        description="With body_mode 'text', fetch at most this many bytes of each body (0 for no limit)",
+    )
+    max_emails: int = Field(
+        default=0,
+        description="Stop after emitting this many emails (0 to keep watching)",
+    )
+    idle_timeout: float = Field(
+        default=DEFAULT_IDLE_TIMEOUT,
+        description="Seconds to stay in IDLE before renewing it; servers may drop clients idle for 30 minutes",
+    )
+
+    @classmethod
+    def get_title(cls):
+        return "IMAP Watch"
+
+    @classmethod
+    def return_type(cls):
+        return {
+            "email": Email,
+        }
+
+    async def gen_process(self, context: ProcessingContext):
+        if not self.connection.is_configured():
+            raise ValueError("IMAP connection is not configured")
+
+        folder = self.search_criteria.folder or "INBOX"
+        query = build_imap_query(self.search_criteria)
+        async with get_imap_pool().connect(self.connection, folder) as session:
+            existing = await session.run(search_uids, session.imap, "UID *")
+            state = MailboxState("", session.uidvalidity, max(existing, default=0))
+            emitted = 0
+            while not self.max_emails or emitted < self.max_emails:
+                changes = await session.run(idle, session.imap, self.idle_timeout)
+                if not changes:
+                    continue
+                uids = await session.run(
+                    new_uids, session.imap, state, state.uidvalidity, query
+                )
+                if not uids:
+                    continue
+                state.last_uid = uids[-1]
+                emails = await session.run(
+                    fetch_emails,
+                    session.imap,
+                    [str(uid) for uid in uids],
+                    DEFAULT_BATCH_SIZE,
+                    self.body_mode,
+                    self.max_body_bytes,
+                )
+                if self.max_emails:
+                    emails = emails[: self.max_emails - emitted]
+                for item in emails:
+                    emitted += 1
+                    yield "email", item
@@ -0,0 +1,188 @@
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from nodetool.nodes.lib.network.sqlite_store import SQLiteStore, StoreSlot
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "nodetool", "email_cache.sqlite3"
+)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Part of every stored variant. Bump it when the parsed form of emails
+# changes so records stored by older versions are not reused.
+CACHE_VERSION = 1
+# UIDs per lookup query, below SQLite's limit on bound parameters.
+LOOKUP_CHUNK = 500
+
+
+class EmailCache(SQLiteStore):
+    """
+    SQLite store of parsed emails keyed by account, folder, UIDVALIDITY,
+    UID and a variant naming how the message was fetched (whole, text part
+    only, ...). A message never changes while its folder keeps the same
+    UIDVALIDITY, so records need no revalidation.
+
+    The store is bounded by ``max_bytes`` of JSON-encoded records,
+    evicting the least recently used first.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS messages (
+            account TEXT NOT NULL,
+            folder TEXT NOT NULL,
+            uidvalidity INTEGER NOT NULL,
+            uid INTEGER NOT NULL,
+            variant TEXT NOT NULL,
+            value TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            last_access REAL NOT NULL,
+            PRIMARY KEY (account, folder, uidvalidity, uid, variant)
+        );
+        CREATE INDEX IF NOT EXISTS messages_last_access
+            ON messages (last_access);
+        """
+
+    def __init__(
+        self, path: str = DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        super().__init__(path)
+        self.max_bytes = max_bytes
+
+    def lookup(
+        self,
+        account: str,
+        folder: str,
+        uidvalidity: int,
+        uids: Iterable[int],
+        variant: str,
+    ) -> dict[int, Any]:
+        """
+        Return the stored records among ``uids`` as ``{uid: record}``.
+        """
+        uids = list(uids)
+        variant = f"{CACHE_VERSION}:{variant}"
+        found: dict[int, Any] = {}
+        with self._lock:
+            db = self._connect()
+            now = time.time()
+            for start in range(0, len(uids), LOOKUP_CHUNK):
+                chunk = uids[start : start + LOOKUP_CHUNK]
+                where = (
+                    "account = ? AND folder = ? AND uidvalidity = ? AND variant = ?"
+                    f" AND uid IN ({','.join('?' * len(chunk))})"
+                )
+                params = (account, folder, uidvalidity, variant, *chunk)
+                rows = db.execute(
+                    f"SELECT uid, value FROM messages WHERE {where}", params
+                ).fetchall()
+                if rows:
+                    db.execute(
+                        f"UPDATE messages SET last_access = ? WHERE {where}",
+                        (now, *params),
+                    )
+                found.update((uid, json.loads(value)) for uid, value in rows)
+            db.commit()
+        return found
+
+    def store(
+        self,
+        account: str,
+        folder: str,
+        uidvalidity: int,
+        records: dict[int, Any],
+        variant: str,
+    ) -> None:
+        """
+        Write JSON-serializable ``{uid: record}``. Records of the folder
+        stored under another UIDVALIDITY can never match again and are
+        dropped.
+        """
+        if not records:
+            return
+        variant = f"{CACHE_VERSION}:{variant}"
+        now = time.time()
+        rows = []
+        for uid, record in records.items():
+            encoded = json.dumps(record)
+            if len(encoded) <= self.max_bytes:
+                rows.append(
+                    (
+                        account,
+                        folder,
+                        uidvalidity,
+                        uid,
+                        variant,
+                        encoded,
+                        len(encoded),
+                        now,
+                    )
+                )
+        with self._lock:
+            db = self._connect()
+            db.execute(
+                "DELETE FROM messages WHERE account = ? AND folder = ?"
+                " AND uidvalidity != ?",
+                (account, folder, uidvalidity),
+            )
+            db.executemany(
+                "INSERT OR REPLACE INTO messages (account, folder, uidvalidity,"
+                " uid, variant, value, size, last_access)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._evict(db, "messages", self.max_bytes)
+            db.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            db = self._connect()
+            db.execute("DELETE FROM messages")
+            db.commit()
+
+
+@dataclass
+class CachedMailbox:
+    """
+    An EmailCache bound to one folder of one account at a UIDVALIDITY.
+    """
+
+    cache: EmailCache
+    account: str
+    folder: str
+    uidvalidity: int
+
+    def lookup(self, uids: Iterable[str], variant: str) -> dict[str, Any]:
+        found = self.cache.lookup(
+            self.account, self.folder, self.uidvalidity, map(int, uids), variant
+        )
+        return {str(uid): record for uid, record in found.items()}
+
+    def store(self, records: dict[str, Any], variant: str) -> None:
+        self.cache.store(
+            self.account,
+            self.folder,
+            self.uidvalidity,
+            {int(uid): record for uid, record in records.items()},
+            variant,
+        )
+
+
+_cache = StoreSlot(EmailCache)
+
+
+def get_email_cache() -> EmailCache:
+    """
+    Return the process-wide email cache.
+    """
+    return _cache.get()
+
+
+def configure_email_cache(
+    path: str = DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES
+) -> EmailCache:
+    """
+    Replace the process-wide email cache.
+    """
+    return _cache.configure(path, max_bytes)
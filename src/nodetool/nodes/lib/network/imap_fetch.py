@@ -0,0 +1,249 @@
+import base64
+import imaplib
+import itertools
+import quopri
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, Sequence
+
+DEFAULT_BATCH_SIZE = 100
+HEADER_FIELDS = ("SUBJECT", "FROM", "DATE", "MESSAGE-ID")
+HEADER_ITEMS = f"(BODY.PEEK[HEADER.FIELDS ({' '.join(HEADER_FIELDS)})] BODYSTRUCTURE)"
+
+_UID = re.compile(rb"\bUID (\d+)")
+_LITERAL_SIZE = re.compile(rb"\{\d+\}$")
+_TOKEN = re.compile(
+    rb'\s*(?:(?P<open>\()|(?P<close>\))|"(?P<quoted>(?:[^"\\]|\\.)*)"'
+    rb"|(?P<atom>[^\s()\"\[\]{]+(?:\[[^\]]*\](?:<\d+>)?)?))"
+)
+_ORIGIN = re.compile(r"<\d+>$")
+_OPEN = object()
+_CLOSE = object()
+
+
+def message_set(uids: Iterable[str | int]) -> str:
+    """
+    Compress UIDs into an IMAP message set, e.g. ``1:3,7,9:10``.
+    """
+    numbers = sorted({int(uid) for uid in uids})
+    ranges: list[str] = []
+    start = end = None
+    for number in numbers:
+        if end is not None and number == end + 1:
+            end = number
+            continue
+        if start is not None:
+            ranges.append(str(start) if start == end else f"{start}:{end}")
+        start = end = number
+    if start is not None:
+        ranges.append(str(start) if start == end else f"{start}:{end}")
+    return ",".join(ranges)
+
+
+def parse_fetch_response(data: Sequence[Any]) -> dict[str, bytes]:
+    """
+    Split the data of a multi-message ``UID FETCH`` into ``{uid: literal}``.
+
+    imaplib returns each message as a ``(header, literal)`` tuple followed
+    by the rest of the line as bytes; servers put the UID item either in
+    the header or after the literal, so both are checked.
+    """
+    messages: dict[str, bytes] = {}
+    uid: str | None = None
+    literal: bytes | None = None
+    for item in data:
+        if isinstance(item, tuple):
+            if uid is not None and literal is not None:
+                messages[uid] = literal
+            header, literal = item
+            match = _UID.search(header)
+            uid = match.group(1).decode() if match else None
+        elif isinstance(item, bytes) and literal is not None:
+            if uid is None:
+                match = _UID.search(item)
+                uid = match.group(1).decode() if match else None
+            if uid is not None:
+                messages[uid] = literal
+            uid = literal = None
+    if uid is not None and literal is not None:
+        messages[uid] = literal
+    return messages
+
+
+def _scan(text: bytes) -> Iterator[Any]:
+    position = 0
+    while match := _TOKEN.match(text, position):
+        position = match.end()
+        if match["open"]:
+            yield _OPEN
+        elif match["close"]:
+            yield _CLOSE
+        elif match["quoted"] is not None:
+            yield re.sub(rb"\\(.)", rb"\1", match["quoted"]).decode("utf-8", "replace")
+        else:
+            atom = match["atom"].decode("utf-8", "replace")
+            yield None if atom.upper() == "NIL" else atom
+
+
+def _tokens(data: Sequence[Any]) -> Iterator[Any]:
+    for item in data:
+        if isinstance(item, tuple):
+            text, literal = item
+            yield from _scan(_LITERAL_SIZE.sub(b"", text.rstrip()))
+            yield bytes(literal)
+        elif isinstance(item, bytes):
+            yield from _scan(item)
+
+
+def _value(tokens: Iterator[Any], token: Any) -> Any:
+    if token is not _OPEN:
+        return token
+    values = []
+    for token in tokens:
+        if token is _CLOSE:
+            break
+        values.append(_value(tokens, token))
+    return values
+
+
+def parse_fetch_items(data: Sequence[Any]) -> dict[str, dict[str, Any]]:
+    """
+    Parse the data of a multi-message ``UID FETCH`` into
+    ``{uid: {item: value}}``.
+
+    Item names are upper-cased with any partial-fetch origin dropped, so
+    ``BODY[1]<0>`` is returned as ``BODY[1]``. Lists become Python lists,
+    NIL becomes None, strings become str and literals stay bytes.
+    """
+    messages: dict[str, dict[str, Any]] = {}
+    tokens = _tokens(data)
+    for token in tokens:
+        if token is _OPEN:
+            values = _value(tokens, token)
+            items = {
+                _ORIGIN.sub("", str(name).upper()): value
+                for name, value in zip(values[::2], values[1::2])
+            }
+            if "UID" in items:
+                messages[str(items["UID"])] = items
+    return messages
+
+
+@dataclass
+class TextPart:
+    """
+    A text/plain or text/html part found in a BODYSTRUCTURE.
+    """
+
+    section: str
+    subtype: str
+    charset: str | None
+    encoding: str
+    size: int
+
+
+def _text(value: Any) -> str:
+    if isinstance(value, bytes):
+        return value.decode("utf-8", "replace")
+    return "" if value is None else str(value)
+
+
+def text_parts(structure: list[Any], section: str = "") -> Iterator[TextPart]:
+    """
+    Yield the inline text/plain and text/html parts of a BODYSTRUCTURE in
+    message order. Attachments and nested messages are skipped.
+    """
+    if structure and isinstance(structure[0], list):
+        children = itertools.takewhile(lambda child: isinstance(child, list), structure)
+        for number, child in enumerate(children, 1):
+            yield from text_parts(
+                child, f"{section}.{number}" if section else str(number)
+            )
+        return
+    if len(structure) < 7 or _text(structure[0]).lower() != "text":
+        return
+    subtype = _text(structure[1]).lower()
+    disposition = structure[9] if len(structure) > 9 else None
+    if subtype not in ("plain", "html") or (
+        isinstance(disposition, list)
+        and disposition
+        and _text(disposition[0]).lower() == "attachment"
+    ):
+        return
+    params = structure[2] if isinstance(structure[2], list) else []
+    charset = {
+        _text(key).lower(): _text(value)
+        for key, value in zip(params[::2], params[1::2])
+    }.get("charset")
+    yield TextPart(
+        section=section or "1",
+        subtype=subtype,
+        charset=charset,
+        encoding=_text(structure[5]).lower() or "7bit",
+        size=int(structure[6] or 0),
+    )
+
+
+def find_text_part(structure: list[Any] | None) -> TextPart | None:
+    """
+    Return the first text/plain part of a BODYSTRUCTURE, or the first
+    text/html part when there is no plain text.
+    """
+    parts = list(text_parts(structure)) if structure else []
+    for part in parts:
+        if part.subtype == "plain":
+            return part
+    return parts[0] if parts else None
+
+
+def decode_part(payload: bytes, encoding: str) -> bytes:
+    """
+    Undo the content transfer encoding of a fetched part. Base64 cut short
+    by a partial fetch is decoded up to the last complete quantum.
+    """
+    if encoding == "base64":
+        payload = re.sub(rb"[^A-Za-z0-9+/=]", b"", payload)
+        return base64.b64decode(payload[: len(payload) // 4 * 4])
+    if encoding == "quoted-printable":
+        return quopri.decodestring(payload)
+    return payload
+
+
+def uid_fetch(imap: imaplib.IMAP4, uids: Sequence[str], items: str) -> list[Any]:
+    """
+    Send one ``UID FETCH`` for all ``uids`` and return the raw response data.
+    """
+    status, data = imap.uid("FETCH", message_set(uids), items)
+    if status != "OK":
+        raise imaplib.IMAP4.error(f"UID FETCH failed: {data!r}")
+    return data
+
+
+def fetch_batches(
+    imap: imaplib.IMAP4,
+    uids: Sequence[str],
+    items: str = "(RFC822)",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    parse: Callable[[Sequence[Any]], dict[str, Any]] = parse_fetch_response,
+) -> Iterator[dict[str, Any]]:
+    """
+    Fetch ``items`` for ``uids`` with one ``UID FETCH`` per batch and yield
+    each batch parsed by ``parse``, by default as ``{uid: literal}``.
+
+    Batches are pipelined: ``parse`` runs on a helper thread while the
+    next batch is fetched, so the per-batch work should go into ``parse``
+    rather than into the loop consuming the batches. Every command is
+    still sent from the calling thread, for pooled sessions the session's
+    own thread, so the connection is never used by two threads.
+    """
+    size = max(1, batch_size)
+    parsed: Future | None = None
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="imap-parse") as parser:
+        for start in range(0, len(uids), size):
+            data = uid_fetch(imap, uids[start : start + size], items)
+            if parsed is not None:
+                yield parsed.result()
+            parsed = parser.submit(parse, data)
+        if parsed is not None:
+            yield parsed.result()
@@ -0,0 +1,350 @@
+import asyncio
+import atexit
+import functools
+import hashlib
+import imaplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field, replace
+from typing import Any, AsyncIterator, Callable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+ConnectionKey = tuple[str, int, str, bool]
+
+
+@dataclass(frozen=True)
+class IMAPPoolConfig:
+    """
+    Settings for the shared pool of authenticated IMAP sessions.
+    """
+
+    max_idle_per_account: int = 4
+    max_idle_time: float = 600.0
+    check_after: float = 15.0
+    timeout: float = 60.0
+
+
+def connection_key(connection: Any) -> ConnectionKey:
+    """
+    Return the pool key of an IMAPConnection: host, port, user and SSL.
+    """
+    return (
+        connection.host.lower(),
+        int(connection.port),
+        connection.username,
+        bool(connection.use_ssl),
+    )
+
+
+def _secret(password: str) -> str:
+    return hashlib.sha256(password.encode("utf-8")).hexdigest()
+
+
+def open_imap(
+    host: str, port: int, use_ssl: bool, timeout: float | None = None
+) -> imaplib.IMAP4:
+    if use_ssl:
+        return imaplib.IMAP4_SSL(host, port, timeout=timeout)
+    return imaplib.IMAP4(host, port, timeout=timeout)
+
+
+def _executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="imap")
+
+
+def _logout(imap: imaplib.IMAP4) -> None:
+    try:
+        imap.logout()
+    except Exception:
+        pass
+
+
+def _keeps_connection(error: BaseException) -> bool:
+    # NO and BAD replies leave the connection usable; aborts and socket
+    # errors do not, and neither does anything interrupting a command.
+    return isinstance(error, imaplib.IMAP4.error) and not isinstance(
+        error, imaplib.IMAP4.abort
+    )
+
+
+@dataclass
+class IMAPSession:
+    """
+    A logged-in IMAP connection checked out of the pool, with the folder
+    it has selected and that folder's UIDVALIDITY.
+
+    Each session owns a single worker thread. Async code runs blocking
+    imaplib calls there with ``run``, so a slow mailbox never ties up
+    the event loop or the default executor shared by other nodes.
+    """
+
+    imap: imaplib.IMAP4
+    key: ConnectionKey
+    secret: str
+    folder: str | None = None
+    uidvalidity: int | None = None
+    last_used: float = field(default_factory=time.monotonic)
+    executor: ThreadPoolExecutor = field(default_factory=_executor, repr=False)
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run ``func(*args)`` on the session's thread.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args))
+
+    def _take_uidvalidity(self) -> None:
+        values = self.imap.untagged_responses.pop("UIDVALIDITY", None)
+        if values and values[-1]:
+            self.uidvalidity = int(values[-1])
+
+    def select(self, folder: str) -> None:
+        """
+        Select ``folder`` unless it is already selected.
+        """
+        if folder == self.folder:
+            return
+        status, data = self.imap.select(folder)
+        if status != "OK":
+            self.folder = None
+            raise imaplib.IMAP4.error(f"SELECT {folder} failed: {data!r}")
+        self.folder = folder
+        self.uidvalidity = None
+        self._take_uidvalidity()
+
+    def check(self) -> None:
+        """
+        Send NOOP to make sure the session is alive and pick up mailbox
+        changes reported since it was last used.
+        """
+        status, data = self.imap.noop()
+        if status != "OK":
+            raise imaplib.IMAP4.abort(f"NOOP failed: {data!r}")
+        self._take_uidvalidity()
+        self.imap.untagged_responses.clear()
+
+
+class IMAPConnectionPool:
+    """
+    Keeps authenticated IMAP sessions alive between node runs so that a
+    search does not pay for a TLS handshake, LOGIN and SELECT every time.
+
+    Sessions are keyed by host, port, user and SSL. A session unused for
+    more than ``check_after`` seconds is checked with NOOP before reuse,
+    and one unused for more than ``max_idle_time`` is logged out. A
+    session is checked out by one caller at a time, so concurrent
+    searches each get their own connection. ``acquire`` and ``session``
+    block and suit worker threads; async code uses ``acquire_async`` and
+    ``connect``.
+    """
+
+    def __init__(
+        self,
+        config: IMAPPoolConfig | None = None,
+        connect: Callable[..., imaplib.IMAP4] = open_imap,
+    ):
+        self.config = config or IMAPPoolConfig()
+        self._connect = connect
+        self._idle: dict[ConnectionKey, list[IMAPSession]] = {}
+        self._lock = threading.Lock()
+
+    def _pop_idle(
+        self, key: ConnectionKey, secret: str
+    ) -> tuple[IMAPSession | None, bool]:
+        """
+        Take an idle session for ``key``, dropping expired ones, and say
+        whether it needs a NOOP check before use.
+        """
+        while True:
+            with self._lock:
+                sessions = self._idle.get(key)
+                session = sessions.pop() if sessions else None
+            if session is None:
+                return None, False
+            idle_for = time.monotonic() - session.last_used
+            if session.secret != secret or idle_for > self.config.max_idle_time:
+                self._close(session, logout=True)
+                continue
+            return session, idle_for > self.config.check_after
+
+    def _open(
+        self, connection: Any, executor: ThreadPoolExecutor | None = None
+    ) -> IMAPSession:
+        imap = self._connect(
+            connection.host, connection.port, connection.use_ssl, self.config.timeout
+        )
+        session = IMAPSession(
+            imap,
+            connection_key(connection),
+            _secret(connection.password),
+            executor=executor or _executor(),
+        )
+        try:
+            imap.login(connection.username, connection.password)
+        except BaseException:
+            self._close(session, logout=False)
+            raise
+        return session
+
+    def acquire(self, connection: Any) -> IMAPSession:
+        """
+        Check out a logged-in session for ``connection``, reusing an idle
+        one when it is still healthy. Blocks the calling thread.
+        """
+        key, secret = connection_key(connection), _secret(connection.password)
+        while True:
+            session, check = self._pop_idle(key, secret)
+            if session is None:
+                return self._open(connection)
+            try:
+                if check:
+                    session.check()
+                return session
+            except (imaplib.IMAP4.error, OSError):
+                self._close(session, logout=False)
+
+    async def acquire_async(self, connection: Any) -> IMAPSession:
+        """
+        Like ``acquire``, but connects and checks sessions on their own
+        threads instead of blocking the event loop.
+        """
+        key, secret = connection_key(connection), _secret(connection.password)
+        while True:
+            session, check = self._pop_idle(key, secret)
+            if session is None:
+                executor = _executor()
+                try:
+                    return await asyncio.get_running_loop().run_in_executor(
+                        executor, self._open, connection, executor
+                    )
+                except BaseException:
+                    executor.shutdown(wait=False)
+                    raise
+            try:
+                if check:
+                    await session.run(session.check)
+                return session
+            except (imaplib.IMAP4.error, OSError):
+                self._close(session, logout=False)
+
+    def release(self, session: IMAPSession, reuse: bool = True) -> None:
+        """
+        Return a session to the pool, or drop it when ``reuse`` is False
+        or the account already has enough idle sessions.
+        """
+        if not reuse:
+            self._close(session, logout=False)
+            return
+        session.last_used = time.monotonic()
+        with self._lock:
+            sessions = self._idle.setdefault(session.key, [])
+            if len(sessions) < self.config.max_idle_per_account:
+                sessions.append(session)
+                return
+        self._close(session, logout=True)
+
+    @contextmanager
+    def session(
+        self, connection: Any, folder: str | None = None
+    ) -> Iterator[IMAPSession]:
+        """
+        Check out a session with ``folder`` selected for the duration of
+        the block. The session goes back to the pool unless the block
+        failed with a connection error.
+        """
+        session = self.acquire(connection)
+        reuse = False
+        try:
+            if folder is not None:
+                session.select(folder)
+            yield session
+            reuse = True
+        except BaseException as e:
+            reuse = _keeps_connection(e)
+            raise
+        finally:
+            self.release(session, reuse)
+
+    @asynccontextmanager
+    async def connect(
+        self, connection: Any, folder: str | None = None
+    ) -> AsyncIterator[IMAPSession]:
+        """
+        Async version of ``session``. Run IMAP calls on the session with
+        ``IMAPSession.run``.
+        """
+        session = await self.acquire_async(connection)
+        reuse = False
+        try:
+            if folder is not None:
+                await session.run(session.select, folder)
+            yield session
+            reuse = True
+        except BaseException as e:
+            reuse = _keeps_connection(e)
+            raise
+        finally:
+            self.release(session, reuse)
+
+    def _close(self, session: IMAPSession, logout: bool, wait: bool = False) -> None:
+        """
+        Log out on the session's thread, or, without ``logout``, shut the
+        socket down at once so a call blocked on it fails.
+        """
+        if logout:
+            try:
+                session.executor.submit(_logout, session.imap)
+            except RuntimeError:
+                # The interpreter is shutting down and refuses new work.
+                _logout(session.imap)
+        else:
+            try:
+                session.imap.shutdown()
+            except Exception:
+                pass
+        session.executor.shutdown(wait=wait)
+
+    def close(self) -> None:
+        """
+        Log out all idle sessions.
+        """
+        with self._lock:
+            sessions = [s for idle in self._idle.values() for s in idle]
+            self._idle.clear()
+        for session in sessions:
+            self._close(session, logout=True, wait=True)
+
+
+_pool: IMAPConnectionPool | None = None
+
+
+def get_imap_pool() -> IMAPConnectionPool:
+    """
+    Return the process-wide IMAP connection pool.
+    """
+    global _pool
+    if _pool is None:
+        _pool = IMAPConnectionPool()
+    return _pool
+
+
+def configure_imap_pool(**kwargs: Any) -> IMAPConnectionPool:
+    """
+    Replace the process-wide pool with one using updated settings. Idle
+    sessions of the old pool are logged out.
+    """
+    global _pool
+    config = replace(_pool.config if _pool else IMAPPoolConfig(), **kwargs)
+    if _pool is not None:
+        _pool.close()
+    _pool = IMAPConnectionPool(config)
+    return _pool
+
+
+@atexit.register
+def _close_pool_at_exit() -> None:
+    if _pool is not None:
+        _pool.close()
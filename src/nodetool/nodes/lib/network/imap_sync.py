@@ -0,0 +1,183 @@
+import imaplib
+import os
+import re
+from dataclasses import dataclass
+
+from nodetool.nodes.lib.network.sqlite_store import SQLiteStore, StoreSlot
+
+DEFAULT_STATE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "nodetool", "imap_state.sqlite3"
+)
+# Servers may drop clients that stay in IDLE for 30 minutes (RFC 2177).
+DEFAULT_IDLE_TIMEOUT = 25 * 60.0
+
+_CHANGE = re.compile(rb"^\* (?:\d+ (?:EXISTS|EXPUNGE|FETCH)|OK \[UIDVALIDITY)")
+
+
+@dataclass
+class MailboxState:
+    """
+    The UIDVALIDITY of a folder and the highest UID already returned for a
+    search in it. UIDs below ``last_uid`` are only meaningful while the
+    UIDVALIDITY is unchanged.
+    """
+
+    key: str
+    uidvalidity: int | None
+    last_uid: int
+
+
+def account_key(connection) -> str:
+    """
+    Identify the account of an IMAPConnection.
+    """
+    return f"{connection.username}@{connection.host.lower()}:{connection.port}"
+
+
+def mailbox_key(connection, folder: str, query: str) -> str:
+    """
+    Identify a search in a folder of an account.
+    """
+    return f"{account_key(connection)}/{folder}?{query}"
+
+
+class MailboxStateStore(SQLiteStore):
+    """
+    SQLite store of MailboxState per search, keyed by ``mailbox_key``.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS mailboxes (
+            key TEXT PRIMARY KEY,
+            uidvalidity INTEGER,
+            last_uid INTEGER NOT NULL
+        );
+        """
+
+    def __init__(self, path: str = DEFAULT_STATE_PATH):
+        super().__init__(path)
+
+    def load(self, key: str) -> MailboxState | None:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT uidvalidity, last_uid FROM mailboxes WHERE key = ?",
+                    (key,),
+                )
+                .fetchone()
+            )
+        return None if row is None else MailboxState(key, *row)
+
+    def save(self, state: MailboxState) -> None:
+        with self._lock:
+            db = self._connect()
+            db.execute(
+                "INSERT OR REPLACE INTO mailboxes (key, uidvalidity, last_uid)"
+                " VALUES (?, ?, ?)",
+                (state.key, state.uidvalidity, state.last_uid),
+            )
+            db.commit()
+
+    def forget(self, key: str) -> None:
+        with self._lock:
+            db = self._connect()
+            db.execute("DELETE FROM mailboxes WHERE key = ?", (key,))
+            db.commit()
+
+
+_store = StoreSlot(MailboxStateStore)
+
+
+def get_mailbox_state_store() -> MailboxStateStore:
+    """
+    Return the process-wide mailbox state store.
+    """
+    return _store.get()
+
+
+def configure_mailbox_state_store(
+    path: str = DEFAULT_STATE_PATH,
+) -> MailboxStateStore:
+    """
+    Replace the process-wide mailbox state store.
+    """
+    return _store.configure(path)
+
+
+def search_uids(imap: imaplib.IMAP4, query: str) -> list[int]:
+    """
+    Run ``UID SEARCH`` and return the matching UIDs in ascending order.
+    """
+    status, data = imap.uid("SEARCH", None, query)
+    if status != "OK":
+        raise imaplib.IMAP4.error(f"SEARCH failed: {data!r}")
+    return sorted(int(uid) for uid in (data[0] or b"").split())
+
+
+def new_uids(
+    imap: imaplib.IMAP4,
+    state: MailboxState | None,
+    uidvalidity: int | None,
+    query: str,
+) -> list[int]:
+    """
+    Return the UIDs matching ``query`` above ``state.last_uid``, searching
+    only that range. Without a state, or when the folder's UIDVALIDITY
+    changed, every match is new.
+    """
+    if state is None or state.uidvalidity != uidvalidity:
+        return search_uids(imap, query)
+    # "n:*" always includes the highest UID, even when it is below n.
+    uids = search_uids(imap, f"UID {state.last_uid + 1}:* {query}")
+    return [uid for uid in uids if uid > state.last_uid]
+
+
+def idle(imap: imaplib.IMAP4, timeout: float = DEFAULT_IDLE_TIMEOUT) -> list[bytes]:
+    """
+    Wait in IDLE (RFC 2177) until the server reports a mailbox change or
+    ``timeout`` seconds pass, then leave IDLE. Returns the untagged
+    responses that announced changes, which is empty on timeout.
+
+    imaplib has no IDLE support and its reader cannot time out and resume,
+    so the socket timeout bounds the wait and the reader is rebuilt after
+    it fires.
+    """
+    if "IDLE" not in imap.capabilities:
+        raise imaplib.IMAP4.error("The server does not support IDLE")
+    tag = b"IDLE"
+    imap.send(tag + b" IDLE\r\n")
+    line = imap.readline()
+    if not line.startswith(b"+"):
+        raise imaplib.IMAP4.error(f"IDLE failed: {line!r}")
+
+    changes: list[bytes] = []
+    sock = imap.sock
+    previous = sock.gettimeout()
+    sock.settimeout(timeout)
+    try:
+        while not changes:
+            try:
+                line = imap.readline()
+            except TimeoutError:
+                imap.file.close()
+                imap.file = sock.makefile("rb")
+                break
+            if not line:
+                raise imaplib.IMAP4.abort("socket error: EOF")
+            if _CHANGE.match(line):
+                changes.append(line.rstrip(b"\r\n"))
+    finally:
+        sock.settimeout(previous)
+
+    imap.send(b"DONE\r\n")
+    while True:
+        line = imap.readline()
+        if not line:
+            raise imaplib.IMAP4.abort("socket error: EOF")
+        if line.startswith(tag + b" "):
+            if not line.startswith(tag + b" OK"):
+                raise imaplib.IMAP4.error(f"IDLE failed: {line!r}")
+            return changes
+        if _CHANGE.match(line):
+            changes.append(line.rstrip(b"\r\n"))
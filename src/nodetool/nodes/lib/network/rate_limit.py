@@ -0,0 +1,154 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Mapping, TypeVar
+
+from nodetool.nodes.lib.network.concurrency import url_host
+from nodetool.nodes.lib.network.retry import (
+    RETRY_EXCEPTIONS,
+    error_status,
+    parse_retry_after,
+)
+
+T = TypeVar("T")
+
+# Reset headers above this are absolute epoch seconds rather than a delta.
+EPOCH_THRESHOLD = 1_000_000_000
+BACKOFF_FACTOR = 0.5
+RECOVERY_STEP = 0.1
+
+
+def _header(headers: Mapping[str, str], name: str) -> str | None:
+    return headers.get(f"X-RateLimit-{name}") or headers.get(f"RateLimit-{name}")
+
+
+class TokenBucket:
+    """
+    Token bucket allowing ``rate`` requests per second with bursts of up to
+    ``burst`` requests, implemented as a virtual scheduler: each acquire
+    reserves the next free slot, so no lock or background task is needed.
+
+    The effective rate adapts to the server. A 429 halves it and a
+    Retry-After pauses the bucket; X-RateLimit-Remaining / X-RateLimit-Reset
+    spread the remaining quota over the window, and the rate creeps back
+    up to the configured ceiling while responses succeed.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.current_rate = rate
+        self._tat = 0.0
+        self._blocked_until = 0.0
+
+    def configure(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.current_rate = min(self.current_rate, rate)
+
+    def reserve(self, now: float | None = None) -> float:
+        """
+        Reserve the next slot and return how many seconds to wait for it.
+        """
+        now = time.monotonic() if now is None else now
+        interval = 1.0 / self.current_rate
+        tolerance = (self.burst - 1) * interval
+        start = max(now, self._blocked_until, self._tat - tolerance)
+        self._tat = max(self._tat, start) + interval
+        return start - now
+
+    async def acquire(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float, now: float | None = None) -> None:
+        now = time.monotonic() if now is None else now
+        self._blocked_until = max(self._blocked_until, now + seconds)
+        self._tat = max(self._tat, self._blocked_until)
+
+    def observe(
+        self, status: int | None, headers: Mapping[str, str], now: float | None = None
+    ) -> None:
+        """
+        Adapt the rate to a response status and its rate limit headers.
+        """
+        now = time.monotonic() if now is None else now
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+
+        if status == 429:
+            self.slow_down()
+            if retry_after is not None:
+                self.pause(retry_after, now)
+        elif self.current_rate < self.rate:
+            self.current_rate = min(
+                self.rate, self.current_rate + self.rate * RECOVERY_STEP
+            )
+
+        try:
+            remaining = int(_header(headers, "Remaining") or "")
+            reset = float(_header(headers, "Reset") or "")
+        except ValueError:
+            return
+        if reset > EPOCH_THRESHOLD:
+            reset -= time.time()
+        if reset <= 0:
+            return
+        if remaining <= 0:
+            self.pause(reset, now)
+        else:
+            self.current_rate = min(self.current_rate, remaining / reset)
+
+    def slow_down(self) -> None:
+        self.current_rate = max(self.rate / 100, self.current_rate * BACKOFF_FACTOR)
+
+    def observe_error(self, error: BaseException) -> None:
+        """
+        Adapt the rate to a failed request: like its status when the error
+        carries one, and by backing off on connection errors and timeouts.
+        """
+        status, headers = error_status(error)
+        if status is not None:
+            self.observe(status, headers)
+        elif isinstance(error, RETRY_EXCEPTIONS):
+            self.slow_down()
+
+
+async def send_limited(
+    limiter: TokenBucket | None,
+    send: Callable[[], Awaitable[T]],
+    status_of: Callable[[T], tuple[int | None, Mapping[str, str]]],
+) -> T:
+    """
+    Wait for a slot of ``limiter``, await ``send()`` and adapt the rate to
+    the status and headers ``status_of`` reads from its result, or to the
+    error it raised. Without a limiter ``send`` is simply awaited.
+    """
+    if limiter is None:
+        return await send()
+    await limiter.acquire()
+    try:
+        result = await send()
+    except Exception as e:
+        limiter.observe_error(e)
+        raise
+    limiter.observe(*status_of(result))
+    return result
+
+
+_buckets: dict[str, TokenBucket] = {}
+
+
+def get_rate_limiter(url: str, rate: float, burst: int = 1) -> TokenBucket | None:
+    """
+    Return the process-wide token bucket for the host of ``url``, or None
+    if ``rate`` is not positive. Later calls update the configured rate.
+    """
+    if rate <= 0:
+        return None
+    host = url_host(url)
+    bucket = _buckets.get(host)
+    if bucket is None:
+        bucket = _buckets[host] = TokenBucket(rate, burst)
+    elif (bucket.rate, bucket.burst) != (rate, max(1, burst)):
+        bucket.configure(rate, burst)
+    return bucket
@@ -0,0 +1,186 @@
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass, replace
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Mapping, TypeVar
+
+import aiohttp
+
+T = TypeVar("T")
+
+log = logging.getLogger(__name__)
+
+RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+RETRY_EXCEPTIONS: tuple[type[BaseException], ...] = (
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientPayloadError,
+    asyncio.TimeoutError,
+    ConnectionError,
+)
+
+try:
+    import httpx
+
+    RETRY_EXCEPTIONS += (httpx.TransportError,)
+except ImportError:
+    pass
+
+# Statuses and errors that guarantee the server did not act on the request,
+# so even non-idempotent methods can safely be sent again.
+SAFE_RETRY_STATUSES = frozenset({429, 503})
+SAFE_RETRY_EXCEPTIONS: tuple[type[BaseException], ...] = (aiohttp.ClientConnectorError,)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class RetryableStatus(Exception):
+    """
+    Raised by a request attempt whose response status should be retried.
+    """
+
+    def __init__(
+        self, status: int, headers: Mapping[str, str] | None = None, url: str = ""
+    ):
+        super().__init__(f"HTTP {status} from {url}" if url else f"HTTP {status}")
+        self.status = status
+        self.headers = headers or {}
+
+
+def parse_retry_after(value: str | None, now: float | None = None) -> float | None:
+    """
+    Parse a Retry-After header given either as seconds or as an HTTP date.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        date = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, date - (now if now is not None else time.time()))
+
+
+def error_status(error: BaseException) -> tuple[int | None, Mapping[str, str]]:
+    # aiohttp.ClientResponseError and RetryableStatus carry status/headers,
+    # httpx.HTTPStatusError carries them on its response.
+    status = getattr(error, "status", None)
+    headers = getattr(error, "headers", None)
+    response = getattr(error, "response", None)
+    if status is None and response is not None:
+        status = getattr(response, "status_code", None)
+        headers = getattr(response, "headers", None)
+    return (status if isinstance(status, int) else None), headers or {}
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter.
+
+    The n-th retry waits a random time between 0 and
+    ``min(backoff_max, backoff_base * 2**n)`` seconds, or as long as the
+    server asks for with Retry-After. Retry-After values above
+    ``retry_after_max`` are not waited for and the error is raised instead.
+    """
+
+    max_attempts: int = 4
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    retry_after_max: float = 120.0
+    retry_statuses: frozenset[int] = RETRY_STATUSES
+    retry_exceptions: tuple[type[BaseException], ...] = RETRY_EXCEPTIONS
+
+    def for_method(self, method: str) -> "RetryPolicy":
+        """
+        Restrict the policy to failures that are safe to retry for ``method``.
+        """
+        if method.upper() in IDEMPOTENT_METHODS:
+            return self
+        return replace(
+            self,
+            retry_statuses=self.retry_statuses & SAFE_RETRY_STATUSES,
+            retry_exceptions=SAFE_RETRY_EXCEPTIONS,
+        )
+
+    def backoff(self, retry: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**retry))
+
+    def check_status(
+        self, status: int, headers: Mapping[str, str] | None = None, url: str = ""
+    ) -> None:
+        """
+        Raise RetryableStatus if ``status`` should be retried.
+        """
+        if status in self.retry_statuses:
+            raise RetryableStatus(status, headers, url)
+
+    def retry_delay(self, error: BaseException, retry: int) -> float | None:
+        """
+        Return how long to wait before retrying after ``error``, or None if
+        it should not be retried.
+        """
+        status, headers = error_status(error)
+        if status is not None:
+            if status not in self.retry_statuses:
+                return None
+        elif not isinstance(error, self.retry_exceptions):
+            return None
+
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+        if retry_after is None:
+            return self.backoff(retry)
+        if retry_after > self.retry_after_max:
+            return None
+        return retry_after
+
+
+@dataclass
+class RetryStats:
+    """
+    Counts the retries spent by one or more ``with_retry`` calls.
+    """
+
+    retries: int = 0
+
+
+async def with_retry(
+    policy: RetryPolicy,
+    func: Callable[[], Awaitable[T]],
+    stats: RetryStats | None = None,
+    status_of: Callable[[T], tuple[int, Mapping[str, str]]] | None = None,
+) -> T:
+    """
+    Call ``func`` until it succeeds or ``policy`` gives up.
+
+    Failures are exceptions raised by ``func``. When ``status_of`` is given,
+    results whose status is retryable count as failures too; once attempts
+    run out the last such result is returned rather than raised.
+    """
+    retry = 0
+    while True:
+        final = retry + 1 >= policy.max_attempts
+        try:
+            result = await func()
+        except Exception as e:
+            delay = None if final else policy.retry_delay(e, retry)
+            if delay is None:
+                raise
+            log.debug("Retrying after %s in %.2fs", e, delay)
+        else:
+            if status_of is None or final:
+                return result
+            status, headers = status_of(result)
+            if status not in policy.retry_statuses:
+                return result
+            delay = policy.retry_delay(RetryableStatus(status, headers), retry)
+            if delay is None:
+                return result
+            log.debug("Retrying after HTTP %s in %.2fs", status, delay)
+
+        retry += 1
+        if stats is not None:
+            stats.retries += 1
+        await asyncio.sleep(delay)
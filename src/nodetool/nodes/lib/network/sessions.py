@@ -0,0 +1,116 @@
+import asyncio
+import atexit
+import json
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+import aiohttp
+from multidict import CIMultiDict
+
+
+@dataclass(frozen=True)
+class SessionPoolConfig:
+    """
+    Connection pool settings for the shared aiohttp session.
+    """
+
+    limit: int = 100
+    limit_per_host: int = 0
+    ttl_dns_cache: int = 300
+    keepalive_timeout: float = 30.0
+
+
+_config = SessionPoolConfig()
+_sessions: dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
+
+def configure_session_pool(**kwargs: Any) -> SessionPoolConfig:
+    """
+    Update the pool settings. Sessions created after this call use the new
+    settings; call ``close_sessions`` to apply them to an open pool.
+    """
+    global _config
+    _config = replace(_config, **kwargs)
+    return _config
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """
+    Return the shared keep-alive session for the running event loop.
+
+    Reusing one session keeps the connection pool, DNS cache and TLS
+    sessions warm across node executions.
+    """
+    loop = asyncio.get_running_loop()
+    for stale in [l for l in _sessions if l.is_closed()]:
+        del _sessions[stale]
+
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=_config.limit,
+            limit_per_host=_config.limit_per_host,
+            ttl_dns_cache=_config.ttl_dns_cache,
+            keepalive_timeout=_config.keepalive_timeout,
+        )
+        session = aiohttp.ClientSession(connector=connector)
+        _sessions[loop] = session
+    return session
+
+
+async def close_sessions() -> None:
+    """
+    Close the shared session of the running event loop.
+    """
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+@atexit.register
+def _close_sessions_at_exit() -> None:
+    for loop, session in list(_sessions.items()):
+        if session.closed or loop.is_closed() or loop.is_running():
+            continue
+        loop.run_until_complete(session.close())
+    _sessions.clear()
+
+
+@dataclass
+class PooledResponse:
+    """
+    Fully read response from the shared session, exposing the attributes the
+    HTTP nodes use on ProcessingContext responses.
+    """
+
+    status: int
+    headers: CIMultiDict = field(default_factory=CIMultiDict)
+    content: bytes = b""
+    encoding: str | None = None
+
+    @property
+    def status_code(self) -> int:
+        return self.status
+
+    def json(self) -> Any:
+        return json.loads(self.content.decode(self.encoding or "utf-8"))
+
+
+async def pooled_request(
+    method: str, url: str, raise_for_status: bool = True, **kwargs: Any
+) -> PooledResponse:
+    """
+    Send a request over the shared session and read the full body.
+    Error statuses raise ``aiohttp.ClientResponseError`` unless
+    ``raise_for_status`` is False.
+    """
+    session = await get_session()
+    async with session.request(method, url, **kwargs) as response:
+        if raise_for_status:
+            response.raise_for_status()
+        return PooledResponse(
+            status=response.status,
+            headers=CIMultiDict(response.headers),
+            content=await response.read(),
+            encoding=response.charset,
+        )
@@ -0,0 +1,83 @@
+import os
+import sqlite3
+import threading
+from typing import Any, Callable, Generic, TypeVar
+
+S = TypeVar("S", bound="SQLiteStore")
+
+
+class SQLiteStore:
+    """
+    Base of the on-disk caches and state stores.
+
+    The database at ``path`` is opened and given the subclass's ``SCHEMA``
+    on first use. Methods serialize on ``_lock``, so one store can be
+    shared by worker threads; they all block, which is why the async code
+    calls them through ``asyncio.to_thread``.
+    """
+
+    SCHEMA = ""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            db = sqlite3.connect(self.path, check_same_thread=False)
+            db.executescript(self.SCHEMA)
+            self._db = db
+        return self._db
+
+    @staticmethod
+    def _evict(db: sqlite3.Connection, table: str, max_bytes: int) -> None:
+        """
+        Delete the least recently used rows of ``table`` until its ``size``
+        column adds up to at most ``max_bytes``. The table needs ``size``
+        and ``last_access`` columns.
+        """
+        db.execute(
+            f"DELETE FROM {table} WHERE rowid IN ("
+            " SELECT rowid FROM (SELECT rowid, SUM(size) OVER"
+            " (ORDER BY last_access DESC, rowid DESC) AS kept"
+            f" FROM {table}) WHERE kept > ?)",
+            (max_bytes,),
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+class StoreSlot(Generic[S]):
+    """
+    Holder of a process-wide store, created with ``factory()`` on first use
+    and replaced by ``configure``.
+    """
+
+    def __init__(self, factory: Callable[..., S]):
+        self.factory = factory
+        self._store: S | None = None
+
+    def get(self) -> S:
+        if self._store is None:
+            self._store = self.factory()
+        return self._store
+
+    def configure(self, *args: Any, **kwargs: Any) -> S:
+        """
+        Close the current store and replace it with ``factory(*args,
+        **kwargs)``.
+        """
+        self.reset()
+        self._store = self.factory(*args, **kwargs)
+        return self._store
+
+    def reset(self) -> None:
+        if self._store is not None:
+            self._store.close()
+            self._store = None
@@ -0,0 +1,244 @@
+import asyncio
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+from unittest.mock import MagicMock, patch
+
+from nodetool.nodes.lib.network import browser
+from nodetool.nodes.lib.network.browser import DriverPool, get_driver_pool
+
+
+def make_factory():
+    drivers = []
+
+    def factory():
+        driver = MagicMock()
+        drivers.append(driver)
+        return driver
+
+    return factory, drivers
+
+
+class TestDriverPool:
+    @pytest.mark.asyncio
+    async def test_reuses_and_resets_driver(self):
+        factory, drivers = make_factory()
+        pool = DriverPool(size=2, factory=factory)
+
+        async with pool.lease() as first:
+            pass
+        async with pool.lease() as second:
+            pass
+
+        assert first is second
+        assert len(drivers) == 1
+        first.delete_all_cookies.assert_called()
+        first.get.assert_called_with("about:blank")
+        first.quit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reset_clears_browser_state(self):
+        factory, drivers = make_factory()
+        pool = DriverPool(size=1, factory=factory)
+
+        async with pool.lease() as driver:
+            driver.execute_script.return_value = "https://example.com"
+
+        cdp = [call.args for call in driver.execute_cdp_cmd.call_args_list]
+        assert ("Network.clearBrowserCookies", {}) in cdp
+        assert ("Network.clearBrowserCache", {}) in cdp
+        assert (
+            "Storage.clearDataForOrigin",
+            {"origin": "https://example.com", "storageTypes": "all"},
+        ) in cdp
+        assert "sessionStorage.clear()" in driver.execute_script.call_args.args[0]
+        driver.get.assert_called_with("about:blank")
+
+    @pytest.mark.asyncio
+    async def test_limits_running_browsers(self):
+        factory, drivers = make_factory()
+        pool = DriverPool(size=2, factory=factory)
+        active = 0
+        peak = 0
+
+        async def fetch():
+            nonlocal active, peak
+            async with pool.lease():
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(fetch() for _ in range(6)))
+
+        assert peak == 2
+        assert len(drivers) == 2
+
+    @pytest.mark.asyncio
+    async def test_recycles_after_max_pages(self):
+        factory, drivers = make_factory()
+        pool = DriverPool(size=1, max_pages=2, factory=factory)
+
+        for _ in range(3):
+            async with pool.lease():
+                pass
+
+        assert len(drivers) == 2
+        drivers[0].quit.assert_called_once()
+        drivers[1].quit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_discards_driver_that_fails_reset(self):
+        factory, drivers = make_factory()
+        pool = DriverPool(size=1, factory=factory)
+
+        async with pool.lease() as driver:
+            driver.delete_all_cookies.side_effect = Exception("browser crashed")
+        async with pool.lease():
+            pass
+
+        assert len(drivers) == 2
+        drivers[0].quit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_discards_driver_after_error(self):
+        factory, drivers = make_factory()
+        pool = DriverPool(size=1, factory=factory)
+
+        with pytest.raises(TimeoutException):
+            async with pool.lease():
+                raise TimeoutException("page load")
+        async with pool.lease():
+            pass
+
+        assert len(drivers) == 2
+        drivers[0].quit.assert_called_once()
+        drivers[0].delete_all_cookies.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_discards_driver_after_cancel(self):
+        factory, drivers = make_factory()
+        pool = DriverPool(size=1, factory=factory)
+        leased = asyncio.Event()
+
+        async def fetch():
+            async with pool.lease():
+                leased.set()
+                await asyncio.sleep(10)
+
+        task = asyncio.create_task(fetch())
+        await leased.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        async with pool.lease():
+            pass
+
+        assert len(drivers) == 2
+        drivers[0].quit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_factory_failure_frees_slot(self):
+        calls = 0
+
+        def factory():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("chrome not found")
+            return MagicMock()
+
+        pool = DriverPool(size=1, factory=factory)
+        with pytest.raises(RuntimeError):
+            async with pool.lease():
+                pass
+        async with pool.lease() as driver:
+            assert driver is not None
+
+    @pytest.mark.asyncio
+    async def test_close_idle(self):
+        factory, drivers = make_factory()
+        pool = DriverPool(size=1, factory=factory)
+        async with pool.lease():
+            pass
+
+        pool.close_idle()
+
+        drivers[0].quit.assert_called_once()
+        async with pool.lease():
+            pass
+        assert len(drivers) == 2
+
+
+class TestGetDriverPool:
+    @pytest.mark.asyncio
+    async def test_shared_per_loop(self):
+        try:
+            pool = get_driver_pool(size=3, max_pages=10)
+            assert get_driver_pool(size=3, max_pages=10) is pool
+        finally:
+            browser.close_driver_pools()
+
+    @pytest.mark.asyncio
+    async def test_separate_pool_per_size(self):
+        try:
+            small = get_driver_pool(size=2, max_pages=50)
+            large = get_driver_pool(size=4, max_pages=50)
+            assert small is not large
+            assert (small.size, large.size) == (2, 4)
+            assert get_driver_pool(size=2, max_pages=50) is small
+        finally:
+            browser.close_driver_pools()
+
+
+class TestRenderPage:
+    def test_load(self):
+        driver = MagicMock(page_source="<html></html>")
+        driver.execute_script.return_value = "complete"
+
+        html = browser.render_page(driver, "https://example.com")
+
+        assert html == "<html></html>"
+        driver.get.assert_called_once_with("https://example.com")
+        driver.execute_cdp_cmd.assert_not_called()
+
+    def test_blocked_urls(self):
+        driver = MagicMock()
+        driver.execute_script.return_value = "complete"
+        patterns = browser.block_patterns(images=True, trackers=True)
+
+        browser.render_page(driver, "https://example.com", blocked=patterns)
+
+        driver.execute_cdp_cmd.assert_any_call(
+            "Network.setBlockedURLs", {"urls": patterns}
+        )
+        assert "*.jpg*" in patterns
+        assert "*doubleclick.net*" in patterns
+        assert "*.mp4*" not in patterns
+
+    def test_dom_ready(self):
+        driver = MagicMock()
+        driver.execute_script.return_value = "interactive"
+        browser.wait_for_page(driver, "dom_ready", timeout=1)
+
+    def test_load_timeout(self):
+        driver = MagicMock()
+        driver.execute_script.return_value = "interactive"
+        with pytest.raises(TimeoutException):
+            browser.wait_for_page(driver, "load", timeout=0.2)
+
+    def test_network_idle(self):
+        driver = MagicMock()
+        driver.execute_script.side_effect = [-1, 3, 5] + [5] * 100
+        with patch.object(browser, "NETWORK_IDLE_TIME", 0.2):
+            browser.wait_for_page(driver, "network_idle", timeout=5)
+        assert driver.execute_script.call_count < 20
+
+    def test_selector(self):
+        driver = MagicMock()
+        browser.wait_for_page(driver, "selector", timeout=1, selector="#app")
+        driver.find_element.assert_called_with("css selector", "#app")
+
+    def test_unknown_strategy(self):
+        with pytest.raises(ValueError):
+            browser.wait_for_page(MagicMock(), "later", timeout=1)
@@ -0,0 +1,97 @@
+import asyncio
+import pytest
+
+from nodetool.nodes.lib.network.concurrency import WorkPool, url_host
+
+
+class TestUrlHost:
+    def test_url_host(self):
+        assert url_host("https://Example.com:8080/a/b") == "example.com:8080"
+        assert url_host("/relative/path") == ""
+
+
+class TestWorkPool:
+    @pytest.mark.asyncio
+    async def test_run_preserves_input_order(self):
+        async def work(n):
+            await asyncio.sleep(0.01 * (5 - n))
+            return n * 2
+
+        pool = WorkPool(max_concurrency=3)
+        assert await pool.run(work, range(5)) == [0, 2, 4, 6, 8]
+
+    @pytest.mark.asyncio
+    async def test_map_yields_in_completion_order(self):
+        async def work(delay):
+            await asyncio.sleep(delay)
+            return delay
+
+        pool = WorkPool(max_concurrency=3)
+        completed = [index async for index, _ in pool.map(work, [0.05, 0.01, 0.03])]
+        assert completed == [1, 2, 0]
+
+    @pytest.mark.asyncio
+    async def test_slow_item_does_not_block_other_slots(self):
+        started = []
+
+        async def work(delay):
+            started.append(delay)
+            await asyncio.sleep(delay)
+
+        pool = WorkPool(max_concurrency=2)
+        # The fast items must all run while the slow one is still in flight.
+        await asyncio.wait_for(pool.run(work, [0.2] + [0.01] * 10), timeout=0.5)
+        assert len(started) == 11
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency(self):
+        in_flight = 0
+        peak = 0
+
+        async def work(_):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        await WorkPool(max_concurrency=4).run(work, range(20))
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    async def test_max_per_host(self):
+        in_flight: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        async def work(url):
+            host = url_host(url)
+            in_flight[host] = in_flight.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), in_flight[host])
+            await asyncio.sleep(0.01)
+            in_flight[host] -= 1
+            return url
+
+        urls = [f"https://a.com/{i}" for i in range(10)] + [
+            f"https://b.com/{i}" for i in range(10)
+        ]
+        pool = WorkPool(max_concurrency=8, max_per_host=2)
+        assert await pool.run(work, urls) == urls
+        assert peak == {"a.com": 2, "b.com": 2}
+
+    @pytest.mark.asyncio
+    async def test_exception_propagates(self):
+        async def work(n):
+            if n == 3:
+                raise ValueError("boom")
+            await asyncio.sleep(0.01)
+            return n
+
+        with pytest.raises(ValueError, match="boom"):
+            await WorkPool(max_concurrency=2).run(work, range(10))
+
+    @pytest.mark.asyncio
+    async def test_empty(self):
+        async def work(n):
+            return n
+
+        assert await WorkPool(max_concurrency=2).run(work, []) == []
@@ -0,0 +1,261 @@
+import json
+import os
+import re
+import pytest
+from unittest.mock import MagicMock
+
+from nodetool.nodes.lib.network.downloads import (
+    MANIFEST_SUFFIX,
+    PART_SUFFIX,
+    RangeNotSatisfied,
+    download_ranges,
+    filename_from_response,
+    probe_ranges,
+    split_ranges,
+    stream_to_file,
+)
+
+
+def mock_response(*chunks, error=None):
+    async def iter_chunked(chunk_size):
+        for chunk in chunks:
+            yield chunk
+        if error is not None:
+            raise error
+
+    return MagicMock(content=MagicMock(iter_chunked=iter_chunked))
+
+
+class TestFilenameFromResponse:
+    def test_content_disposition(self):
+        headers = {"Content-Disposition": 'attachment; filename="report.pdf"'}
+        assert filename_from_response("https://x.com/dl", headers) == "report.pdf"
+
+    def test_url_path(self):
+        assert (
+            filename_from_response("https://x.com/files/data%20set.csv?x=1", {})
+            == "data set.csv"
+        )
+
+    def test_unnamed(self):
+        assert filename_from_response("https://x.com/", {}) == "unnamed_file"
+
+    def test_path_traversal(self):
+        headers = {"Content-Disposition": "filename=../../etc/passwd"}
+        assert filename_from_response("https://x.com/dl", headers) == "passwd"
+
+
+class TestStreamToFile:
+    @pytest.mark.asyncio
+    async def test_writes_all_chunks(self, tmp_path):
+        filepath = str(tmp_path / "out.bin")
+        chunks = [bytes([i]) * 1000 for i in range(10)]
+
+        written = await stream_to_file(
+            mock_response(*chunks), filepath, buffer_size=2500
+        )
+
+        assert written == 10000
+        with open(filepath, "rb") as f:
+            assert f.read() == b"".join(chunks)
+        assert os.listdir(tmp_path) == ["out.bin"]
+
+    @pytest.mark.asyncio
+    async def test_failure_leaves_no_partial_file(self, tmp_path):
+        filepath = str(tmp_path / "out.bin")
+
+        with pytest.raises(ConnectionError):
+            await stream_to_file(
+                mock_response(b"partial", error=ConnectionError("reset")), filepath
+            )
+
+        assert os.listdir(tmp_path) == []
+
+
+class FakeRangeSession:
+    """
+    Minimal stand-in for aiohttp.ClientSession serving a byte string with
+    range support.
+    """
+
+    def __init__(self, body: bytes, etag: str = '"v1"', fail_after: int | None = None):
+        self.body = body
+        self.etag = etag
+        self.fail_after = fail_after
+        self.requested: list[str] = []
+
+    def head(self, url, **kwargs):
+        headers = {
+            "Accept-Ranges": "bytes",
+            "Content-Length": str(len(self.body)),
+            "ETag": self.etag,
+        }
+        return self._respond(200, headers, b"")
+
+    def get(self, url, headers=None, **kwargs):
+        headers = headers or {}
+        match = re.match(r"bytes=(\d+)-(\d+)", headers.get("Range", ""))
+        if not match or headers.get("If-Range") != self.etag:
+            return self._respond(200, {}, self.body)
+        self.requested.append(headers["Range"])
+        start, end = int(match.group(1)), int(match.group(2))
+        return self._respond(206, {}, self.body[start : end + 1])
+
+    def _respond(self, status, headers, body):
+        fail_after = self.fail_after
+
+        async def iter_chunked(chunk_size):
+            for i in range(0, len(body), chunk_size):
+                if fail_after is not None and i >= fail_after:
+                    raise ConnectionError("reset")
+                yield body[i : i + chunk_size]
+
+        response = MagicMock(status=status, headers=headers)
+        response.content.iter_chunked = iter_chunked
+        context = MagicMock()
+
+        async def aenter():
+            return response
+
+        async def aexit(*args):
+            return False
+
+        context.__aenter__ = lambda self: aenter()
+        context.__aexit__ = lambda self, *args: aexit(*args)
+        return context
+
+
+class TestSplitRanges:
+    def test_even_split(self):
+        assert split_ranges(100, 4, min_part_size=1) == [
+            (0, 24),
+            (25, 49),
+            (50, 74),
+            (75, 99),
+        ]
+
+    def test_uneven_split_covers_all_bytes(self):
+        ranges = split_ranges(10, 3, min_part_size=1)
+        assert ranges[0][0] == 0 and ranges[-1][1] == 9
+        assert sum(end - start + 1 for start, end in ranges) == 10
+
+    def test_min_part_size_limits_parts(self):
+        assert split_ranges(100, 8, min_part_size=50) == [(0, 49), (50, 99)]
+        assert split_ranges(10, 8, min_part_size=50) == [(0, 9)]
+
+    def test_empty(self):
+        assert split_ranges(0, 4, min_part_size=1) == []
+
+
+class TestDownloadRanges:
+    @pytest.mark.asyncio
+    async def test_probe(self):
+        session = FakeRangeSession(b"x" * 10)
+        probe = await probe_ranges(session, "https://x.com/f")
+        assert probe is not None
+        assert probe.size == 10
+        assert probe.etag == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_parallel_download(self, tmp_path):
+        body = os.urandom(10_000)
+        session = FakeRangeSession(body)
+        filepath = str(tmp_path / "data.bin")
+        probe = await probe_ranges(session, "https://x.com/f")
+
+        size = await download_ranges(
+            session,
+            "https://x.com/f",
+            filepath,
+            probe,
+            parts=4,
+            min_part_size=1000,
+            chunk_size=512,
+            buffer_size=1024,
+        )
+
+        assert size == len(body)
+        assert len(session.requested) == 4
+        with open(filepath, "rb") as f:
+            assert f.read() == body
+        assert os.listdir(tmp_path) == ["data.bin"]
+
+    @pytest.mark.asyncio
+    async def test_empty_file(self, tmp_path):
+        session = FakeRangeSession(b"")
+        filepath = str(tmp_path / "empty.bin")
+        probe = await probe_ranges(session, "https://x.com/f")
+
+        size = await download_ranges(session, "https://x.com/f", filepath, probe)
+
+        assert size == 0
+        assert session.requested == []
+        with open(filepath, "rb") as f:
+            assert f.read() == b""
+        assert os.listdir(tmp_path) == ["empty.bin"]
+
+    @pytest.mark.asyncio
+    async def test_resume_after_interruption(self, tmp_path):
+        body = os.urandom(8_000)
+        filepath = str(tmp_path / "data.bin")
+        kwargs = dict(parts=2, min_part_size=1000, chunk_size=500, buffer_size=1000)
+
+        failing = FakeRangeSession(body, fail_after=2000)
+        probe = await probe_ranges(failing, "https://x.com/f")
+        with pytest.raises(ConnectionError):
+            await download_ranges(failing, "https://x.com/f", filepath, probe, **kwargs)
+
+        # A range cancelled by its sibling's failure may not get credit for
+        # its last write, so check what the manifest records against the
+        # .part file instead of expecting exact counts.
+        with open(filepath + MANIFEST_SUFFIX) as f:
+            manifest = json.load(f)
+        with open(filepath + PART_SUFFIX, "rb") as f:
+            part = f.read()
+        assert 0 < sum(done for _, _, done in manifest["ranges"]) <= 4000
+        for start, end, done in manifest["ranges"]:
+            assert part[start : start + done] == body[start : start + done]
+
+        session = FakeRangeSession(body)
+        await download_ranges(session, "https://x.com/f", filepath, probe, **kwargs)
+
+        assert session.requested == [
+            f"bytes={start + done}-{end}" for start, end, done in manifest["ranges"]
+        ]
+        with open(filepath, "rb") as f:
+            assert f.read() == body
+        assert os.listdir(tmp_path) == ["data.bin"]
+
+    @pytest.mark.asyncio
+    async def test_changed_resource_restarts(self, tmp_path):
+        filepath = str(tmp_path / "data.bin")
+        kwargs = dict(parts=2, min_part_size=1000, chunk_size=500, buffer_size=1000)
+
+        failing = FakeRangeSession(b"a" * 4000, fail_after=1000)
+        probe = await probe_ranges(failing, "https://x.com/f")
+        with pytest.raises(ConnectionError):
+            await download_ranges(failing, "https://x.com/f", filepath, probe, **kwargs)
+
+        session = FakeRangeSession(b"b" * 4000, etag='"v2"')
+        probe = await probe_ranges(session, "https://x.com/f")
+        await download_ranges(session, "https://x.com/f", filepath, probe, **kwargs)
+
+        assert session.requested == ["bytes=0-1999", "bytes=2000-3999"]
+        with open(filepath, "rb") as f:
+            assert f.read() == b"b" * 4000
+
+    @pytest.mark.asyncio
+    async def test_ignored_range_raises(self, tmp_path):
+        session = FakeRangeSession(b"a" * 4000)
+        probe = await probe_ranges(session, "https://x.com/f")
+        session.etag = '"changed"'
+
+        with pytest.raises(RangeNotSatisfied):
+            await download_ranges(
+                session,
+                "https://x.com/f",
+                str(tmp_path / "data.bin"),
+                probe,
+                parts=2,
+                min_part_size=1000,
+            )
@@ -0,0 +1,90 @@
+import pytest
+
+from nodetool.nodes.lib.network import extraction_cache
+from nodetool.nodes.lib.network.extraction_cache import (
+    CacheMode,
+    ExtractionCache,
+    configure_extraction_cache,
+    memo_key,
+    memoize,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = configure_extraction_cache(path=str(tmp_path / "cache.sqlite3"))
+    yield cache
+    cache.close()
+    extraction_cache._cache.reset()
+
+
+def counting(result):
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return result
+
+    return compute, calls
+
+
+def test_memo_key():
+    assert memo_key("content", "<p>a</p>") == memo_key("content", "<p>a</p>")
+    assert memo_key("content", "<p>a</p>") != memo_key("content", "<p>b</p>")
+    assert memo_key("text", "<p>a</p>", (True,)) != memo_key(
+        "text", "<p>a</p>", (False,)
+    )
+    assert memo_key("content", "<p>a</p>") != memo_key("text", "<p>a</p>")
+
+
+class TestExtractionCache:
+    def test_memory_lru(self, tmp_path):
+        cache = ExtractionCache(max_entries=2, path=str(tmp_path / "c.sqlite3"))
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert len(cache) == 2
+
+    def test_disk_round_trip(self, tmp_path):
+        path = str(tmp_path / "c.sqlite3")
+        cache = ExtractionCache(path=path)
+        cache.store("key", {"title": "x"})
+        cache.close()
+        assert ExtractionCache(path=path).lookup("key") == {"title": "x"}
+
+    def test_disk_evicts_least_recently_used(self, tmp_path):
+        cache = ExtractionCache(path=str(tmp_path / "c.sqlite3"), max_bytes=20)
+        cache.store("a", "x" * 10)
+        cache.store("b", "y" * 10)
+        assert cache.lookup("a") is None
+        assert cache.lookup("b") == "y" * 10
+
+
+class TestMemoize:
+    @pytest.mark.asyncio
+    async def test_none_always_computes(self, cache):
+        compute, calls = counting("text")
+        for _ in range(2):
+            assert await memoize(CacheMode.NONE, "text", "<p>", (), compute) == "text"
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_memory(self, cache):
+        compute, calls = counting("text")
+        for _ in range(2):
+            assert await memoize(CacheMode.MEMORY, "text", "<p>", (), compute) == "text"
+        assert len(calls) == 1
+        assert cache.lookup(memo_key("text", "<p>")) is None
+
+    @pytest.mark.asyncio
+    async def test_disk_survives_restart(self, cache):
+        compute, calls = counting("text")
+        await memoize(CacheMode.DISK, "text", "<p>", (True,), compute)
+        configure_extraction_cache(path=cache.path)
+        assert await memoize(CacheMode.DISK, "text", "<p>", (True,), compute) == "text"
+        assert len(calls) == 1
+        await memoize(CacheMode.DISK, "text", "<p>", (False,), compute)
+        assert len(calls) == 2
@@ -0,0 +1,164 @@
+import feedparser
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from nodetool.nodes.lib.network import feed_state
+from nodetool.nodes.lib.network.feed_state import (
+    FeedStateStore,
+    entry_key,
+    fetch_feed,
+    new_entries,
+    parse_feed,
+)
+from nodetool.nodes.lib.network.sessions import close_sessions
+
+
+def rss(*items: str) -> bytes:
+    body = "".join(
+        f"<item><title>{item}</title><link>https://example.com/{item}</link>"
+        f"<guid>urn:{item}</guid><pubDate>Mon, 01 Jan 2024 12:00:00 GMT</pubDate>"
+        "</item>"
+        for item in items
+    )
+    return (
+        '<?xml version="1.0"?><rss version="2.0"><channel>'
+        f"<title>Example</title><link>https://example.com</link>{body}"
+        "</channel></rss>"
+    ).encode()
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = FeedStateStore(str(tmp_path / "feeds.sqlite3"), max_seen=3)
+    yield store
+    store.close()
+
+
+def test_parse_feed():
+    state = parse_feed("u", rss("a", "b"), {"ETag": '"v1"'})
+    assert state.etag == '"v1"'
+    assert state.metadata["title"] == "Example"
+    assert state.metadata["entry_count"] == 2
+    assert state.entries[0]["id"] == "urn:a"
+    assert state.entries[0]["published_parsed"] == [2024, 1, 1, 12, 0, 0]
+
+
+def test_entry_key_fallbacks():
+    assert entry_key({"id": "x", "link": "y"}) == entry_key({"id": "x"})
+    assert entry_key({"link": "y"}) != entry_key({"link": "z"})
+    assert entry_key({"title": "t"}) == entry_key({"title": "t", "link": ""})
+
+
+class TestFeedStateStore:
+    def test_round_trip(self, store):
+        state = parse_feed("u", rss("a"), {"ETag": '"v1"'})
+        store.save(state)
+        assert store.load("u") == state
+        assert store.load("other") is None
+
+    def test_mark_seen(self, store):
+        assert store.mark_seen("u", ["a", "b"]) == [True, True]
+        assert store.mark_seen("u", ["b", "c"]) == [False, True]
+        assert store.mark_seen("other", ["a"]) == [True]
+
+    def test_mark_seen_many_keys(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(feed_state, "LOOKUP_CHUNK", 2)
+        store = FeedStateStore(str(tmp_path / "feeds.sqlite3"))
+        keys = [str(i) for i in range(5)]
+        assert store.mark_seen("u", keys[:3]) == [True] * 3
+        assert store.mark_seen("u", keys) == [False] * 3 + [True] * 2
+        store.close()
+
+    def test_seen_set_is_bounded(self, store):
+        store.mark_seen("u", ["a", "b", "c"])
+        store.mark_seen("u", ["d"])
+        assert store.mark_seen("u", ["a"]) == [True]
+
+
+class TestFetchFeed:
+    @pytest.mark.asyncio
+    async def test_not_modified_skips_parsing(self, store, monkeypatch):
+        requests = []
+
+        async def handler(request):
+            requests.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return web.Response(status=304, headers={"ETag": '"v1"'})
+            return web.Response(
+                body=rss("a", "b"),
+                headers={"ETag": '"v1"', "Content-Type": "application/rss+xml"},
+            )
+
+        app = web.Application()
+        app.router.add_get("/feed", handler)
+        async with TestServer(app) as server:
+            url = str(server.make_url("/feed"))
+            first, changed = await fetch_feed(url, store)
+            assert changed
+
+            def fail(*args):
+                raise AssertionError("parsed an unchanged feed")
+
+            monkeypatch.setattr(feed_state, "parse_feed", fail)
+            second, changed = await fetch_feed(url, store)
+        await close_sessions()
+
+        assert not changed
+        assert second == first
+        assert requests == [None, '"v1"']
+
+    @pytest.mark.asyncio
+    async def test_new_entries(self, store):
+        items = [["a", "b"], ["b", "c"], ["b", "c"]]
+
+        async def handler(request):
+            return web.Response(body=rss(*items.pop(0)))
+
+        app = web.Application()
+        app.router.add_get("/feed", handler)
+        async with TestServer(app) as server:
+            url = str(server.make_url("/feed"))
+            results = []
+            for _ in range(3):
+                state, changed = await fetch_feed(url, store)
+                results.append(
+                    [e["title"] for e in await new_entries(store, state, changed)]
+                )
+        await close_sessions()
+
+        assert results == [["a", "b"], ["c"], []]
+
+    @pytest.mark.asyncio
+    async def test_without_store(self):
+        async def handler(request):
+            assert "If-None-Match" not in request.headers
+            assert request.headers["User-Agent"] == feedparser.USER_AGENT
+            assert "application/rss+xml" in request.headers["Accept"]
+            return web.Response(body=rss("a"), headers={"ETag": '"v1"'})
+
+        app = web.Application()
+        app.router.add_get("/feed", handler)
+        async with TestServer(app) as server:
+            url = str(server.make_url("/feed"))
+            for _ in range(2):
+                state, changed = await fetch_feed(url)
+                assert changed and len(state.entries) == 1
+        await close_sessions()
+
+    @pytest.mark.asyncio
+    async def test_http_error_is_not_raised(self, store):
+        async def handler(request):
+            return web.Response(status=503, headers={"ETag": '"v1"'})
+
+        app = web.Application()
+        app.router.add_get("/feed", handler)
+        async with TestServer(app) as server:
+            url = str(server.make_url("/feed"))
+            state, changed = await fetch_feed(url, store)
+        await close_sessions()
+
+        assert not changed
+        assert state.entries == []
+        assert "503" in state.error
+        assert store.load(url) is None
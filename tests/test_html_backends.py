@@ -0,0 +1,121 @@
+import os
+
+import pytest
+
+from nodetool.nodes.lib.network import html_parsing
+from nodetool.nodes.lib.network.html_executor import extract_html_task
+from nodetool.nodes.lib.network.html_parsing import (
+    ParserBackend,
+    configure_html_parser,
+    parser_available,
+    resolve_parser,
+    tree_builder,
+)
+
+CORPUS_DIR = os.path.join(os.path.dirname(__file__), "data", "html")
+CORPUS = sorted(name for name in os.listdir(CORPUS_DIR) if name.endswith(".html"))
+BASE_URL = "https://example.com/section/"
+
+BACKENDS = [
+    backend.value
+    for backend in ParserBackend
+    if backend is not ParserBackend.AUTO and parser_available(backend)
+]
+
+
+def load(name: str) -> str:
+    with open(os.path.join(CORPUS_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def extract_all(html: str, parser: str) -> dict:
+    result = {
+        kind: extract_html_task(kind, html, BASE_URL, parser)
+        for kind in ("links", "metadata", "images", "videos", "audio", "content")
+    }
+    result["links"] = result["links"].records()
+    return result
+
+
+@pytest.mark.skipif(len(BACKENDS) < 2, reason="only one parser backend installed")
+@pytest.mark.parametrize("name", CORPUS)
+def test_backends_agree(name):
+    html = load(name)
+    reference = extract_all(html, ParserBackend.HTML_PARSER)
+    for backend in BACKENDS:
+        assert extract_all(html, backend) == reference, backend
+
+
+def test_corpus_extraction():
+    result = extract_all(load("news_article.html"), ParserBackend.HTML_PARSER)
+
+    assert result["metadata"]["title"].startswith("City council approves")
+    assert result["metadata"]["keywords"] is None
+    assert "https://example.com/media/council-vote.mp4" in result["videos"]
+    assert "https://www.youtube.com/embed/abc123" in result["videos"]
+    assert result["audio"][-1] == "https://example.com/media/session.mp3"
+    assert "40 kilometres" in result["content"]
+    assert "Privacy" not in result["content"]
+
+
+@pytest.mark.parametrize("name", CORPUS)
+def test_selectolax_matches_html_parser(name):
+    pytest.importorskip("selectolax")
+    html = load(name)
+    assert extract_all(html, ParserBackend.SELECTOLAX) == extract_all(
+        html, ParserBackend.HTML_PARSER
+    )
+
+
+class TestResolveParser:
+    @pytest.fixture(autouse=True)
+    def restore_default(self):
+        yield
+        configure_html_parser(ParserBackend.AUTO)
+
+    def test_auto_prefers_fastest_available(self):
+        assert resolve_parser("auto") == BACKENDS[0]
+
+    def test_explicit(self):
+        assert resolve_parser("html.parser") == "html.parser"
+
+    def test_process_default(self):
+        configure_html_parser("html.parser")
+        assert resolve_parser("auto") == "html.parser"
+        assert resolve_parser(ParserBackend.LXML) == resolve_parser("lxml")
+
+    def test_falls_back_when_missing(self, monkeypatch):
+        monkeypatch.setitem(
+            html_parsing.PARSER_MODULES, ParserBackend.LXML, "not_a_real_module"
+        )
+        html_parsing.parser_available.cache_clear()
+        try:
+            assert resolve_parser("lxml") == "html.parser"
+            assert resolve_parser("auto") != "lxml"
+        finally:
+            html_parsing.parser_available.cache_clear()
+
+    def test_selectolax_falls_back_when_missing(self, monkeypatch):
+        monkeypatch.setitem(
+            html_parsing.PARSER_MODULES, ParserBackend.SELECTOLAX, "not_a_real_module"
+        )
+        html_parsing.parser_available.cache_clear()
+        try:
+            assert resolve_parser("selectolax") == "html.parser"
+            assert resolve_parser("auto") != "selectolax"
+        finally:
+            html_parsing.parser_available.cache_clear()
+
+    def test_tree_builder_skips_selectolax(self, monkeypatch):
+        monkeypatch.setitem(html_parsing.PARSER_MODULES, ParserBackend.SELECTOLAX, "os")
+        html_parsing.parser_available.cache_clear()
+        try:
+            assert resolve_parser("selectolax") == "selectolax"
+            assert tree_builder("selectolax") in ("lxml", "html.parser")
+            assert tree_builder("html.parser") == "html.parser"
+        finally:
+            html_parsing.parser_available.cache_clear()
+
+    def test_unknown(self):
+        with pytest.raises(ValueError):
+            resolve_parser("html5lib")
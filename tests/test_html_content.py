@@ -0,0 +1,98 @@
+import os
+from collections import Counter
+
+import pytest
+
+from nodetool.nodes.lib.network.html_content import (
+    class_weight,
+    is_boilerplate,
+    main_content,
+    main_content_text,
+    score_document,
+)
+from nodetool.nodes.lib.network.html_parsing import parse_html
+
+CORPUS_DIR = os.path.join(os.path.dirname(__file__), "data", "html")
+GOLD = sorted(
+    os.path.splitext(name)[0] for name in os.listdir(os.path.join(CORPUS_DIR, "gold"))
+)
+
+
+def load(name: str) -> str:
+    with open(os.path.join(CORPUS_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def token_f1(extracted: str, gold: str) -> float:
+    predicted = Counter(extracted.lower().split())
+    expected = Counter(gold.lower().split())
+    overlap = sum((predicted & expected).values())
+    if not overlap:
+        return 0.0
+    precision = overlap / sum(predicted.values())
+    recall = overlap / sum(expected.values())
+    return 2 * precision * recall / (precision + recall)
+
+
+@pytest.mark.parametrize("name", GOLD)
+def test_gold_corpus(name):
+    text = main_content_text(parse_html(load(name + ".html"), "html.parser"))
+    gold = load(os.path.join("gold", name + ".txt"))
+    assert token_f1(text, gold) >= 0.8
+
+
+def test_prefers_dense_text_over_content_named_links():
+    text = main_content_text(parse_html(load("magazine_story.html"), "html.parser"))
+    assert text.startswith("The night trains are back Ten years ago")
+    assert "Ferries" not in text
+    assert "Vienna sleeper" not in text
+
+
+def test_link_density_lowers_score():
+    soup = parse_html(
+        "<body><div id='a'><p>"
+        + "<a href='/x'>A fairly long link text, repeated here</a>" * 3
+        + "</p></div><div id='b'><p>Plain text, with commas, and no links.</p>"
+        "</div></body>",
+        "html.parser",
+    )
+    scores = score_document(soup.body)
+    first, second = scores.get(soup.find(id="a")), scores.get(soup.find(id="b"))
+    assert first.score > second.score
+    assert first.link_density == 1.0
+    assert scores.best() is second
+
+
+def test_skips_boilerplate():
+    soup = parse_html(
+        "<div class='sidebar'></div><div class='main-sidebar'></div>"
+        "<footer></footer><div class='story'></div>",
+        "html.parser",
+    )
+    assert [is_boilerplate(tag) for tag in soup.find_all(["div", "footer"])] == [
+        True,
+        False,
+        True,
+        False,
+    ]
+    assert class_weight(soup.find(class_="story")) == 25
+    assert class_weight(soup.find(class_="sidebar")) == -25
+
+
+def test_keeps_table_cells_apart():
+    soup = parse_html(
+        "<div><p>Sizes for every foot, measured in EU and US.</p>"
+        "<table><tr><td>42</td><td>8.5</td></tr></table></div>",
+        "html.parser",
+    )
+    assert main_content_text(soup).endswith("42 8.5")
+
+
+def test_falls_back_to_body():
+    soup = parse_html("<body><p>Short.</p></body>", "html.parser")
+    assert main_content(soup) == [soup.body]
+    assert main_content_text(soup) == "Short."
+
+
+def test_no_content():
+    assert main_content_text(parse_html("", "html.parser")) == "No main content found"
@@ -0,0 +1,113 @@
+import os
+
+import pytest
+from unittest.mock import patch
+
+from nodetool.nodes.lib.network import html_executor
+from nodetool.nodes.lib.network.html_executor import (
+    configure_html_executor,
+    extract_html,
+    extract_html_many,
+    extract_html_task,
+    map_cpu_bound,
+    run_cpu_bound,
+    shutdown_html_executor,
+)
+
+CORPUS_DIR = os.path.join(os.path.dirname(__file__), "data", "html")
+BASE_URL = "https://example.com/"
+
+
+def load(name: str) -> str:
+    with open(os.path.join(CORPUS_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.fixture
+def process_pool():
+    configure_html_executor(max_workers=1, inline_threshold=0)
+    yield
+    configure_html_executor(
+        max_workers=os.cpu_count() or 1, inline_threshold=256 * 1024
+    )
+
+
+class TestExtractHtmlTask:
+    def test_bytes_and_str_agree(self):
+        html = load("blog_post.html")
+        assert extract_html_task("links", html, BASE_URL) == extract_html_task(
+            "links", html.encode(), BASE_URL
+        )
+
+    def test_streaming_matches_tree(self):
+        html = load("news_article.html")
+        assert extract_html_task(
+            "videos", html, BASE_URL, streaming=True
+        ) == extract_html_task("videos", html, BASE_URL, "html.parser")
+
+    def test_streaming_unsupported_kind(self):
+        with pytest.raises(ValueError):
+            extract_html_task("metadata", "<title>x</title>", streaming=True)
+
+    def test_content(self):
+        text = extract_html_task("content", load("docs_page.html"))
+        assert text.startswith("Configuration Settings are read")
+
+
+class TestExtractHtml:
+    @pytest.mark.asyncio
+    async def test_small_documents_stay_inline(self):
+        with patch.object(html_executor, "get_process_pool") as get_pool:
+            result = await extract_html(
+                "metadata", load("blog_post.html"), offload=True
+            )
+        get_pool.assert_not_called()
+        assert result["keywords"] == "python, asyncio, crawling, performance"
+
+    @pytest.mark.asyncio
+    async def test_offloaded_matches_inline(self, process_pool):
+        html = load("product_page.html")
+        for kind in ["links", "images", "metadata", "content"]:
+            inline = await extract_html(kind, html, BASE_URL)
+            offloaded = await extract_html(kind, html, BASE_URL, offload=True)
+            assert offloaded == inline, kind
+
+    @pytest.mark.asyncio
+    async def test_run_cpu_bound(self, process_pool):
+        assert await run_cpu_bound(sorted, [3, 1, 2], size=3) == [1, 2, 3]
+        assert await run_cpu_bound(os.getpid, size=1) != os.getpid()
+        assert await run_cpu_bound(sorted, [2, 1], size=2, offload=False) == [1, 2]
+
+
+class TestBatch:
+    @pytest.mark.asyncio
+    async def test_map_cpu_bound_keeps_order(self, process_pool):
+        items = [(n,) for n in range(10)]
+        assert await map_cpu_bound(str, items, [1] * 10) == [str(n) for n in range(10)]
+        assert await map_cpu_bound(str, [], []) == []
+
+    @pytest.mark.asyncio
+    async def test_small_batches_stay_inline(self):
+        with patch.object(html_executor, "get_process_pool") as get_pool:
+            result = await extract_html_many("metadata", ["<title>a</title>"] * 3)
+        get_pool.assert_not_called()
+        assert [m["title"] for m in result] == ["a", "a", "a"]
+
+    @pytest.mark.asyncio
+    async def test_offloaded_matches_single(self, process_pool):
+        names = ["blog_post.html", "news_article.html", "product_page.html"]
+        documents = [load(name) for name in names]
+        urls = [BASE_URL + name for name in names]
+        tables = await extract_html_many("links", documents, urls)
+        for document, url, table in zip(documents, urls, tables):
+            assert table == await extract_html("links", document, url)
+
+    @pytest.mark.asyncio
+    async def test_misaligned_base_urls(self):
+        with pytest.raises(ValueError):
+            await extract_html_many("links", ["", ""], [BASE_URL])
+
+
+def test_shutdown_is_idempotent():
+    shutdown_html_executor()
+    shutdown_html_executor()
@@ -0,0 +1,203 @@
+import pickle
+
+import pytest
+from bs4 import BeautifulSoup
+
+from nodetool.nodes.lib.network import html_parsing
+from nodetool.nodes.lib.network.html_parsing import (
+    LINK_COLUMNS,
+    DocumentCache,
+    LinkTable,
+    link_table,
+    parse_html,
+    resolve_link,
+    text_content,
+)
+
+PAGE = """
+<html>
+  <head><title>Test</title><style>body { color: red }</style></head>
+  <body>
+    <header>Site header</header>
+    <nav>Home | About</nav>
+    <article>
+      <h1>Headline</h1>
+      <script>var x = 1;</script>
+      <p>First <b>paragraph</b>.</p>
+      <!-- a comment -->
+      <footer>Article footer</footer>
+    </article>
+  </body>
+</html>
+"""
+
+
+class TestDocumentCache:
+    def test_parses_once(self):
+        cache = DocumentCache()
+        first = cache.get(PAGE)
+        assert cache.get(PAGE) is first
+        assert len(cache) == 1
+
+    def test_key_includes_parser(self):
+        cache = DocumentCache()
+        assert cache.get(PAGE, "html.parser") is not cache.get(PAGE, "lxml")
+
+    def test_evicts_least_recently_used(self):
+        cache = DocumentCache(max_entries=2)
+        a = cache.get("<p>a</p>")
+        cache.get("<p>b</p>")
+        cache.get("<p>a</p>")
+        cache.get("<p>c</p>")
+        assert len(cache) == 2
+        assert cache.get("<p>a</p>") is a
+
+    def test_evicts_by_size(self):
+        cache = DocumentCache(max_bytes=20)
+        cache.get("<p>aaaaaaaaaa</p>")
+        cache.get("<p>bbbbbbbbbb</p>")
+        assert len(cache) == 1
+
+    def test_oversized_document_not_cached(self):
+        cache = DocumentCache(max_bytes=10)
+        cache.get(PAGE)
+        assert len(cache) == 0
+
+    def test_parse_html_shared(self):
+        assert parse_html(PAGE) is parse_html(PAGE)
+
+
+class TestTextContent:
+    def test_matches_get_text(self):
+        soup = parse_html(PAGE)
+        assert text_content(soup.body) == soup.body.get_text()
+
+    def test_skips_tags_without_modifying_tree(self):
+        soup = parse_html(PAGE)
+        text = text_content(soup.article, skip=frozenset(["script", "footer"]))
+
+        assert "Headline" in text
+        assert "First paragraph." in text
+        assert "var x" not in text
+        assert "Article footer" not in text
+        assert "a comment" not in text
+        assert soup.find("footer") is not None
+
+    @pytest.mark.parametrize("tag", ["article", "body"])
+    def test_matches_decompose(self, tag):
+        skip = ["script", "style", "nav", "footer", "header"]
+        main = getattr(BeautifulSoup(PAGE, "html.parser"), tag)
+        for elem in main(skip):
+            elem.decompose()
+
+        expected = main.get_text()
+
+        main = getattr(parse_html(PAGE), tag)
+        assert text_content(main, frozenset(skip)) == expected
+
+
+class TestResolveLink:
+    BASE = "https://example.com/docs/guide/index.html"
+
+    @pytest.mark.parametrize(
+        "href, expected",
+        [
+            (
+                "page.html",
+                (
+                    "https://example.com/docs/guide/page.html",
+                    "example.com",
+                    "/docs/guide/page.html",
+                    "internal",
+                ),
+            ),
+            (
+                "../api/./ref.html?x=1#top",
+                (
+                    "https://example.com/docs/api/ref.html?x=1#top",
+                    "example.com",
+                    "/docs/api/ref.html",
+                    "internal",
+                ),
+            ),
+            (
+                "//cdn.example.com/app.js",
+                (
+                    "https://cdn.example.com/app.js",
+                    "cdn.example.com",
+                    "/app.js",
+                    "external",
+                ),
+            ),
+            (
+                "HTTPS://EXAMPLE.COM:443",
+                ("https://EXAMPLE.COM:443", "example.com", "/", "internal"),
+            ),
+            (
+                "http://example.com:8080/x",
+                ("http://example.com:8080/x", "example.com:8080", "/x", "external"),
+            ),
+            (
+                "mailto:team@example.com",
+                ("mailto:team@example.com", "", "", "other"),
+            ),
+            ("javascript:void(0)", ("javascript:void(0)", "", "", "other")),
+        ],
+    )
+    def test_resolve(self, href, expected):
+        assert resolve_link(href, self.BASE) == expected
+
+    def test_without_base_url(self):
+        assert resolve_link("/about")[3] == "internal"
+        assert resolve_link("https://other.com/")[3] == "external"
+
+
+class TestLinkTable:
+    HTML = (
+        '<a href="/a" rel="nofollow noopener">A</a>'
+        '<a href="https://other.com/b">B</a><a name="anchor">no href</a>'
+    )
+
+    def test_columns(self):
+        table = link_table(parse_html(self.HTML, "html.parser"), "https://example.com")
+        assert len(table) == 2
+        assert table.type.tolist() == ["internal", "external"]
+        assert table.host.tolist() == ["example.com", "other.com"]
+        assert table.rel.tolist() == ["nofollow noopener", ""]
+        assert table.rows()[0] == [
+            "/a",
+            "A",
+            "internal",
+            "https://example.com/a",
+            "example.com",
+            "/a",
+            "nofollow noopener",
+        ]
+
+    def test_records_round_trip(self):
+        table = link_table(parse_html(self.HTML, "html.parser"), "https://example.com")
+        copy = LinkTable("https://example.com")
+        copy.extend(table.records())
+        assert copy == table
+        assert list(table.records()[0]) == list(LINK_COLUMNS)
+
+    def test_packs_rows_in_chunks(self, monkeypatch):
+        monkeypatch.setattr(html_parsing, "CHUNK_ROWS", 2)
+        table = LinkTable("https://example.com")
+        for i in range(5):
+            table.append(f"/{i}", str(i))
+        assert len(table._chunks) == 2
+        assert len(table) == 5
+        assert table.array().shape == (5, len(LINK_COLUMNS))
+        assert table.path.tolist() == [f"/{i}" for i in range(5)]
+        assert len(table._chunks) == 3
+
+    def test_empty(self):
+        table = LinkTable()
+        assert len(table) == 0
+        assert table.rows() == []
+        assert table.href.tolist() == []
+
+    def test_pickles(self):
+        table = link_table(parse_html(self.HTML, "html.parser"), "https://example.com")
+        assert pickle.loads(pickle.dumps(table)) == table
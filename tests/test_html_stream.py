@@ -0,0 +1,139 @@
+import os
+
+import pytest
+
+from nodetool.nodes.lib.network.html_parsing import (
+    find_audio_urls,
+    find_image_urls,
+    find_links,
+    find_video_urls,
+    parse_html,
+)
+from nodetool.nodes.lib.network.html_stream import (
+    MediaLinkParser,
+    iter_media_links,
+    stream_media_links,
+)
+
+CORPUS_DIR = os.path.join(os.path.dirname(__file__), "data", "html")
+CORPUS = sorted(name for name in os.listdir(CORPUS_DIR) if name.endswith(".html"))
+BASE_URL = "https://example.com/section/"
+
+
+def load(name: str) -> str:
+    with open(os.path.join(CORPUS_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def group(events):
+    grouped = {"link": [], "image": [], "video": [], "audio": []}
+    for kind, value in events:
+        grouped[kind].append(value)
+    return grouped
+
+
+@pytest.mark.parametrize("name", CORPUS)
+@pytest.mark.parametrize("chunk_size", [7, 64 * 1024])
+def test_matches_tree_extraction(name, chunk_size):
+    html = load(name)
+    soup = parse_html(html, "html.parser")
+
+    result = group(iter_media_links(html, BASE_URL, chunk_size=chunk_size))
+
+    assert result["link"] == find_links(soup, BASE_URL)
+    assert result["image"] == find_image_urls(soup, BASE_URL)
+    assert result["video"] == find_video_urls(soup, BASE_URL)
+    assert result["audio"] == find_audio_urls(soup, BASE_URL)
+
+
+class TestMediaLinkParser:
+    def test_events_as_tags_complete(self):
+        parser = MediaLinkParser("https://example.com/")
+        assert parser.push('<p><img src="a.png"><a hr') == [
+            ("image", "https://example.com/a.png")
+        ]
+        assert parser.push('ef="/x">Hello &amp; ') == []
+        assert parser.push("bye</a>") == [
+            (
+                "link",
+                {
+                    "href": "/x",
+                    "text": "Hello & bye",
+                    "type": "internal",
+                    "url": "https://example.com/x",
+                    "host": "example.com",
+                    "path": "/x",
+                    "rel": "",
+                },
+            )
+        ]
+
+    def test_unclosed_link_flushed_on_finish(self):
+        parser = MediaLinkParser("https://example.com/")
+        parser.push('<a href="https://other.com" rel="nofollow  noopener">Other')
+        assert parser.finish() == [
+            (
+                "link",
+                {
+                    "href": "https://other.com",
+                    "text": "Other",
+                    "type": "external",
+                    "url": "https://other.com",
+                    "host": "other.com",
+                    "path": "/",
+                    "rel": "nofollow noopener",
+                },
+            )
+        ]
+
+    def test_kinds_filter(self):
+        html = '<a href="/x">x</a><img src="a.png"><audio src="a.mp3"></audio>'
+        assert list(iter_media_links(html, kinds=["audio"])) == [("audio", "a.mp3")]
+
+    def test_video_uses_first_source(self):
+        html = (
+            '<video><source src="a.mp4"><source src="a.webm"></video>'
+            '<video><source type="video/mp4"><source src="b.webm"></video>'
+        )
+        result = group(iter_media_links(html))
+        assert result["video"] == ["a.mp4"]
+        assert result["audio"] == ["a.mp4", "a.webm", "b.webm"]
+
+
+@pytest.mark.asyncio
+async def test_stream_media_links_split_multibyte():
+    html = '<a href="/café">Café crème</a><img src="/ü.png">'
+    data = html.encode("utf-8")
+
+    async def chunks():
+        for i in range(len(data)):
+            yield data[i : i + 1]
+
+    events = [event async for event in stream_media_links(chunks(), BASE_URL)]
+
+    assert events == [
+        (
+            "link",
+            {
+                "href": "/café",
+                "text": "Café crème",
+                "type": "internal",
+                "url": "https://example.com/café",
+                "host": "example.com",
+                "path": "/café",
+                "rel": "",
+            },
+        ),
+        ("image", "https://example.com/ü.png"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_media_links_unknown_encoding():
+    async def chunks():
+        yield b'<img src="a.png">'
+
+    events = [
+        event async for event in stream_media_links(chunks(), encoding="no-such-codec")
+    ]
+    assert events == [("image", "a.png")]
@@ -1,27 +1,41 @@
+import asyncio
+import os
 import pytest
 import tempfile
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from nodetool.nodes.lib.network.http import (
     HTTPBaseNode,
+    HTTPGetNode,
     GetRequest,
     PostRequest,
     PutRequest,
     DeleteRequest,
     HeadRequest,
     FetchPage,
+    FetchPages,
     ImageDownloader,
     GetRequestBinary,
     GetRequestDocument,
     PostRequestBinary,
     FilterValidURLs,
     DownloadFiles,
+    BatchRequest,
+    StreamPageLinks,
     JSONPostRequest,
     JSONPutRequest,
     JSONPatchRequest,
     JSONGetRequest,
 )
-from nodetool.metadata.types import DataframeRef, FilePath, DocumentRef, ImageRef
+from nodetool.nodes.lib.network.browser import close_driver_pools
+from nodetool.metadata.types import (
+    AudioRef,
+    DataframeRef,
+    FilePath,
+    DocumentRef,
+    ImageRef,
+    VideoRef,
+)
 from nodetool.workflows.processing_context import ProcessingContext
 from nodetool.workflows.types import NodeProgress
 
@@ -45,6 +59,14 @@ class MockResponse:
         return self._json_data
 
 
+def mock_stream(*chunks):
+    async def iter_chunked(chunk_size):
+        for chunk in chunks:
+            yield chunk
+
+    return MagicMock(iter_chunked=iter_chunked)
+
+
 @pytest.fixture
 def mock_context():
     context = MagicMock(spec=ProcessingContext)
@@ -64,6 +86,7 @@ def mock_context():
 class TestHTTPBaseNode:
     def test_is_visible(self):
         assert not HTTPBaseNode.is_visible()
+        assert not HTTPGetNode.is_visible()
         assert GetRequest.is_visible()
 
     def test_get_request_kwargs(self):
@@ -84,6 +107,33 @@ class TestGetRequest:
         mock_context.http_get.assert_called_once_with("https://example.com", auth=None)
         assert result == "test content"
 
+    @pytest.mark.asyncio
+    @patch("nodetool.nodes.lib.network.http.pooled_request")
+    async def test_process_with_connection_pool(self, mock_request, mock_context):
+        mock_request.return_value = MockResponse(content=b"pooled content")
+
+        node = GetRequest(url="https://example.com", use_connection_pool=True)
+        result = await node.process(mock_context)
+
+        mock_request.assert_called_once_with("GET", "https://example.com")
+        mock_context.http_get.assert_not_called()
+        assert result == "pooled content"
+
+    @pytest.mark.asyncio
+    @patch("nodetool.nodes.lib.network.http.get_http_cache")
+    @patch("nodetool.nodes.lib.network.http.cached_get")
+    async def test_process_with_cache(self, mock_cached_get, mock_cache, mock_context):
+        mock_cached_get.return_value = MockResponse(content=b"cached content")
+
+        node = GetRequest(url="https://example.com", use_cache=True)
+        result = await node.process(mock_context)
+
+        mock_cached_get.assert_called_once_with(
+            mock_cache.return_value, "https://example.com"
+        )
+        mock_context.http_get.assert_not_called()
+        assert result == "cached content"
+
 
 class TestPostRequest:
     @pytest.mark.asyncio
@@ -132,11 +182,17 @@ class TestHeadRequest:
 
 
 class TestFetchPage:
+    @pytest.fixture(autouse=True)
+    def close_pools(self):
+        yield
+        close_driver_pools()
+
     @pytest.mark.asyncio
-    @patch("nodetool.lib.network.http.webdriver.Chrome")
+    @patch("nodetool.nodes.lib.network.browser.webdriver.Chrome")
     async def test_process_success(self, mock_chrome, mock_context):
         mock_driver = MagicMock()
         mock_driver.page_source = "<html><body>Test Page</body></html>"
+        mock_driver.execute_script.return_value = "complete"
         mock_chrome.return_value = mock_driver
 
         node = FetchPage(url="https://example.com", wait_time=5)
@@ -145,10 +201,11 @@ class TestFetchPage:
         assert result["html"] == "<html><body>Test Page</body></html>"
         assert result["success"] is True
         assert result["error_message"] is None
-        mock_driver.quit.assert_called_once()
+        mock_driver.get.assert_any_call("https://example.com")
+        mock_driver.quit.assert_not_called()
 
     @pytest.mark.asyncio
-    @patch("nodetool.lib.network.http.webdriver.Chrome")
+    @patch("nodetool.nodes.lib.network.browser.webdriver.Chrome")
     async def test_process_failure(self, mock_chrome, mock_context):
         mock_driver = MagicMock()
         mock_driver.get.side_effect = Exception("Connection error")
@@ -162,13 +219,93 @@ class TestFetchPage:
         assert "Connection error" in result["error_message"]
         mock_driver.quit.assert_called_once()
 
+    @pytest.mark.asyncio
+    @patch("nodetool.nodes.lib.network.browser.webdriver.Chrome")
+    async def test_process_reuses_browser(self, mock_chrome, mock_context):
+        mock_driver = MagicMock()
+        mock_driver.page_source = "<html><body>Test Page</body></html>"
+        mock_driver.execute_script.return_value = "complete"
+        mock_chrome.return_value = mock_driver
+
+        for url in ["https://example.com/a", "https://example.com/b"]:
+            result = await FetchPage(url=url, pages_per_browser=2).process(mock_context)
+            assert result["success"] is True
+
+        mock_chrome.assert_called_once()
+        mock_driver.quit.assert_called_once()
+
+
+class TestFetchPages:
+    @pytest.fixture(autouse=True)
+    def close_pools(self):
+        yield
+        close_driver_pools()
+
+    @pytest.mark.asyncio
+    @patch("nodetool.nodes.lib.network.browser.webdriver.Chrome")
+    async def test_gen_process(self, mock_chrome, mock_context):
+        def make_driver(options):
+            driver = MagicMock()
+            driver.execute_script.return_value = "complete"
+
+            def get(url):
+                if "error" in url:
+                    raise Exception("Page crashed")
+                driver.page_source = f"<html>{url}</html>"
+
+            driver.get.side_effect = get
+            return driver
+
+        mock_chrome.side_effect = make_driver
+
+        node = FetchPages(
+            urls=["https://a.com", "https://error.com", "https://b.com"],
+            max_browsers=2,
+        )
+        results = [value async for _, value in node.gen_process(mock_context)]
+
+        by_index = {r["index"]: r for r in results}
+        assert by_index[0]["html"] == "<html>https://a.com</html>"
+        assert by_index[1]["success"] is False
+        assert by_index[1]["error_message"] == "Page crashed"
+        assert by_index[2]["success"] is True
+        assert mock_chrome.call_count <= 3
+        assert mock_context.post_message.call_count == 3
+
+    @pytest.mark.asyncio
+    @patch("nodetool.nodes.lib.network.browser.webdriver.Chrome")
+    async def test_blocks_resources(self, mock_chrome, mock_context):
+        mock_driver = MagicMock()
+        mock_driver.execute_script.return_value = "complete"
+        mock_chrome.return_value = mock_driver
+
+        node = FetchPages(
+            urls=["https://a.com"],
+            block_images=True,
+            block_fonts=False,
+            block_media=False,
+            block_trackers=False,
+        )
+        [value async for _, value in node.gen_process(mock_context)]
+
+        blocked = mock_driver.execute_cdp_cmd.call_args_list[1].args
+        assert blocked[0] == "Network.setBlockedURLs"
+        assert "*.png*" in blocked[1]["urls"]
+        assert "*.woff2*" not in blocked[1]["urls"]
+
+    @pytest.mark.asyncio
+    async def test_selector_required(self, mock_context):
+        node = FetchPages(urls=["https://a.com"], wait_for="selector")
+        with pytest.raises(ValueError, match="CSS selector"):
+            [value async for _, value in node.gen_process(mock_context)]
+
 
 class TestImageDownloader:
     @pytest.mark.asyncio
-    @patch("nodetool.lib.network.http.aiohttp.ClientSession")
+    @patch("nodetool.nodes.lib.network.http.get_session")
     async def test_process(self, mock_session, mock_context):
         mock_session_instance = AsyncMock()
-        mock_session.return_value.__aenter__.return_value = mock_session_instance
+        mock_session.return_value = mock_session_instance
 
         # Mock responses for different image URLs
         responses = {
@@ -217,6 +354,7 @@ class TestImageDownloader:
         assert len(result["failed_urls"]) == 2
         assert "https://example.com/invalid.jpg" in result["failed_urls"]
         assert "https://example.com/error.png" in result["failed_urls"]
+        assert result["retries"] == 0
 
 
 class TestGetRequestBinary:
@@ -230,6 +368,53 @@ class TestGetRequestBinary:
         )
         assert result == b"test content"
 
+    @pytest.mark.asyncio
+    async def test_process_with_ranges(self, mock_context):
+        body = bytes(range(256)) * 16384
+        mock_context.http_head.return_value = MockResponse(
+            headers={"Accept-Ranges": "bytes", "Content-Length": str(len(body))}
+        )
+
+        async def http_get(url, headers=None, **kwargs):
+            start, end = map(int, headers["Range"][len("bytes=") :].split("-"))
+            return MockResponse(
+                content=body[start : end + 1],
+                headers={"Content-Range": f"bytes {start}-{end}/{len(body)}"},
+            )
+
+        mock_context.http_get.side_effect = http_get
+
+        node = GetRequestBinary(url="https://example.com/file.bin", connections=4)
+        result = await node.process(mock_context)
+
+        assert result == body
+        # The buffer the ranges were written into is returned without a copy.
+        assert isinstance(result, bytearray)
+        assert mock_context.http_get.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_process_with_ranges_unsupported(self, mock_context):
+        node = GetRequestBinary(url="https://example.com/file.bin", connections=4)
+        result = await node.process(mock_context)
+
+        assert result == b"test content"
+        assert mock_context.http_get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_process_with_ranges_ignored(self, mock_context):
+        body = bytes(range(256)) * 16384
+        mock_context.http_head.return_value = MockResponse(
+            headers={"Accept-Ranges": "bytes", "Content-Length": str(len(body))}
+        )
+        # The server advertises ranges but answers every GET with the full body.
+        mock_context.http_get.return_value = MockResponse(content=body)
+
+        node = GetRequestBinary(url="https://example.com/file.bin", connections=4)
+        result = await node.process(mock_context)
+
+        assert result == body
+        assert "headers" not in mock_context.http_get.call_args.kwargs
+
 
 class TestGetRequestDocument:
     @pytest.mark.asyncio
@@ -269,10 +454,10 @@ class TestPostRequestBinary:
 
 class TestFilterValidURLs:
     @pytest.mark.asyncio
-    @patch("nodetool.lib.network.http.aiohttp.ClientSession")
+    @patch("nodetool.nodes.lib.network.http.get_session")
     async def test_process(self, mock_session, mock_context):
         mock_session_instance = AsyncMock()
-        mock_session.return_value.__aenter__.return_value = mock_session_instance
+        mock_session.return_value = mock_session_instance
 
         # Mock responses for different URLs
         responses = {
@@ -309,15 +494,36 @@ class TestFilterValidURLs:
 
         assert set(result) == {"https://valid1.com", "https://valid2.com"}
 
+    @pytest.mark.asyncio
+    @patch("nodetool.nodes.lib.network.http.get_session")
+    async def test_process_retries_transient_status(self, mock_session, mock_context):
+        mock_session_instance = AsyncMock()
+        mock_session.return_value = mock_session_instance
+        statuses = iter([503, 429, 200])
+
+        def mock_head(url, **kwargs):
+            return AsyncMock(
+                __aenter__=AsyncMock(
+                    return_value=MagicMock(status=next(statuses), headers={})
+                )
+            )
+
+        mock_session_instance.head = mock_head
+
+        node = FilterValidURLs(
+            urls=["https://flaky.com"], retry_backoff=0, retry_backoff_max=0
+        )
+        result = await node.process(mock_context)
+
+        assert result == ["https://flaky.com"]
+
 
 class TestDownloadFiles:
     @pytest.mark.asyncio
-    @patch("nodetool.lib.network.http.aiohttp.ClientSession")
-    @patch("nodetool.lib.network.http.os.makedirs")
-    @patch("nodetool.lib.network.http.open")
-    async def test_process(self, mock_open, mock_makedirs, mock_session, mock_context):
+    @patch("nodetool.nodes.lib.network.http.get_session")
+    async def test_process(self, mock_session, mock_context):
         mock_session_instance = AsyncMock()
-        mock_session.return_value.__aenter__.return_value = mock_session_instance
+        mock_session.return_value = mock_session_instance
 
         # Mock responses for different URLs
         responses = {
@@ -326,7 +532,7 @@ class TestDownloadFiles:
                     return_value=MagicMock(
                         status=200,
                         headers={"Content-Disposition": "filename=file1.txt"},
-                        read=AsyncMock(return_value=b"file1 content"),
+                        content=mock_stream(b"file1 ", b"content"),
                     )
                 )
             ),
@@ -335,7 +541,7 @@ class TestDownloadFiles:
                     return_value=MagicMock(
                         status=200,
                         headers={},
-                        read=AsyncMock(return_value=b"file2 content"),
+                        content=mock_stream(b"file2 content"),
                     )
                 )
             ),
@@ -363,10 +569,168 @@ class TestDownloadFiles:
             result = await node.process(mock_context)
 
             assert len(result["successful"]) == 2
-            assert "https://example.com/error" in result["failed"]
-            assert mock_context.post_message.call_count == 2
+            assert result["failed"] == ["https://example.com/error"]
+            with open(os.path.join(temp_dir, "file1.txt"), "rb") as f:
+                assert f.read() == b"file1 content"
+            with open(os.path.join(temp_dir, "file2.txt"), "rb") as f:
+                assert f.read() == b"file2 content"
+            assert sorted(os.listdir(temp_dir)) == ["file1.txt", "file2.txt"]
+            assert mock_context.post_message.call_count == 3
             assert isinstance(mock_context.post_message.call_args[0][0], NodeProgress)
 
+    @pytest.mark.asyncio
+    @patch("nodetool.nodes.lib.network.http.get_session")
+    async def test_process_with_ranges_ignored(self, mock_session, mock_context):
+        body = b"0123456789" * 1000
+        mock_session_instance = AsyncMock()
+        mock_session.return_value = mock_session_instance
+        mock_session_instance.head = lambda url, **kwargs: AsyncMock(
+            __aenter__=AsyncMock(
+                return_value=MagicMock(
+                    status=200,
+                    headers={
+                        "Accept-Ranges": "bytes",
+                        "Content-Length": str(len(body)),
+                    },
+                )
+            )
+        )
+        ranged = []
+
+        def mock_get(url, headers=None, **kwargs):
+            ranged.append("Range" in (headers or {}))
+            # Range is ignored: every GET returns the full body.
+            return AsyncMock(
+                __aenter__=AsyncMock(
+                    return_value=MagicMock(
+                        status=200, headers={}, content=mock_stream(body)
+                    )
+                )
+            )
+
+        mock_session_instance.get = mock_get
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            node = DownloadFiles(
+                urls=["https://example.com/data.bin"],
+                output_folder=FilePath(path=temp_dir),
+                connections_per_file=2,
+            )
+
+            result = await node.process(mock_context)
+
+            assert result["successful"] == [os.path.join(temp_dir, "data.bin")]
+            assert result["failed"] == []
+            assert ranged[0] and not ranged[-1]
+            with open(os.path.join(temp_dir, "data.bin"), "rb") as f:
+                assert f.read() == body
+            assert os.listdir(temp_dir) == ["data.bin"]
+
+
+class TestBatchRequest:
+    @pytest.mark.asyncio
+    @patch("nodetool.nodes.lib.network.http.pooled_request")
+    async def test_gen_process(self, mock_request, mock_context):
+        async def request(method, url, raise_for_status=True, **kwargs):
+            if "error" in url:
+                raise ConnectionError("Connection error")
+            await asyncio.sleep(0.05 if "slow" in url else 0)
+            return MockResponse(content=f"{method} {url}".encode())
+
+        mock_request.side_effect = request
+
+        node = BatchRequest(
+            urls=["https://slow.com", "https://fast.com"],
+            requests=[
+                {"url": "https://error.com"},
+                {"url": "https://api.com", "method": "post", "json": {"a": 1}},
+            ],
+            max_concurrent_requests=4,
+            max_retries=0,
+        )
+        results = [value async for _, value in node.gen_process(mock_context)]
+
+        assert [r["index"] for r in results][-1] == 0
+        by_index = {r["index"]: r for r in results}
+        assert by_index[0]["content"] == "GET https://slow.com"
+        assert by_index[1]["status"] == 200
+        assert by_index[2]["error"] == "Connection error"
+        assert by_index[3]["content"] == "POST https://api.com"
+        assert mock_request.call_args_list[3].kwargs["json"] == {"a": 1}
+        assert mock_context.post_message.call_count == 4
+
+    @pytest.mark.asyncio
+    @patch("nodetool.nodes.lib.network.http.pooled_request")
+    async def test_gen_process_rate_limited(self, mock_request, mock_context):
+        mock_request.return_value = MockResponse(
+            headers={"X-RateLimit-Remaining": "1", "X-RateLimit-Reset": "10"}
+        )
+        acquired = []
+
+        async def acquire(self):
+            acquired.append(self)
+
+        node = BatchRequest(
+            urls=["https://limited.com/a", "https://limited.com/b"],
+            requests_per_second=5,
+        )
+        with patch(
+            "nodetool.nodes.lib.network.rate_limit.TokenBucket.acquire", acquire
+        ):
+            results = [value async for _, value in node.gen_process(mock_context)]
+
+        assert len(results) == 2
+        assert len(acquired) == 2
+        assert acquired[0] is acquired[1]
+        assert acquired[0].current_rate == pytest.approx(0.1)
+
+    def test_request_spec_requires_url(self):
+        node = BatchRequest(requests=[{"method": "GET"}])
+        with pytest.raises(ValueError, match="needs a url"):
+            node.get_request_specs()
+
+
+class TestStreamPageLinks:
+    @pytest.mark.asyncio
+    @patch("nodetool.nodes.lib.network.http.get_session")
+    async def test_gen_process(self, mock_session, mock_context):
+        mock_session_instance = AsyncMock()
+        mock_session.return_value = mock_session_instance
+        page = (
+            '<a href="/about">About</a><img src="logo.png">'
+            '<video src="clip.mp4"></video><audio src="song.mp3"></audio>'
+        ).encode()
+        response = MagicMock(
+            url="https://example.com/index.html",
+            charset="utf-8",
+            content=mock_stream(page[:12], page[12:40], page[40:]),
+        )
+        mock_session_instance.get = MagicMock(
+            return_value=AsyncMock(__aenter__=AsyncMock(return_value=response))
+        )
+
+        node = StreamPageLinks(url="https://example.com/index.html")
+        outputs = [item async for item in node.gen_process(mock_context)]
+
+        assert outputs == [
+            (
+                "link",
+                {
+                    "href": "/about",
+                    "text": "About",
+                    "type": "internal",
+                    "url": "https://example.com/about",
+                    "host": "example.com",
+                    "path": "/about",
+                    "rel": "",
+                },
+            ),
+            ("image", ImageRef(uri="https://example.com/logo.png")),
+            ("video", VideoRef(uri="https://example.com/clip.mp4")),
+            ("audio", AudioRef(uri="https://example.com/song.mp3")),
+        ]
+        response.raise_for_status.assert_called_once()
+
 
 class TestJSONPostRequest:
     @pytest.mark.asyncio
@@ -0,0 +1,174 @@
+import time
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from multidict import CIMultiDict
+
+from nodetool.nodes.lib.network.http_cache import (
+    HTTPCache,
+    cached_get,
+    freshness_lifetime,
+    parse_cache_control,
+)
+from nodetool.nodes.lib.network.sessions import PooledResponse, close_sessions
+
+
+def response(body=b"body", **headers):
+    return PooledResponse(status=200, headers=CIMultiDict(headers), content=body)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = HTTPCache(str(tmp_path / "cache.sqlite3"), max_bytes=1000)
+    yield cache
+    cache.close()
+
+
+class TestFreshness:
+    def test_parse_cache_control(self):
+        assert parse_cache_control('max-age=60, no-cache, private="x"') == {
+            "max-age": "60",
+            "no-cache": None,
+            "private": "x",
+        }
+
+    def test_max_age(self):
+        assert freshness_lifetime({"Cache-Control": "max-age=60"}, 0) == 60
+        assert freshness_lifetime({"Cache-Control": "max-age=60", "Age": "20"}, 0) == 40
+
+    def test_expires(self):
+        headers = {
+            "Date": "Mon, 01 Jan 2024 00:00:00 GMT",
+            "Expires": "Mon, 01 Jan 2024 00:05:00 GMT",
+        }
+        assert freshness_lifetime(headers, 0) == 300
+
+    def test_not_storable(self):
+        assert freshness_lifetime({"Cache-Control": "no-store"}, 0) is None
+        assert freshness_lifetime({"Vary": "*"}, 0) is None
+        assert freshness_lifetime({"Cache-Control": "private, max-age=60"}, 0) is None
+
+    def test_no_cache(self):
+        assert freshness_lifetime({"Cache-Control": "no-cache, max-age=60"}, 0) == 0
+
+
+class TestHTTPCache:
+    def test_store_and_lookup(self, cache):
+        cache.store("GET", "https://x.com/a", {}, response(ETag='"1"'))
+        entry = cache.lookup("GET", "https://x.com/a", {})
+        assert entry is not None
+        assert entry.body == b"body"
+        assert entry.headers["ETag"] == '"1"'
+        assert not entry.is_fresh()
+
+    def test_without_validator_is_not_stored(self, cache):
+        cache.store("GET", "https://x.com/a", {}, response())
+        assert cache.lookup("GET", "https://x.com/a", {}) is None
+
+    def test_credentials_are_not_stored(self, cache):
+        for headers in ({"Authorization": "Bearer a"}, {"Cookie": "session=a"}):
+            cache.store(
+                "GET",
+                "https://x.com/a",
+                headers,
+                response(**{"ETag": '"1"', "Cache-Control": "max-age=60"}),
+            )
+        assert cache.lookup("GET", "https://x.com/a", {}) is None
+
+    def test_vary(self, cache):
+        cache.store(
+            "GET",
+            "https://x.com/a",
+            {"Accept": "application/json"},
+            response(b"json", **{"Cache-Control": "max-age=60", "Vary": "Accept"}),
+        )
+        assert cache.lookup("GET", "https://x.com/a", {"accept": "application/json"})
+        assert cache.lookup("GET", "https://x.com/a", {"Accept": "text/html"}) is None
+        assert cache.lookup("POST", "https://x.com/a", {}) is None
+
+    def test_lru_eviction(self, cache):
+        headers = {"Cache-Control": "max-age=60"}
+        cache.store("GET", "https://x.com/1", {}, response(b"1" * 400, **headers))
+        cache.store("GET", "https://x.com/2", {}, response(b"2" * 400, **headers))
+        cache.lookup("GET", "https://x.com/1", {})
+        cache.store("GET", "https://x.com/3", {}, response(b"3" * 400, **headers))
+
+        assert cache.lookup("GET", "https://x.com/1", {}) is not None
+        assert cache.lookup("GET", "https://x.com/2", {}) is None
+        assert cache.lookup("GET", "https://x.com/3", {}) is not None
+        assert cache.total_bytes() == 800
+
+    def test_refresh(self, cache):
+        cache.store("GET", "https://x.com/a", {}, response(ETag='"1"'))
+        entry = cache.lookup("GET", "https://x.com/a", {})
+        entry = cache.refresh(entry, CIMultiDict({"Cache-Control": "max-age=60"}))
+        assert entry.is_fresh()
+        assert cache.lookup("GET", "https://x.com/a", {}).is_fresh()
+
+
+class TestCachedGet:
+    @pytest.mark.asyncio
+    async def test_revalidates_with_etag(self, cache):
+        requests = []
+
+        async def handler(request):
+            requests.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return web.Response(status=304, headers={"ETag": '"v1"'})
+            return web.Response(body=b"payload", headers={"ETag": '"v1"'})
+
+        app = web.Application()
+        app.router.add_get("/", handler)
+        async with TestServer(app) as server:
+            url = str(server.make_url("/"))
+            first = await cached_get(cache, url)
+            second = await cached_get(cache, url)
+        await close_sessions()
+
+        assert first.content == second.content == b"payload"
+        assert second.status == 200
+        assert requests == [None, '"v1"']
+
+    @pytest.mark.asyncio
+    async def test_fresh_entry_skips_network(self, cache):
+        requests = []
+
+        async def handler(request):
+            requests.append(time.time())
+            return web.Response(
+                body=b"payload", headers={"Cache-Control": "max-age=60"}
+            )
+
+        app = web.Application()
+        app.router.add_get("/", handler)
+        async with TestServer(app) as server:
+            url = str(server.make_url("/"))
+            await cached_get(cache, url)
+            result = await cached_get(cache, url)
+        await close_sessions()
+
+        assert result.content == b"payload"
+        assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_credentials_bypass_cache(self, cache):
+        users = []
+
+        async def handler(request):
+            users.append(request.headers.get("Authorization"))
+            return web.Response(
+                body=request.headers.get("Authorization", "").encode(),
+                headers={"Cache-Control": "max-age=60"},
+            )
+
+        app = web.Application()
+        app.router.add_get("/", handler)
+        async with TestServer(app) as server:
+            url = str(server.make_url("/"))
+            alice = await cached_get(cache, url, {"Authorization": "alice"})
+            bob = await cached_get(cache, url, {"Authorization": "bob"})
+        await close_sessions()
+
+        assert (alice.content, bob.content) == (b"alice", b"bob")
+        assert users == ["alice", "bob"]
+        assert cache.lookup("GET", url, {}) is None
@@ -1,4 +1,5 @@
 import pytest
+import threading
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 import email
@@ -11,10 +12,14 @@ from nodetool.nodes.lib.network.imap import (
     get_email_body,
     build_imap_query,
     search_emails,
+    BodyMode,
     EmailFields,
     ConfigureIMAP,
     IMAPSearch,
 )
+from nodetool.nodes.lib.network.imap_cache import CachedMailbox, EmailCache
+from nodetool.nodes.lib.network.imap_pool import configure_imap_pool
+from nodetool.nodes.lib.network.imap_sync import configure_mailbox_state_store
 from nodetool.metadata.types import (
     Email,
     IMAPConnection,
@@ -72,13 +77,17 @@ class TestFetchEmails:
     def test_fetch_emails(self, mock_message_from_bytes):
         # Setup
         mock_imap = Mock()
-        mock_imap.fetch.return_value = ("OK", [(b"1", b"raw_email_data")])
+        mock_imap.uid.return_value = (
+            "OK",
+            [(b"1 (UID 1 RFC822 {14}", b"raw_email_data"), b")"],
+        )
 
         mock_email_msg = self.setup_mock_email()
         mock_message_from_bytes.return_value = mock_email_msg
 
         # Execute
         result = fetch_emails(mock_imap, ["1"])
+        mock_imap.uid.assert_called_once_with("FETCH", "1", "(RFC822)")
 
         # Assert
         assert len(result) == 1
@@ -91,8 +100,21 @@ class TestFetchEmails:
     @patch("email.message_from_bytes")
     def test_fetch_emails_batch_processing(self, mock_message_from_bytes):
         # Setup
+        def uid(command, message_set, items):
+            start, end = (int(n) for n in message_set.split(":"))
+            data = []
+            for number in range(start, end + 1):
+                data.append(
+                    (
+                        f"{number} (UID {number} RFC822 {{14}}".encode(),
+                        b"raw_email_data",
+                    )
+                )
+                data.append(b")")
+            return "OK", data
+
         mock_imap = Mock()
-        mock_imap.fetch.return_value = ("OK", [(b"1", b"raw_email_data")])
+        mock_imap.uid.side_effect = uid
 
         mock_email_msg = self.setup_mock_email()
         mock_message_from_bytes.return_value = mock_email_msg
@@ -101,9 +123,92 @@ class TestFetchEmails:
         message_ids = [str(i) for i in range(150)]
         result = fetch_emails(mock_imap, message_ids, batch_size=100)
 
-        # Assert
+        # Assert: one UID FETCH per batch, results in input order
         assert len(result) == 150
-        assert mock_imap.fetch.call_count == 150
+        assert [e.id for e in result] == message_ids
+        assert mock_imap.uid.call_count == 2
+        assert mock_imap.uid.call_args_list[0].args[1] == "0:99"
+        assert mock_imap.uid.call_args_list[1].args[1] == "100:149"
+
+
+class TestFetchEmailsTextMode:
+    STRUCTURE = (
+        b'(("text" "plain" ("charset" "utf-8") NIL NIL "base64" 12 1 NIL NIL NIL NIL)'
+        b'("application" "zip" NIL NIL NIL "base64" 500000000 NIL'
+        b' ("attachment" ("filename" "big.zip")) NIL NIL) "mixed")'
+    )
+    HEADERS = (
+        b"Subject: Test Subject\r\nFrom: sender@example.com\r\n"
+        b"Date: Thu, 1 Jan 2023 12:00:00 +0000\r\n\r\n"
+    )
+
+    def uid(self, command, message_set, items):
+        if "BODYSTRUCTURE" in items:
+            header = (
+                b"1 (UID 7 BODYSTRUCTURE "
+                + self.STRUCTURE
+                + b" BODY[HEADER.FIELDS (SUBJECT FROM DATE MESSAGE-ID)] {%d}"
+                % len(self.HEADERS)
+            )
+            return "OK", [(header, self.HEADERS), b")"]
+        return "OK", [(b"1 (UID 7 BODY[1]<0> {8}", b"VGVzdCBi"), b")"]
+
+    def test_fetches_headers_then_text_part(self):
+        mock_imap = Mock()
+        mock_imap.uid.side_effect = self.uid
+
+        result = fetch_emails(
+            mock_imap, ["7"], body_mode=BodyMode.TEXT, max_body_bytes=8
+        )
+
+        assert [call.args[2] for call in mock_imap.uid.call_args_list] == [
+            "(BODY.PEEK[HEADER.FIELDS (SUBJECT FROM DATE MESSAGE-ID)] BODYSTRUCTURE)",
+            "(BODY.PEEK[1]<0.8>)",
+        ]
+        assert result[0].id == "7"
+        assert result[0].subject == "Test Subject"
+        assert result[0].sender == "sender@example.com"
+        assert result[0].body == "Test b"
+
+    def test_headers_only(self):
+        mock_imap = Mock()
+        mock_imap.uid.side_effect = self.uid
+
+        result = fetch_emails(mock_imap, ["7"], body_mode=BodyMode.NONE)
+
+        assert mock_imap.uid.call_count == 1
+        assert result[0].subject == "Test Subject"
+        assert result[0].body == ""
+
+
+class TestFetchEmailsCache:
+    def test_fetches_only_uncached_messages(self, tmp_path):
+        raw = (
+            b"Subject: Cached\r\nFrom: sender@example.com\r\n"
+            b"Date: Thu, 1 Jan 2023 12:00:00 +0000\r\n\r\nBody\r\n"
+        )
+
+        def uid(command, message_set, items):
+            data = []
+            for number in message_set.split(","):
+                data.append((f"1 (UID {number} RFC822 {{{len(raw)}}}".encode(), raw))
+                data.append(b")")
+            return "OK", data
+
+        mock_imap = Mock()
+        mock_imap.uid.side_effect = uid
+        cache = CachedMailbox(
+            EmailCache(str(tmp_path / "emails.sqlite3")), "user@imap", "INBOX", 7
+        )
+
+        first = fetch_emails(mock_imap, ["1", "3"], cache=cache)
+        second = fetch_emails(mock_imap, ["3", "1", "5"], cache=cache)
+
+        assert [call.args[1] for call in mock_imap.uid.call_args_list] == ["1,3", "5"]
+        assert [e.id for e in second] == ["3", "1", "5"]
+        assert second[1] == first[0]
+        assert second[1].subject == "Cached"
+        assert isinstance(second[1].date, Datetime)
 
 
 class TestGetEmailBody:
@@ -161,6 +266,15 @@ class TestBuildImapQuery:
         assert 'SUBJECT "Test Subject"' in query
         assert 'TEXT "important"' in query
 
+    def test_build_query_escapes_quoted_strings(self):
+        criteria = EmailSearchCriteria(
+            subject='say "hi"', body="C:\\temp", text="two\r\nlines"
+        )
+        query = build_imap_query(criteria)
+        assert 'SUBJECT "say \\"hi\\""' in query
+        assert 'BODY "C:\\\\temp"' in query
+        assert 'TEXT "two lines"' in query
+
     # def test_build_query_with_date(self):
     #     date = Datetime.from_datetime(datetime(2023, 1, 1))
     #     date_condition = EmailDateCondition(criteria=EmailDateCriteria.SINCE, date=date)
@@ -178,21 +292,18 @@ class TestBuildImapQuery:
 class TestSearchEmails:
     @patch("imaplib.IMAP4_SSL")
     def test_search_emails(self, mock_imap_class):
+        configure_imap_pool()
+
         # Setup mock IMAP connection
         mock_imap = MagicMock()
+        mock_imap.untagged_responses = {}
+        mock_imap.select.return_value = ("OK", [b"3"])
         mock_imap_class.return_value = mock_imap
 
         # Mock search results
-        mock_imap.search.return_value = ("OK", [b"1 2 3"])
+        mock_imap.uid.return_value = ("OK", [b"1 2 3"])
 
-        # Mock fetch results
-        mock_email = EmailMessage()
-        mock_email["Subject"] = "Test Subject"
-        mock_email["From"] = "sender@example.com"
-        mock_email["Date"] = "Thu, 1 Jan 2023 12:00:00 +0000"
-        mock_email.set_content("Test body")
-
-        with patch("nodetool.lib.network.imap.fetch_emails") as mock_fetch:
+        with patch("nodetool.nodes.lib.network.imap.fetch_emails") as mock_fetch:
             mock_fetch.return_value = [
                 Email(
                     id="1",
@@ -203,7 +314,7 @@ class TestSearchEmails:
                 )
             ]
 
-            # Execute
+            # Execute twice
             connection = IMAPConnection(
                 host="imap.example.com",
                 port=993,
@@ -212,14 +323,72 @@ class TestSearchEmails:
                 use_ssl=True,
             )
             criteria = EmailSearchCriteria(subject="Test")
+            search_emails(connection, criteria)
             result = search_emails(connection, criteria)
 
-            # Assert
+            # Assert: the pooled session is reused, newest first
             assert len(result) == 1
             assert result[0].subject == "Test Subject"
+            assert mock_fetch.call_args.args[1] == ["3", "2", "1"]
+            mock_imap_class.assert_called_once()
             mock_imap.login.assert_called_once_with("user", "pass")
             mock_imap.select.assert_called_once_with("INBOX")
-            mock_imap.logout.assert_called_once()
+            mock_imap.logout.assert_not_called()
+
+    @patch("imaplib.IMAP4_SSL")
+    def test_search_emails_only_new(self, mock_imap_class, tmp_path):
+        configure_imap_pool()
+        configure_mailbox_state_store(str(tmp_path / "imap_state.sqlite3"))
+
+        mock_imap = MagicMock()
+        mock_imap.untagged_responses = {}
+        mock_imap.select.return_value = ("OK", [b"3"])
+        mock_imap_class.return_value = mock_imap
+        mock_imap.uid.side_effect = [("OK", [b"1 2 3"]), ("OK", [b"3 4"])]
+
+        connection = IMAPConnection(
+            host="imap.example.com", port=993, username="user", password="pass"
+        )
+        criteria = EmailSearchCriteria(subject="Test")
+        with patch(
+            "nodetool.nodes.lib.network.imap.fetch_emails", return_value=[]
+        ) as mock_fetch:
+            search_emails(connection, criteria, only_new=True)
+            search_emails(connection, criteria, only_new=True)
+
+        assert mock_imap.uid.call_args.args == (
+            "SEARCH",
+            None,
+            'UID 4:* SUBJECT "Test"',
+        )
+        assert mock_fetch.call_args.args[1] == ["4"]
+
+    @patch("imaplib.IMAP4_SSL")
+    def test_search_emails_only_new_over_max_results(self, mock_imap_class, tmp_path):
+        configure_imap_pool()
+        configure_mailbox_state_store(str(tmp_path / "imap_state.sqlite3"))
+
+        mock_imap = MagicMock()
+        mock_imap.untagged_responses = {}
+        mock_imap.select.return_value = ("OK", [b"5"])
+        mock_imap_class.return_value = mock_imap
+        mock_imap.uid.side_effect = [("OK", [b"1 2 3 4 5"]), ("OK", [b"4 5"])]
+
+        connection = IMAPConnection(
+            host="imap.example.com", port=993, username="user", password="pass"
+        )
+        criteria = EmailSearchCriteria(subject="Test")
+        with patch(
+            "nodetool.nodes.lib.network.imap.fetch_emails", return_value=[]
+        ) as mock_fetch:
+            search_emails(connection, criteria, max_results=3, only_new=True)
+            search_emails(connection, criteria, max_results=3, only_new=True)
+
+        # The oldest new emails come first; the second search returns the rest.
+        first, second = mock_fetch.call_args_list
+        assert first.args[1] == ["3", "2", "1"]
+        assert mock_imap.uid.call_args.args[2] == 'UID 4:* SUBJECT "Test"'
+        assert second.args[1] == ["5", "4"]
 
 
 class TestEmailFields:
@@ -286,18 +455,32 @@ class TestConfigureIMAP:
 
 
 class TestIMAPSearch:
-    @patch("nodetool.lib.network.imap.search_emails")
-    async def test_imap_search_process(self, mock_search_emails):
-        # Setup
-        mock_search_emails.return_value = [
-            Email(
-                id="1",
-                subject="Test Subject",
-                sender="sender@example.com",
-                date=Datetime.from_datetime(datetime(2023, 1, 1)),
-                body="Test body",
-            )
-        ]
+    @pytest.mark.asyncio
+    @patch("imaplib.IMAP4_SSL")
+    async def test_imap_search_process(self, mock_imap_class):
+        configure_imap_pool()
+        threads = []
+
+        def record(result):
+            def call(*args, **kwargs):
+                threads.append(threading.current_thread())
+                return result
+
+            return call
+
+        mock_imap = MagicMock()
+        mock_imap.untagged_responses = {}
+        mock_imap.login.side_effect = record(("OK", [b"Logged in"]))
+        mock_imap.select.side_effect = record(("OK", [b"1"]))
+        mock_imap.uid.side_effect = record(("OK", [b"1"]))
+        mock_imap_class.return_value = mock_imap
+        email = Email(
+            id="1",
+            subject="Test Subject",
+            sender="sender@example.com",
+            date=Datetime.from_datetime(datetime(2023, 1, 1)),
+            body="Test body",
+        )
 
         connection = IMAPConnection(
             host="imap.example.com",
@@ -313,10 +496,17 @@ class TestIMAPSearch:
         )
         context = ProcessingContext(user_id="test_user", auth_token="test_token")
 
-        # Execute
-        result = await node.process(context)
+        with patch(
+            "nodetool.nodes.lib.network.imap.fetch_emails",
+            side_effect=record([email]),
+        ) as mock_fetch:
+            result = await node.process(context)
 
-        # Assert
         assert len(result) == 1
         assert result[0].subject == "Test Subject"
-        mock_search_emails.assert_called_once_with(connection, criteria, 10)
+        assert mock_fetch.call_args.args[1] == ["1"]
+        # Login, SELECT, SEARCH and FETCH all run on the session's own thread.
+        assert len(threads) == 4
+        assert len(set(threads)) == 1
+        assert threads[0] is not threading.current_thread()
+        assert threads[0].name.startswith("imap")
@@ -0,0 +1,90 @@
+import pytest
+
+from nodetool.nodes.lib.network.imap_cache import (
+    CachedMailbox,
+    EmailCache,
+    configure_email_cache,
+    get_email_cache,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = EmailCache(str(tmp_path / "emails.sqlite3"))
+    yield cache
+    cache.close()
+
+
+def test_round_trip(cache):
+    cache.store(
+        "me@imap", "INBOX", 7, {1: {"subject": "a"}, 2: {"subject": "b"}}, "full"
+    )
+    assert cache.lookup("me@imap", "INBOX", 7, [1, 2, 3], "full") == {
+        1: {"subject": "a"},
+        2: {"subject": "b"},
+    }
+    assert cache.lookup("me@imap", "INBOX", 7, [], "full") == {}
+
+
+def test_keys_include_folder_variant_and_uidvalidity(cache):
+    cache.store("me@imap", "INBOX", 7, {1: "inbox"}, "full")
+    assert cache.lookup("me@imap", "Sent", 7, [1], "full") == {}
+    assert cache.lookup("me@imap", "INBOX", 7, [1], "none") == {}
+    assert cache.lookup("me@imap", "INBOX", 8, [1], "full") == {}
+    assert cache.lookup("you@imap", "INBOX", 7, [1], "full") == {}
+
+
+def test_new_uidvalidity_drops_old_records(cache):
+    cache.store("me@imap", "INBOX", 7, {1: "old"}, "full")
+    cache.store("me@imap", "Sent", 7, {1: "sent"}, "full")
+    cache.store("me@imap", "INBOX", 8, {1: "new"}, "full")
+    assert cache.lookup("me@imap", "INBOX", 7, [1], "full") == {}
+    assert cache.lookup("me@imap", "INBOX", 8, [1], "full") == {1: "new"}
+    assert cache.lookup("me@imap", "Sent", 7, [1], "full") == {1: "sent"}
+
+
+def test_persists_across_instances(tmp_path):
+    path = str(tmp_path / "emails.sqlite3")
+    cache = EmailCache(path)
+    cache.store("me@imap", "INBOX", 7, {1: "kept"}, "full")
+    cache.close()
+    assert EmailCache(path).lookup("me@imap", "INBOX", 7, [1], "full") == {1: "kept"}
+
+
+def test_evicts_least_recently_used(tmp_path):
+    # Each record encodes to 7 bytes of JSON.
+    cache = EmailCache(str(tmp_path / "emails.sqlite3"), max_bytes=20)
+    cache.store("me@imap", "INBOX", 7, {1: "aaaaa"}, "full")
+    cache.store("me@imap", "INBOX", 7, {2: "bbbbb"}, "full")
+    cache.lookup("me@imap", "INBOX", 7, [1], "full")
+    cache.store("me@imap", "INBOX", 7, {3: "ccccc"}, "full")
+    assert cache.lookup("me@imap", "INBOX", 7, [1, 2, 3], "full") == {
+        1: "aaaaa",
+        3: "ccccc",
+    }
+    cache.store("me@imap", "INBOX", 7, {4: "x" * 100}, "full")
+    assert cache.lookup("me@imap", "INBOX", 7, [4], "full") == {}
+
+
+def test_lookup_of_many_uids(cache):
+    cache.store("me@imap", "INBOX", 7, {uid: uid for uid in range(1200)}, "full")
+    found = cache.lookup("me@imap", "INBOX", 7, range(2000), "full")
+    assert len(found) == 1200
+
+
+def test_cached_mailbox_uses_string_uids(cache):
+    mailbox = CachedMailbox(cache, "me@imap", "INBOX", 7)
+    mailbox.store({"5": {"id": "5"}}, "full")
+    assert mailbox.lookup(["5", "6"], "full") == {"5": {"id": "5"}}
+
+
+def test_clear(cache):
+    cache.store("me@imap", "INBOX", 7, {1: "a"}, "full")
+    cache.clear()
+    assert cache.lookup("me@imap", "INBOX", 7, [1], "full") == {}
+
+
+def test_configure_email_cache(tmp_path):
+    cache = configure_email_cache(str(tmp_path / "emails.sqlite3"), max_bytes=10)
+    assert get_email_cache() is cache
+    assert cache.max_bytes == 10
@@ -0,0 +1,190 @@
+import threading
+
+import imaplib
+import pytest
+
+from nodetool.nodes.lib.network.imap_fetch import (
+    HEADER_ITEMS,
+    decode_part,
+    fetch_batches,
+    find_text_part,
+    message_set,
+    parse_fetch_items,
+    parse_fetch_response,
+)
+
+MIXED = (
+    b'(("text" "plain" ("charset" "iso-8859-1") NIL NIL "quoted-printable" 12 1'
+    b' NIL NIL NIL NIL)("text" "html" ("charset" "utf-8") NIL NIL "7bit" 30 1'
+    b' NIL NIL NIL NIL) "alternative" ("boundary" "b") NIL NIL NIL)'
+)
+
+
+class FakeIMAP:
+    """Answers UID FETCH for RFC822 with a tiny message per UID."""
+
+    def __init__(self, status="OK"):
+        self.status = status
+        self.calls = []
+        self.threads = set()
+
+    def uid(self, command, message_set, items):
+        self.calls.append((command, message_set, items))
+        self.threads.add(threading.get_ident())
+        data = []
+        for part in message_set.split(","):
+            start, _, end = part.partition(":")
+            for number in range(int(start), int(end or start) + 1):
+                literal = f"Subject: {number}\r\n\r\n".encode()
+                data.append(
+                    (
+                        f"{number} (UID {number} RFC822 {{{len(literal)}}}".encode(),
+                        literal,
+                    )
+                )
+                data.append(b")")
+        return self.status, data
+
+
+def test_message_set():
+    assert message_set(["3", "1", "2", "7", "9", "10"]) == "1:3,7,9:10"
+    assert message_set([5]) == "5"
+    assert message_set([]) == ""
+
+
+def test_parse_fetch_response_uid_in_header():
+    data = [
+        (b"1 (UID 11 RFC822 {3}", b"one"),
+        b")",
+        (b"2 (UID 12 RFC822 {3}", b"two"),
+        b")",
+    ]
+    assert parse_fetch_response(data) == {"11": b"one", "12": b"two"}
+
+
+def test_parse_fetch_response_uid_after_literal():
+    data = [
+        (b"1 (RFC822 {3}", b"one"),
+        b" UID 11 FLAGS (\\Seen))",
+        (b"2 (RFC822 {3}", b"two"),
+        b" UID 12)",
+    ]
+    assert parse_fetch_response(data) == {"11": b"one", "12": b"two"}
+
+
+def test_fetch_batches_one_command_per_batch():
+    imap = FakeIMAP()
+    uids = [str(n) for n in range(1, 251)]
+    batches = list(fetch_batches(imap, uids, batch_size=100))
+
+    assert [call[1] for call in imap.calls] == ["1:100", "101:200", "201:250"]
+    assert [len(batch) for batch in batches] == [100, 100, 50]
+    assert batches[2]["250"] == b"Subject: 250\r\n\r\n"
+    # Only the calling thread, the session's thread, drives the connection.
+    assert imap.threads == {threading.get_ident()}
+
+
+def test_fetch_batches_looks_ahead_one_batch():
+    imap = FakeIMAP()
+    batches = fetch_batches(imap, [str(n) for n in range(1, 16)], batch_size=5)
+    next(batches)
+    assert [call[1] for call in imap.calls] == ["1:5", "6:10"]
+    batches.close()
+
+
+def test_fetch_batches_overlaps_fetch_and_parse():
+    imap = FakeIMAP()
+    fetched = imap.uid
+    second_fetch = threading.Event()
+    parse_threads = set()
+
+    def uid(*args):
+        if imap.calls:
+            second_fetch.set()
+        return fetched(*args)
+
+    def parse(data):
+        parse_threads.add(threading.get_ident())
+        # Blocks forever unless the next batch is fetched meanwhile.
+        assert second_fetch.wait(timeout=5)
+        return parse_fetch_response(data)
+
+    imap.uid = uid
+    batches = list(fetch_batches(imap, ["1", "2", "3"], batch_size=2, parse=parse))
+
+    assert batches == [
+        {"1": b"Subject: 1\r\n\r\n", "2": b"Subject: 2\r\n\r\n"},
+        {"3": b"Subject: 3\r\n\r\n"},
+    ]
+    assert imap.threads == {threading.get_ident()}
+    assert threading.get_ident() not in parse_threads
+
+
+def test_fetch_batches_empty():
+    imap = FakeIMAP()
+    assert list(fetch_batches(imap, [])) == []
+    assert imap.calls == []
+
+
+def test_fetch_batches_raises_on_failure():
+    with pytest.raises(imaplib.IMAP4.error, match="UID FETCH failed"):
+        list(fetch_batches(FakeIMAP(status="NO"), ["1"]))
+
+
+def test_parse_fetch_items():
+    data = [
+        (
+            b"1 (UID 11 BODYSTRUCTURE "
+            + MIXED
+            + b" BODY[HEADER.FIELDS (SUBJECT)] {13}",
+            b"Subject: Hi\r\n",
+        ),
+        b")",
+        b'2 (UID 12 FLAGS (\\Seen) BODY[1]<0> "caf\\"e")',
+    ]
+    items = parse_fetch_items(data)
+    assert items["11"]["BODY[HEADER.FIELDS (SUBJECT)]"] == b"Subject: Hi\r\n"
+    assert items["11"]["BODYSTRUCTURE"][2] == "alternative"
+    assert items["12"]["FLAGS"] == ["\\Seen"]
+    assert items["12"]["BODY[1]"] == 'caf"e'
+
+
+def test_find_text_part_prefers_plain():
+    structure = parse_fetch_items([b"1 (UID 1 BODYSTRUCTURE " + MIXED + b")"])["1"]
+    part = find_text_part(structure["BODYSTRUCTURE"])
+    assert (part.section, part.subtype, part.charset) == ("1", "plain", "iso-8859-1")
+    assert part.encoding == "quoted-printable"
+
+
+def test_find_text_part_skips_attachments():
+    structure = (
+        b'(((("text" "plain" NIL NIL NIL "7bit" 5 1 NIL ("attachment" NIL) NIL NIL)'
+        b'("text" "html" NIL NIL NIL "base64" 40 1 NIL NIL NIL NIL) "alternative")'
+        b'("application" "pdf" ("name" "a.pdf") NIL NIL "base64" 99999 NIL'
+        b' ("attachment" ("filename" "a.pdf")) NIL NIL) "mixed"))'
+    )
+    items = parse_fetch_items([b"1 (UID 1 BODYSTRUCTURE " + structure[1:] + b")"])
+    part = find_text_part(items["1"]["BODYSTRUCTURE"])
+    assert (part.section, part.subtype, part.encoding) == ("1.2", "html", "base64")
+    assert find_text_part(None) is None
+
+
+def test_single_part_message_is_section_1():
+    items = parse_fetch_items(
+        [b'1 (UID 1 BODYSTRUCTURE ("TEXT" "PLAIN" NIL NIL NIL "7BIT" 5 1))']
+    )
+    assert find_text_part(items["1"]["BODYSTRUCTURE"]).section == "1"
+
+
+def test_decode_part():
+    assert decode_part(b"caf=E9 =\r\nau lait", "quoted-printable") == b"caf\xe9 au lait"
+    assert decode_part(b"aGVsbG8g\r\nd29ybGQ=", "base64") == b"hello world"
+    # A partial fetch can cut base64 anywhere.
+    assert decode_part(b"aGVsbG8gd29ybG", "base64") == b"hello wor"
+    assert decode_part(b"plain", "8bit") == b"plain"
+
+
+def test_header_items():
+    assert HEADER_ITEMS == (
+        "(BODY.PEEK[HEADER.FIELDS (SUBJECT FROM DATE MESSAGE-ID)] BODYSTRUCTURE)"
+    )
@@ -0,0 +1,221 @@
+import asyncio
+import imaplib
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from nodetool.nodes.lib.network.imap_pool import (
+    IMAPConnectionPool,
+    IMAPPoolConfig,
+    configure_imap_pool,
+    connection_key,
+    get_imap_pool,
+)
+
+
+class FakeIMAP:
+    def __init__(self, host, port, use_ssl, timeout):
+        self.host = host
+        self.threads = {threading.get_ident()}
+        self.untagged_responses = {}
+        self.logins = []
+        self.selected = []
+        self.noops = 0
+        self.alive = True
+        self.logged_out = False
+        self.shut_down = False
+
+    def login(self, username, password):
+        if password == "wrong":
+            raise imaplib.IMAP4.error("LOGIN failed")
+        self.logins.append(username)
+
+    def select(self, folder):
+        self.selected.append(folder)
+        self.untagged_responses["UIDVALIDITY"] = [b"42"]
+        return "OK", [b"3"]
+
+    def noop(self):
+        self.threads.add(threading.get_ident())
+        if not self.alive:
+            raise imaplib.IMAP4.abort("socket error: EOF")
+        self.noops += 1
+        return "OK", [b"NOOP completed"]
+
+    def logout(self):
+        self.logged_out = True
+
+    def shutdown(self):
+        self.shut_down = True
+
+
+def wait_closed(session):
+    session.executor.shutdown(wait=True)
+
+
+def account(**kwargs):
+    return SimpleNamespace(
+        **{
+            "host": "imap.example.com",
+            "port": 993,
+            "username": "user",
+            "password": "pass",
+            "use_ssl": True,
+            **kwargs,
+        }
+    )
+
+
+@pytest.fixture
+def pool():
+    return IMAPConnectionPool(IMAPPoolConfig(check_after=60.0), connect=FakeIMAP)
+
+
+def test_connection_key():
+    assert connection_key(account(host="IMAP.Example.com")) == (
+        "imap.example.com",
+        993,
+        "user",
+        True,
+    )
+
+
+def test_reuses_logged_in_session(pool):
+    with pool.session(account(), "INBOX") as first:
+        assert first.uidvalidity == 42
+    with pool.session(account(), "INBOX") as second:
+        pass
+    assert second is first
+    assert first.imap.logins == ["user"]
+    assert first.imap.selected == ["INBOX"]
+    assert first.imap.noops == 0
+
+
+def test_separate_sessions_per_account(pool):
+    with pool.session(account()) as first:
+        pass
+    with pool.session(account(username="other")) as second:
+        pass
+    assert second is not first
+
+
+def test_noop_before_reusing_idle_session(pool):
+    with pool.session(account()) as first:
+        pass
+    first.last_used -= 120
+    with pool.session(account()) as second:
+        pass
+    assert second is first
+    assert first.imap.noops == 1
+
+
+def test_dead_session_is_replaced(pool):
+    with pool.session(account()) as first:
+        pass
+    first.last_used -= 120
+    first.imap.alive = False
+    with pool.session(account()) as second:
+        pass
+    assert second is not first
+    assert first.imap.shut_down
+
+
+def test_expired_and_changed_password_sessions_are_logged_out(pool):
+    with pool.session(account()) as first:
+        pass
+    first.last_used -= 3600
+    with pool.session(account()) as second:
+        pass
+    wait_closed(first)
+    assert second is not first and first.imap.logged_out
+
+    with pool.session(account(password="new")) as third:
+        pass
+    wait_closed(second)
+    assert third is not second and second.imap.logged_out
+
+
+def test_connection_errors_drop_the_session(pool):
+    with pytest.raises(imaplib.IMAP4.abort):
+        with pool.session(account()) as first:
+            raise imaplib.IMAP4.abort("socket error: EOF")
+    assert first.imap.shut_down
+
+    with pytest.raises(imaplib.IMAP4.error):
+        with pool.session(account()) as second:
+            raise imaplib.IMAP4.error("SEARCH failed")
+    with pool.session(account()) as third:
+        pass
+    assert third is second
+
+
+def test_failed_login_is_not_pooled(pool):
+    with pytest.raises(imaplib.IMAP4.error, match="LOGIN failed"):
+        pool.acquire(account(password="wrong"))
+    assert pool._idle == {}
+
+
+def test_max_idle_per_account():
+    pool = IMAPConnectionPool(IMAPPoolConfig(max_idle_per_account=1), FakeIMAP)
+    first, second = pool.acquire(account()), pool.acquire(account())
+    pool.release(first)
+    pool.release(second)
+    wait_closed(second)
+    assert second.imap.logged_out
+    pool.close()
+    assert first.imap.logged_out
+
+
+def test_configure_imap_pool():
+    pool = configure_imap_pool(check_after=5.0)
+    assert get_imap_pool() is pool
+    assert pool.config.check_after == 5.0
+    assert configure_imap_pool().config.check_after == 5.0
+
+
+@pytest.mark.asyncio
+async def test_async_sessions_run_on_their_own_thread(pool):
+    async with pool.connect(account(), "INBOX") as first:
+        thread = await first.run(threading.get_ident)
+        assert thread != threading.get_ident()
+        assert first.imap.threads == {thread}
+        assert first.uidvalidity == 42
+    first.last_used -= 120
+    async with pool.connect(account(), "INBOX") as second:
+        assert await second.run(threading.get_ident) == thread
+    assert second is first
+    assert first.imap.noops == 1
+    assert first.imap.threads == {thread}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_searches_use_separate_connections():
+    started = threading.Barrier(2, timeout=5)
+    pool = IMAPConnectionPool(connect=FakeIMAP)
+
+    async def search():
+        async with pool.connect(account()) as session:
+            # Both searches must be in flight at once to pass the barrier.
+            await session.run(started.wait)
+            return session
+
+    first, second = await asyncio.gather(search(), search())
+    assert first is not second
+    assert len(pool._idle[connection_key(account())]) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_block_drops_session(pool):
+    with pytest.raises(asyncio.CancelledError):
+        async with pool.connect(account()) as session:
+            raise asyncio.CancelledError()
+    assert session.imap.shut_down
+    assert not pool._idle.get(connection_key(account()))
+
+
+@pytest.mark.asyncio
+async def test_async_failed_login(pool):
+    with pytest.raises(imaplib.IMAP4.error, match="LOGIN failed"):
+        async with pool.connect(account(password="wrong")):
+            pass
@@ -0,0 +1,157 @@
+import imaplib
+import io
+from types import SimpleNamespace
+
+import pytest
+
+from nodetool.nodes.lib.network.imap_sync import (
+    MailboxState,
+    MailboxStateStore,
+    configure_mailbox_state_store,
+    get_mailbox_state_store,
+    idle,
+    mailbox_key,
+    new_uids,
+    search_uids,
+)
+
+
+class SearchIMAP:
+    def __init__(self, uids):
+        self.uids = uids
+        self.queries = []
+
+    def uid(self, command, charset, query):
+        self.queries.append(query)
+        if query.startswith("UID "):
+            low = int(query.split()[1].split(":")[0])
+            # Like a real server, "n:*" includes the highest UID.
+            found = [u for u in self.uids if u >= low] or self.uids[-1:]
+        else:
+            found = self.uids
+        return "OK", [" ".join(map(str, found)).encode()]
+
+
+def test_store_round_trip(tmp_path):
+    store = MailboxStateStore(str(tmp_path / "state.sqlite3"))
+    assert store.load("k") is None
+    store.save(MailboxState("k", 7, 100))
+    store.close()
+    store = MailboxStateStore(str(tmp_path / "state.sqlite3"))
+    assert store.load("k") == MailboxState("k", 7, 100)
+    store.forget("k")
+    assert store.load("k") is None
+
+
+def test_configure_mailbox_state_store(tmp_path):
+    store = configure_mailbox_state_store(str(tmp_path / "state.sqlite3"))
+    assert get_mailbox_state_store() is store
+
+
+def test_mailbox_key():
+    connection = SimpleNamespace(username="me", host="IMAP.example.com", port=993)
+    assert (
+        mailbox_key(connection, "INBOX", "ALL") == "me@imap.example.com:993/INBOX?ALL"
+    )
+
+
+def test_search_uids():
+    assert search_uids(SearchIMAP([3, 1, 2]), "ALL") == [1, 2, 3]
+    assert search_uids(SearchIMAP([]), "ALL") == []
+
+
+def test_new_uids_searches_only_above_last_uid():
+    imap = SearchIMAP([1, 2, 5, 9])
+    assert new_uids(imap, MailboxState("k", 7, 5), 7, 'FROM "a"') == [9]
+    assert imap.queries == ['UID 6:* FROM "a"']
+    assert new_uids(imap, MailboxState("k", 7, 9), 7, "ALL") == []
+
+
+def test_new_uids_without_state_or_after_uidvalidity_change():
+    imap = SearchIMAP([1, 2])
+    assert new_uids(imap, None, 7, "ALL") == [1, 2]
+    assert new_uids(imap, MailboxState("k", 6, 2), 7, "ALL") == [1, 2]
+    assert imap.queries == ["ALL", "ALL"]
+
+
+class FakeSocket:
+    def __init__(self, idle_lines, done_lines):
+        self.idle_lines = idle_lines
+        self.done_lines = done_lines
+        self.timeout = None
+        self.timeouts = []
+
+    def gettimeout(self):
+        return self.timeout
+
+    def settimeout(self, timeout):
+        self.timeout = timeout
+        self.timeouts.append(timeout)
+
+    def makefile(self, mode):
+        return io.BytesIO(b"".join(self.done_lines))
+
+
+class IdleIMAP:
+    def __init__(self, idle_lines, done_lines=(b"IDLE OK done\r\n",)):
+        self.capabilities = ("IMAP4REV1", "IDLE")
+        self.sock = FakeSocket(idle_lines, list(done_lines))
+        self.sent = []
+        self.lines = [b"+ idling\r\n", *idle_lines]
+
+    def send(self, data):
+        self.sent.append(data)
+        if data == b"DONE\r\n":
+            self.lines = list(self.sock.done_lines)
+
+    def readline(self):
+        line = self.lines.pop(0)
+        if isinstance(line, Exception):
+            raise line
+        return line
+
+    @property
+    def file(self):
+        return self
+
+    @file.setter
+    def file(self, value):
+        self.lines = value.read().splitlines(True)
+
+    def close(self):
+        pass
+
+
+def test_idle_returns_on_new_mail():
+    imap = IdleIMAP([b"* 4 EXISTS\r\n", b"* 1 RECENT\r\n"])
+    assert idle(imap, 30) == [b"* 4 EXISTS"]
+    assert imap.sent == [b"IDLE IDLE\r\n", b"DONE\r\n"]
+    assert imap.sock.timeouts == [30, None]
+
+
+def test_idle_collects_changes_sent_before_done_completes():
+    imap = IdleIMAP(
+        [b"* 2 EXPUNGE\r\n"],
+        [b"* 5 EXISTS\r\n", b"IDLE OK IDLE terminated\r\n"],
+    )
+    assert idle(imap, 30) == [b"* 2 EXPUNGE", b"* 5 EXISTS"]
+
+
+def test_idle_timeout_renews_reader():
+    imap = IdleIMAP([TimeoutError()])
+    assert idle(imap, 0.1) == []
+    assert imap.sent[-1] == b"DONE\r\n"
+
+
+def test_idle_requires_capability():
+    imap = IdleIMAP([])
+    imap.capabilities = ("IMAP4REV1",)
+    with pytest.raises(imaplib.IMAP4.error, match="does not support IDLE"):
+        idle(imap)
+
+
+def test_idle_rejected():
+    imap = IdleIMAP([])
+    imap.lines = [b"IDLE BAD unknown command\r\n"]
+    with pytest.raises(imaplib.IMAP4.error, match="IDLE failed"):
+        idle(imap)
@@ -0,0 +1,138 @@
+import time
+
+import pytest
+from unittest.mock import patch
+
+from nodetool.nodes.lib.network import rate_limit
+from nodetool.nodes.lib.network.rate_limit import (
+    TokenBucket,
+    get_rate_limiter,
+    send_limited,
+)
+from nodetool.nodes.lib.network.retry import RetryableStatus
+
+
+@pytest.fixture(autouse=True)
+def clear_buckets():
+    rate_limit._buckets.clear()
+    yield
+    rate_limit._buckets.clear()
+
+
+class TestTokenBucket:
+    def test_steady_rate(self):
+        bucket = TokenBucket(rate=10)
+        delays = [bucket.reserve(now=100.0) for _ in range(4)]
+        assert delays == pytest.approx([0.0, 0.1, 0.2, 0.3])
+
+    def test_burst(self):
+        bucket = TokenBucket(rate=10, burst=3)
+        delays = [bucket.reserve(now=100.0) for _ in range(5)]
+        assert delays == pytest.approx([0.0, 0.0, 0.0, 0.1, 0.2])
+
+    def test_refills_while_idle(self):
+        bucket = TokenBucket(rate=10, burst=2)
+        for _ in range(4):
+            bucket.reserve(now=100.0)
+        assert bucket.reserve(now=101.0) == 0.0
+        assert bucket.reserve(now=101.0) == 0.0
+        assert bucket.reserve(now=101.0) == pytest.approx(0.1)
+
+    def test_429_halves_rate_and_honors_retry_after(self):
+        bucket = TokenBucket(rate=10)
+        bucket.observe(429, {"Retry-After": "2"}, now=100.0)
+        assert bucket.current_rate == 5
+        assert bucket.reserve(now=100.0) == pytest.approx(2.0)
+        assert bucket.reserve(now=100.0) == pytest.approx(2.2)
+
+    def test_recovers_after_success(self):
+        bucket = TokenBucket(rate=10)
+        bucket.observe(429, {}, now=100.0)
+        for _ in range(10):
+            bucket.observe(200, {}, now=100.0)
+        assert bucket.current_rate == 10
+
+    def test_remaining_quota_spread_over_window(self):
+        bucket = TokenBucket(rate=100)
+        bucket.observe(
+            200, {"X-RateLimit-Remaining": "20", "X-RateLimit-Reset": "10"}, now=100.0
+        )
+        assert bucket.current_rate == 2
+
+    def test_exhausted_quota_pauses_until_reset(self):
+        bucket = TokenBucket(rate=100)
+        reset = str(int(time.time()) + 30)
+        bucket.observe(
+            200, {"RateLimit-Remaining": "0", "RateLimit-Reset": reset}, now=100.0
+        )
+        assert 28 < bucket.reserve(now=100.0) <= 30
+
+    def test_observe_error(self):
+        bucket = TokenBucket(rate=10)
+        bucket.observe_error(RetryableStatus(429, {"Retry-After": "1"}))
+        assert bucket.current_rate == 5
+        bucket.observe_error(ValueError("boom"))
+        assert bucket.current_rate == 5
+        bucket.observe_error(ConnectionResetError("reset"))
+        assert bucket.current_rate == 2.5
+
+    @pytest.mark.asyncio
+    async def test_acquire_sleeps(self):
+        sleeps = []
+
+        async def sleep(delay):
+            sleeps.append(delay)
+
+        bucket = TokenBucket(rate=2)
+        with patch("nodetool.nodes.lib.network.rate_limit.asyncio.sleep", sleep):
+            await bucket.acquire()
+            await bucket.acquire()
+        assert len(sleeps) == 1
+        assert sleeps[0] == pytest.approx(0.5, abs=0.05)
+
+
+class TestSendLimited:
+    @pytest.mark.asyncio
+    async def test_observes_response(self):
+        bucket = TokenBucket(rate=10)
+
+        async def send():
+            return 429, {}
+
+        assert await send_limited(bucket, send, lambda res: res) == (429, {})
+        assert bucket.current_rate == 5
+
+    @pytest.mark.asyncio
+    async def test_observes_error(self):
+        bucket = TokenBucket(rate=10)
+
+        async def send():
+            raise ConnectionResetError("reset")
+
+        with pytest.raises(ConnectionResetError):
+            await send_limited(bucket, send, lambda res: res)
+        assert bucket.current_rate == 5
+
+    @pytest.mark.asyncio
+    async def test_without_limiter(self):
+        async def send():
+            return "ok"
+
+        assert await send_limited(None, send, lambda res: res) == "ok"
+
+
+class TestGetRateLimiter:
+    def test_disabled(self):
+        assert get_rate_limiter("https://example.com/a", 0) is None
+
+    def test_shared_per_host(self):
+        a = get_rate_limiter("https://example.com/a", 5)
+        b = get_rate_limiter("https://EXAMPLE.com/b", 5)
+        c = get_rate_limiter("https://other.com/", 5)
+        assert a is b
+        assert a is not c
+
+    def test_reconfigure(self):
+        bucket = get_rate_limiter("https://example.com/", 10)
+        assert get_rate_limiter("https://example.com/", 4, burst=2) is bucket
+        assert (bucket.rate, bucket.burst, bucket.current_rate) == (4, 2, 4)
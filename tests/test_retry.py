@@ -0,0 +1,121 @@
+import pytest
+import aiohttp
+from unittest.mock import MagicMock, patch
+
+from nodetool.nodes.lib.network.retry import (
+    RetryableStatus,
+    RetryPolicy,
+    RetryStats,
+    parse_retry_after,
+    with_retry,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_sleep():
+    async def sleep(delay):
+        sleeps.append(delay)
+
+    sleeps: list[float] = []
+    with patch("nodetool.nodes.lib.network.retry.asyncio.sleep", sleep):
+        yield sleeps
+
+
+def flaky(*outcomes):
+    calls = iter(outcomes)
+
+    async def func():
+        outcome = next(calls)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    return func
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert parse_retry_after("120") == 120
+
+    def test_http_date(self):
+        assert parse_retry_after("Thu, 01 Jan 1970 00:01:00 GMT", now=0) == 60
+
+    def test_invalid(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestRetryPolicy:
+    def test_full_jitter_bounds(self):
+        policy = RetryPolicy(backoff_base=1, backoff_max=5)
+        for retry in range(6):
+            assert 0 <= policy.backoff(retry) <= min(5, 2**retry)
+
+    def test_retry_delay_for_status(self):
+        policy = RetryPolicy()
+        assert policy.retry_delay(RetryableStatus(503), 0) is not None
+        assert policy.retry_delay(RetryableStatus(404), 0) is None
+
+    def test_retry_delay_honors_retry_after(self):
+        policy = RetryPolicy(retry_after_max=60)
+        assert policy.retry_delay(RetryableStatus(429, {"Retry-After": "7"}), 0) == 7
+        assert (
+            policy.retry_delay(RetryableStatus(429, {"Retry-After": "600"}), 0) is None
+        )
+
+    def test_retry_delay_for_exceptions(self):
+        policy = RetryPolicy()
+        assert policy.retry_delay(aiohttp.ServerDisconnectedError(), 0) is not None
+        assert policy.retry_delay(ValueError("bad"), 0) is None
+
+    def test_http_status_error_response(self):
+        error = Exception("503")
+        error.response = MagicMock(status_code=503, headers={"Retry-After": "2"})
+        assert RetryPolicy().retry_delay(error, 0) == 2
+
+    def test_for_method(self):
+        policy = RetryPolicy().for_method("POST")
+        assert policy.retry_delay(RetryableStatus(429), 0) is not None
+        assert policy.retry_delay(RetryableStatus(502), 0) is None
+        assert policy.retry_delay(aiohttp.ServerDisconnectedError(), 0) is None
+        assert RetryPolicy().for_method("GET") == RetryPolicy()
+
+
+class TestWithRetry:
+    @pytest.mark.asyncio
+    async def test_retries_until_success(self, no_sleep):
+        stats = RetryStats()
+        func = flaky(ConnectionResetError(), RetryableStatus(502), "ok")
+        assert await with_retry(RetryPolicy(), func, stats) == "ok"
+        assert stats.retries == 2
+        assert len(no_sleep) == 2
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self):
+        stats = RetryStats()
+        func = flaky(*[RetryableStatus(503)] * 3)
+        with pytest.raises(RetryableStatus):
+            await with_retry(RetryPolicy(max_attempts=3), func, stats)
+        assert stats.retries == 2
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_raises_immediately(self):
+        stats = RetryStats()
+        with pytest.raises(ValueError):
+            await with_retry(RetryPolicy(), flaky(ValueError("bad"), "ok"), stats)
+        assert stats.retries == 0
+
+    @pytest.mark.asyncio
+    async def test_status_of(self, no_sleep):
+        func = flaky((429, {"Retry-After": "3"}), (200, {}))
+        result = await with_retry(RetryPolicy(), func, status_of=lambda res: res)
+        assert result == (200, {})
+        assert no_sleep == [3]
+
+    @pytest.mark.asyncio
+    async def test_status_of_returns_last_result(self):
+        func = flaky((503, {}), (503, {}))
+        result = await with_retry(
+            RetryPolicy(max_attempts=2), func, status_of=lambda res: res
+        )
+        assert result == (503, {})
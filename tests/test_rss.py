@@ -1,10 +1,15 @@
+import asyncio
 import pytest
+from contextlib import asynccontextmanager
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 from datetime import datetime
-from unittest.mock import patch, MagicMock
 from nodetool.workflows.processing_context import ProcessingContext
 from nodetool.metadata.types import Datetime, RSSEntry
+from nodetool.nodes.lib.network.sessions import close_sessions
 from nodetool.nodes.lib.network.rss import (
     FetchRSSFeed,
+    FetchRSSFeeds,
     RSSEntryFields,
     ExtractFeedMetadata,
 )
@@ -15,82 +20,73 @@ def processing_context():
     return ProcessingContext(user_id="test_user", auth_token="test_token")
 
 
-@pytest.fixture
-def mock_feedparser():
-    with patch("nodetool.lib.network.rss.feedparser") as mock_feed:
-        # Create a mock feed response
-        mock_feed.parse.return_value = MagicMock(
-            feed=MagicMock(
-                title="Test Feed",
-                description="Test Description",
-                link="https://example.com",
-                language="en-us",
-                updated="Mon, 01 Jan 2023 12:00:00 GMT",
-                generator="Test Generator",
-            ),
-            entries=[
-                MagicMock(
-                    title="Test Entry 1",
-                    link="https://example.com/entry1",
-                    published_parsed=(2023, 1, 1, 12, 0, 0, 0, 0, 0),
-                    summary="Test Summary 1",
-                    author="Test Author 1",
-                ),
-                MagicMock(
-                    title="Test Entry 2",
-                    link="https://example.com/entry2",
-                    published_parsed=(2023, 1, 2, 12, 0, 0, 0, 0, 0),
-                    summary="Test Summary 2",
-                    author="Test Author 2",
-                ),
-            ],
-        )
-        yield mock_feed
+FEED = (
+    b'<?xml version="1.0"?><rss version="2.0"><channel>'
+    b"<title>Test Feed</title><description>Test Description</description>"
+    b"<link>https://example.com</link><language>en-us</language>"
+    b"<lastBuildDate>Mon, 01 Jan 2023 12:00:00 GMT</lastBuildDate>"
+    b"<generator>Test Generator</generator>"
+    b"<item><title>Test Entry 1</title><link>https://example.com/entry1</link>"
+    b"<pubDate>Sun, 01 Jan 2023 12:00:00 GMT</pubDate>"
+    b"<description>Test Summary 1</description><author>Test Author 1</author></item>"
+    b"<item><title>Test Entry 2</title><link>https://example.com/entry2</link>"
+    b"<pubDate>Mon, 02 Jan 2023 12:00:00 GMT</pubDate>"
+    b"<description>Test Summary 2</description><author>Test Author 2</author></item>"
+    b"</channel></rss>"
+)
 
 
-class TestFetchRSSFeed:
-    async def test_process(self, processing_context, mock_feedparser):
-        # Arrange
-        node = FetchRSSFeed(url="https://example.com/rss")
+@asynccontextmanager
+async def feed_server(body: bytes = FEED, status: int = 200):
+    async def handler(request):
+        return web.Response(body=body, status=status)
 
-        # Act
-        result = await node.process(processing_context)
+    app = web.Application()
+    app.router.add_get("/rss", handler)
+    async with TestServer(app) as server:
+        yield str(server.make_url("/rss"))
+    await close_sessions()
+
+
+class TestFetchRSSFeed:
+    @pytest.mark.asyncio
+    async def test_process(self, processing_context):
+        async with feed_server() as url:
+            node = FetchRSSFeed(url=url)
+            result = await node.process(processing_context)
 
-        # Assert
         assert len(result) == 2
         assert isinstance(result[0], RSSEntry)
         assert result[0].title == "Test Entry 1"
         assert result[0].link == "https://example.com/entry1"
-        assert result[0].published.to_datetime() == datetime(2023, 1, 1, 12, 0, 0)
+        published = result[0].published.to_datetime().replace(tzinfo=None)
+        assert published == datetime(2023, 1, 1, 12, 0, 0)
         assert result[0].summary == "Test Summary 1"
         assert result[0].author == "Test Author 1"
 
-        mock_feedparser.parse.assert_called_once_with("https://example.com/rss")
-
+    @pytest.mark.asyncio
     async def test_process_with_missing_fields(self, processing_context):
-        # Arrange
-        with patch("nodetool.lib.network.rss.feedparser") as mock_feed:
-            mock_feed.parse.return_value = MagicMock(
-                feed=MagicMock(),
-                entries=[
-                    MagicMock(
-                        # Missing title, link, etc.
-                        published_parsed=None  # Test fallback datetime
-                    )
-                ],
-            )
-            node = FetchRSSFeed(url="https://example.com/rss")
+        feed = (
+            b'<?xml version="1.0"?><rss version="2.0"><channel><item/></channel></rss>'
+        )
+        async with feed_server(feed) as url:
+            node = FetchRSSFeed(url=url)
+            result = await node.process(processing_context)
 
-            # Act
+        assert len(result) == 1
+        assert result[0].title == ""
+        assert result[0].link == ""
+        assert isinstance(result[0].published.to_datetime(), datetime)
+        assert result[0].summary == ""
+        assert result[0].author == ""
+
+    @pytest.mark.asyncio
+    async def test_process_http_error(self, processing_context):
+        async with feed_server(b"Not Found", status=404) as url:
+            node = FetchRSSFeed(url=url)
             result = await node.process(processing_context)
 
-            # Assert
-            assert len(result) == 1
-            assert result[0].title == ""
-            assert result[0].link == ""
-            assert isinstance(result[0].published.to_datetime(), datetime)
-            assert result[0].summary == ""
-            assert result[0].author == ""
+        assert result == []
 
 
 class TestRSSEntryFields:
@@ -129,14 +125,12 @@ class TestRSSEntryFields:
 
 
 class TestExtractFeedMetadata:
-    async def test_process(self, processing_context, mock_feedparser):
-        # Arrange
-        node = ExtractFeedMetadata(url="https://example.com/rss")
-
-        # Act
-        result = await node.process(processing_context)
+    @pytest.mark.asyncio
+    async def test_process(self, processing_context):
+        async with feed_server() as url:
+            node = ExtractFeedMetadata(url=url)
+            result = await node.process(processing_context)
 
-        # Assert
         assert result["title"] == "Test Feed"
         assert result["description"] == "Test Description"
         assert result["link"] == "https://example.com"
@@ -145,24 +139,59 @@ class TestExtractFeedMetadata:
         assert result["generator"] == "Test Generator"
         assert result["entry_count"] == 2
 
-        mock_feedparser.parse.assert_called_once_with("https://example.com/rss")
-
+    @pytest.mark.asyncio
     async def test_process_with_missing_fields(self, processing_context):
-        # Arrange
-        with patch("nodetool.lib.network.rss.feedparser") as mock_feed:
-            mock_feed.parse.return_value = MagicMock(
-                feed=MagicMock(), entries=[]  # Empty feed with no attributes
-            )
-            node = ExtractFeedMetadata(url="https://example.com/rss")
-
-            # Act
+        feed = b'<?xml version="1.0"?><rss version="2.0"><channel></channel></rss>'
+        async with feed_server(feed) as url:
+            node = ExtractFeedMetadata(url=url)
             result = await node.process(processing_context)
 
-            # Assert
-            assert result["title"] == ""
-            assert result["description"] == ""
-            assert result["link"] == ""
-            assert result["language"] == ""
-            assert result["updated"] == ""
-            assert result["generator"] == ""
-            assert result["entry_count"] == 0
+        assert result["title"] == ""
+        assert result["description"] == ""
+        assert result["link"] == ""
+        assert result["language"] == ""
+        assert result["updated"] == ""
+        assert result["generator"] == ""
+        assert result["entry_count"] == 0
+
+
+class TestFetchRSSFeeds:
+    @pytest.mark.asyncio
+    async def test_gen_process(self, processing_context):
+        feed = (
+            b'<?xml version="1.0"?><rss version="2.0"><channel><title>Good</title>'
+            b"<item><title>Entry</title><link>https://example.com/1</link></item>"
+            b"</channel></rss>"
+        )
+
+        async def good(request):
+            return web.Response(body=feed)
+
+        async def broken(request):
+            return web.Response(status=500)
+
+        async def slow(request):
+            await asyncio.sleep(5)
+            return web.Response(body=feed)
+
+        app = web.Application()
+        app.router.add_get("/good", good)
+        app.router.add_get("/broken", broken)
+        app.router.add_get("/slow", slow)
+        async with TestServer(app) as server:
+            node = FetchRSSFeeds(
+                urls=[
+                    str(server.make_url(path)) for path in ["/slow", "/broken", "/good"]
+                ],
+                timeout=0.5,
+            )
+            outputs = [item async for item in node.gen_process(processing_context)]
+        await close_sessions()
+
+        results = {result["index"]: result for _, result in outputs}
+        assert [slot for slot, _ in outputs] == ["result"] * 3
+        assert outputs[-1][1]["index"] == 0
+        assert results[2]["success"] and results[2]["title"] == "Good"
+        assert [e.title for e in results[2]["entries"]] == ["Entry"]
+        assert not results[1]["success"] and "500" in results[1]["error_message"]
+        assert results[0]["error_message"] == "Timed out after 0.5 seconds"
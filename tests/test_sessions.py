@@ -0,0 +1,57 @@
+import pytest
+from multidict import CIMultiDict
+
+from nodetool.nodes.lib.network import sessions
+from nodetool.nodes.lib.network.sessions import (
+    PooledResponse,
+    close_sessions,
+    configure_session_pool,
+    get_session,
+)
+
+
+@pytest.fixture
+def pool_config():
+    original = sessions._config
+    yield
+    sessions._config = original
+
+
+class TestGetSession:
+    @pytest.mark.asyncio
+    async def test_session_is_shared(self):
+        first = await get_session()
+        second = await get_session()
+        assert first is second
+        await close_sessions()
+        assert first.closed
+
+    @pytest.mark.asyncio
+    async def test_new_session_after_close(self):
+        first = await get_session()
+        await close_sessions()
+        second = await get_session()
+        assert second is not first
+        assert not second.closed
+        await close_sessions()
+
+    @pytest.mark.asyncio
+    async def test_configure_session_pool(self, pool_config):
+        configure_session_pool(limit=7, limit_per_host=3, ttl_dns_cache=60)
+        session = await get_session()
+        assert session.connector.limit == 7
+        assert session.connector.limit_per_host == 3
+        await close_sessions()
+
+
+class TestPooledResponse:
+    def test_json(self):
+        response = PooledResponse(status=200, content=b'{"a": 1}')
+        assert response.json() == {"a": 1}
+        assert response.status_code == 200
+
+    def test_headers_case_insensitive(self):
+        response = PooledResponse(
+            status=200, headers=CIMultiDict({"Content-Type": "text/html"})
+        )
+        assert response.headers.get("content-type") == "text/html"
@@ -0,0 +1,70 @@
+from nodetool.nodes.lib.network.sqlite_store import SQLiteStore, StoreSlot
+
+
+class ItemStore(SQLiteStore):
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS items (
+            key TEXT PRIMARY KEY,
+            size INTEGER NOT NULL,
+            last_access REAL NOT NULL
+        );
+        """
+
+    def put(self, key: str, size: int, last_access: float, max_bytes: int) -> None:
+        with self._lock:
+            db = self._connect()
+            db.execute(
+                "INSERT OR REPLACE INTO items VALUES (?, ?, ?)",
+                (key, size, last_access),
+            )
+            self._evict(db, "items", max_bytes)
+            db.commit()
+
+    def keys(self) -> list[str]:
+        with self._lock:
+            rows = self._connect().execute("SELECT key FROM items ORDER BY key")
+            return [row[0] for row in rows]
+
+
+def test_creates_schema_on_first_use(tmp_path):
+    path = tmp_path / "nested" / "store.sqlite3"
+    store = ItemStore(str(path))
+    assert not path.exists()
+    assert store.keys() == []
+    assert path.exists()
+    store.close()
+    store.close()
+
+
+def test_evicts_least_recently_used(tmp_path):
+    store = ItemStore(str(tmp_path / "store.sqlite3"))
+    store.put("a", 40, 1.0, 100)
+    store.put("b", 40, 3.0, 100)
+    store.put("c", 40, 2.0, 100)
+    assert store.keys() == ["b", "c"]
+    store.put("d", 100, 4.0, 100)
+    assert store.keys() == ["d"]
+    store.close()
+
+
+def test_evicts_oldest_insert_on_ties(tmp_path):
+    store = ItemStore(str(tmp_path / "store.sqlite3"))
+    for key in "abc":
+        store.put(key, 40, 1.0, 100)
+    assert store.keys() == ["b", "c"]
+    store.close()
+
+
+def test_store_slot(tmp_path):
+    default = str(tmp_path / "default.sqlite3")
+    slot = StoreSlot(lambda path=default: ItemStore(path))
+    assert slot.get().path == default
+    first = slot.configure(str(tmp_path / "first.sqlite3"))
+    assert slot.get() is first
+    first.keys()
+    second = slot.configure(str(tmp_path / "second.sqlite3"))
+    assert slot.get() is second
+    assert first._db is None
+    slot.reset()
+    assert second._db is None
+    assert slot.get().path == default